@@ -4,36 +4,183 @@ Spoticron - Spotify Analytics CLI
 Command-line interface for Spotify listening statistics and analysis.
 """
 
-import json
+import atexit
+import csv
+import importlib
+import importlib.util
 import sys
-from datetime import datetime
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from functools import lru_cache, partial, wraps
 from pathlib import Path
+from shutil import move
+from types import MappingProxyType, ModuleType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
 import click
 from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
 
-# Import our modules
-try:
+if TYPE_CHECKING:
+    from rich.progress import Progress, TaskID
+    from rich.table import Table
+
     from src.auth import SpotifyAuthenticator
-    from src.data_storage import SpotifyDataManager
-    from src.historical_stats import HistoricalStatsAnalyzer, format_evolution_summary
-    from src.live_stats import LiveStatsCollector, print_current_track
-except ImportError:
-    # Fallback for direct execution
-    from auth import SpotifyAuthenticator
-    from data_storage import SpotifyDataManager
-    from historical_stats import HistoricalStatsAnalyzer, format_evolution_summary
-    from live_stats import LiveStatsCollector, print_current_track
+    from src.live_stats import LiveStatsCollector
 
 console = Console()
 
+# Table output falls back to plain TSV when stdout is piped or redirected
+_IS_TTY = sys.stdout.isatty()
+
+# Root directory for exports, analysis results and caches
+DATA_DIR = Path("data")
+
+TIME_RANGES = ("short_term", "medium_term", "long_term")
+
+# Read-only so no command can accidentally mutate the shared labels
+_TIME_LABELS: Mapping[str, str] = MappingProxyType(
+    {
+        "short_term": "Last 4 Weeks",
+        "medium_term": "Last 6 Months",
+        "long_term": "All Time",
+    }
+)
+
+_TIME_LABELS_SHORT: Mapping[str, str] = MappingProxyType(
+    {
+        "short_term": "Last Month",
+        "medium_term": "Last 6 Months",
+        "long_term": "All Time",
+    }
+)
+
+# Table column headers paired with their Table.add_column options
+ColumnSpec = Tuple[str, Dict[str, Any]]
+
+_RECENT_COLUMNS: Tuple[ColumnSpec, ...] = (
+    ("#", {"style": "cyan", "width": 3}),
+    ("Track", {"style": "magenta"}),
+    ("Artist(s)", {"style": "green"}),
+)
+_RECENT_DETAILED_COLUMNS: Tuple[ColumnSpec, ...] = _RECENT_COLUMNS + (
+    ("Album", {"style": "blue"}),
+    ("Played At", {"style": "yellow"}),
+)
+_TOP_TRACKS_COLUMNS: Tuple[ColumnSpec, ...] = (
+    ("Rank", {"style": "cyan", "width": 4}),
+    ("Track", {"style": "magenta"}),
+    ("Artist(s)", {"style": "green"}),
+    ("Popularity", {"style": "yellow", "width": 10}),
+)
+_TOP_ARTISTS_COLUMNS: Tuple[ColumnSpec, ...] = (
+    ("Rank", {"style": "cyan", "width": 4}),
+    ("Artist", {"style": "magenta"}),
+    ("Genres", {"style": "green"}),
+    ("Popularity", {"style": "yellow", "width": 10}),
+    ("Followers", {"style": "blue", "width": 12}),
+)
+_PLAYLISTS_COLUMNS: Tuple[ColumnSpec, ...] = (
+    ("#", {"style": "cyan", "width": 4}),
+    ("Name", {"style": "magenta"}),
+    ("Tracks", {"style": "green", "width": 8}),
+    ("Owner", {"style": "blue"}),
+    ("Type", {"style": "yellow", "width": 12}),
+)
+_PLAYLIST_TRACKS_COLUMNS: Tuple[ColumnSpec, ...] = (
+    ("#", {"style": "cyan", "width": 4}),
+    ("Track", {"style": "magenta"}),
+    ("Artist(s)", {"style": "green"}),
+)
+_PLAYLIST_TRACKS_DETAILED_COLUMNS: Tuple[ColumnSpec, ...] = _PLAYLIST_TRACKS_COLUMNS + (
+    ("Album", {"style": "blue"}),
+    ("Duration", {"style": "yellow", "width": 8}),
+    ("Popularity", {"style": "red", "width": 10}),
+)
+
+_ACCOUNT_INFO_TEMPLATE = (
+    "✅ [bold green]Authentication Successful![/bold green]\n\n"
+    "👤 User: {display_name}\n"
+    "🆔 ID: {id}\n"
+    "🌍 Country: {country}\n"
+    "👥 Followers: {followers:,}"
+)
+
+
+def _make_table(title: str, columns: Sequence[ColumnSpec]) -> "Table":
+    """Create a Rich table with the given columns.
+
+    Args:
+        title: Table title.
+        columns: Column headers paired with their ``Table.add_column`` options.
+
+    Returns:
+        An empty table ready for rows.
+    """
+    from rich.table import Table
+
+    table = Table(title=title)
+    for header, options in columns:
+        table.add_column(header, **options)
+    return table
 
-def show_banner():
+
+def _print_table(
+    title: str,
+    columns: Sequence[ColumnSpec],
+    rows: Iterable[Sequence[str]],
+) -> None:
+    """Print rows as a Rich table, or as tab-separated lines when piped.
+
+    Args:
+        title: Table title (only shown on a terminal).
+        columns: Column headers paired with their ``Table.add_column`` options.
+        rows: Row cell values, in column order.
+    """
+    if not _IS_TTY:
+        write = sys.stdout.write
+        for row in rows:
+            write("\t".join(row) + "\n")
+        return
+
+    table = _make_table(title, columns)
+    for row in rows:
+        table.add_row(*row)
+    console.print(table)
+
+
+def _format_played_time(played_at: str) -> str:
+    """Return the UTC HH:MM of a Spotify ``played_at`` timestamp."""
+    # Spotify sends "YYYY-MM-DDTHH:MM:SS.sssZ", so HH:MM sits at a fixed
+    # offset and needs no parsing; anything else goes through fromisoformat.
+    if played_at[10:11] == "T" and played_at[13:14] == ":" and played_at[-1:] == "Z":
+        return played_at[11:16]
+
+    if played_at[-1:] == "Z":
+        # Python < 3.11 fromisoformat() doesn't accept the Z suffix
+        played_at = played_at[:-1] + "+00:00"
+    parsed = datetime.fromisoformat(played_at)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc)
+    return parsed.strftime("%H:%M")
+
+
+def show_banner() -> None:
     """Display the application banner."""
     from rich.align import Align
+    from rich.panel import Panel
     from rich.text import Text
 
     subtitle = Text("Spotify Analytics & Insights Tool", style="italic bright_white")
@@ -51,51 +198,155 @@ def show_banner():
     console.print()
 
 
-def handle_auth_error(func):
+@lru_cache(maxsize=None)
+def _shared_progress() -> "Progress":
+    """Return the spinner display shared by every command, started on first use."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    # Piped output carries only data rows, so the spinner stays off there
+    progress = Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+        disable=not _IS_TTY,
+    )
+    progress.start()
+    atexit.register(progress.stop)
+    return progress
+
+
+@contextmanager
+def _spinner(
+    description: str,
+    error_message: Optional[str] = None,
+    error_hints: Sequence[str] = (),
+) -> Iterator[Tuple["Progress", "TaskID"]]:
+    """Show a spinner task on the shared progress display while the block runs.
+
+    Args:
+        description: Text shown next to the spinner.
+        error_message: If given, an exception raised inside the block is
+            reported as "❌ <error_message>: <error>" instead of propagating.
+            Click and authentication errors always propagate.
+        error_hints: Extra lines printed after a reported error.
+    """
+    progress = _shared_progress()
+    task = progress.add_task(description, total=None)
+    try:
+        yield progress, task
+    except (click.ClickException, click.exceptions.Exit, click.Abort):
+        raise
+    except Exception as e:
+        # Authentication failures are left to handle_auth_error, which
+        # explains the credentials setup and exits non-zero
+        if error_message is None or isinstance(e, _auth_errors()):
+            raise
+        # Clear the spinner before reporting so the message isn't overdrawn
+        if task in progress.task_ids:
+            progress.remove_task(task)
+        console.print(f"❌ {error_message}: {e}", style="red")
+        for hint in error_hints:
+            console.print(hint)
+    finally:
+        if task in progress.task_ids:
+            progress.remove_task(task)
+
+
+@lru_cache(maxsize=None)
+def _backend(name: str) -> ModuleType:
+    """Import one of Spoticron's backend modules on first use.
+
+    The backends pull in spotipy and SQLAlchemy, which commands such as
+    ``setup`` and ``--help`` never need. Modules come from the ``src`` package,
+    or from the working directory when running from inside ``src``.
+    """
+    package = "src." if importlib.util.find_spec("src") is not None else ""
+    return importlib.import_module(package + name)
+
+
+@lru_cache(maxsize=None)
+def _get_authenticator() -> "SpotifyAuthenticator":
+    """Return the authenticator shared by every command in this process.
+
+    The first call authenticates; later calls reuse the same Spotify client
+    instead of running the OAuth flow again.
+    """
+    authenticator = _backend("auth").SpotifyAuthenticator()
+    authenticator.authenticate()
+    return authenticator
+
+
+def _get_collector(use_cache: bool = True) -> "LiveStatsCollector":
+    """Return a live stats collector bound to the shared Spotify client.
+
+    Args:
+        use_cache: Reuse recently cached top tracks/artists responses.
+    """
+    cache = _backend("api_cache").ResponseCache() if use_cache else None
+    return _backend("live_stats").LiveStatsCollector(
+        _get_authenticator().spotify, cache=cache
+    )
+
+
+def _auth_errors() -> Tuple[Type[BaseException], ...]:
+    """Return the exception types raised when authenticating with Spotify fails."""
+    from spotipy.oauth2 import SpotifyOauthError
+
+    return (_backend("auth").SpotifyAuthError, SpotifyOauthError)
+
+
+def handle_auth_error(func: Callable[..., Any]) -> Callable[..., Any]:
     """Decorator to handle authentication errors."""
 
+    @wraps(func)
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
+        except (click.ClickException, click.exceptions.Exit, click.Abort):
+            raise
+        except _auth_errors():
+            console.print(
+                "❌ Authentication failed. Please check your credentials.",
+                style="bold red",
+            )
+            console.print(
+                "💡 Make sure you have set up your .env file with valid Spotify API credentials."
+            )
+            sys.exit(1)
         except Exception as e:
-            if "authentication" in str(e).lower():
-                console.print(
-                    "❌ Authentication failed. Please check your credentials.",
-                    style="bold red",
-                )
-                console.print(
-                    "💡 Make sure you have set up your .env file with valid Spotify API credentials."
-                )
-                sys.exit(1)
-            else:
-                console.print(f"❌ Error: {e}", style="bold red")
-                sys.exit(1)
+            console.print(f"❌ Error: {e}", style="bold red")
+            sys.exit(1)
 
     return wrapper
 
 
 @click.group()
 @click.version_option(version="1.0.0")
-def cli():
+def cli() -> None:
     """Spoticron - Spotify Analytics Tool
 
     Get detailed insights into your Spotify listening habits with live stats,
     historical analysis, and personalized music discovery patterns.
     """
-    show_banner()
+    if _IS_TTY:
+        show_banner()
+
+    # Exports and analysis results are written under data/
+    DATA_DIR.mkdir(exist_ok=True)
 
 
 @cli.command()
-def current():
+@handle_auth_error
+def current() -> None:
     """Show currently playing track information."""
     console.print("🎵 Getting current track...", style="dim")
 
     try:
-        collector = LiveStatsCollector()
+        collector = _get_collector()
         current_track = collector.get_current_track()
 
         if current_track:
-            print_current_track(current_track)
+            _backend("live_stats").print_current_track(current_track)
         else:
             console.print("🔇 No track currently playing", style="yellow")
 
@@ -106,237 +357,185 @@ def current():
 @cli.command()
 @click.option("--limit", "-l", default=10, help="Number of recent tracks to show")
 @click.option("--detailed", "-d", is_flag=True, help="Show detailed information")
-def recent(limit, detailed):
+@handle_auth_error
+def recent(limit: int, detailed: bool) -> None:
     """Show recently played tracks."""
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Getting recent tracks...", total=None)
-
-        try:
-            collector = LiveStatsCollector()
-            recent_tracks = collector.get_recently_played(limit)
-
-            progress.remove_task(task)
+    with _spinner(
+        "Getting recent tracks...", error_message="Error getting recent tracks"
+    ) as (progress, task):
+        collector = _get_collector()
+        recent_tracks = collector.get_recently_played(limit)
+
+        progress.remove_task(task)
+        if _IS_TTY:
             console.print()  # Add clean line break
 
-            if recent_tracks:
-                table = Table(title=f"🕒 Last {len(recent_tracks)} Played Tracks")
-                table.add_column("#", style="cyan", width=3)
-                table.add_column("Track", style="magenta")
-                table.add_column("Artist(s)", style="green")
-                if detailed:
-                    table.add_column("Album", style="blue")
-                    table.add_column("Played At", style="yellow")
-
-                for i, track in enumerate(recent_tracks, 1):
-                    played_time = datetime.fromisoformat(
-                        track.played_at.replace("Z", "+00:00")
-                    ).strftime("%H:%M")
-
-                    row = [str(i), track.track_name, ", ".join(track.artist_names)]
-
-                    if detailed:
-                        row.extend([track.album_name, played_time])
+        if recent_tracks:
+            join = ", ".join
 
-                    table.add_row(*row)
-
-                console.print(table)
+            if detailed:
+                columns = _RECENT_DETAILED_COLUMNS
+                rows = (
+                    (
+                        str(i),
+                        track.track_name,
+                        join(track.artist_names),
+                        track.album_name,
+                        _format_played_time(track.played_at),
+                    )
+                    for i, track in enumerate(recent_tracks, 1)
+                )
             else:
-                console.print("🔇 No recent tracks found", style="yellow")
+                columns = _RECENT_COLUMNS
+                rows = (
+                    (str(i), track.track_name, join(track.artist_names))
+                    for i, track in enumerate(recent_tracks, 1)
+                )
 
-        except Exception as e:
-            progress.remove_task(task)
-            console.print(f"❌ Error getting recent tracks: {e}", style="red")
+            _print_table(f"🕒 Last {len(recent_tracks)} Played Tracks", columns, rows)
+        else:
+            console.print("🔇 No recent tracks found", style="yellow")
 
 
 @cli.command()
 @click.option(
     "--time-range",
     "-t",
-    type=click.Choice(["short_term", "medium_term", "long_term"]),
+    type=click.Choice(TIME_RANGES),
     default="medium_term",
     help="Time range for top tracks",
 )
 @click.option("--limit", "-l", default=10, help="Number of tracks to show")
-def top_tracks(time_range, limit):
+@click.option(
+    "--no-cache", is_flag=True, help="Fetch fresh data instead of a cached response"
+)
+@handle_auth_error
+def top_tracks(time_range: str, limit: int, no_cache: bool) -> None:
     """Show your top tracks for different time periods."""
-    time_labels = {
-        "short_term": "Last 4 Weeks",
-        "medium_term": "Last 6 Months",
-        "long_term": "All Time",
-    }
-
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task(
-            f"Getting top tracks ({time_labels[time_range]})...", total=None
-        )
-
-        try:
-            collector = LiveStatsCollector()
-            top_tracks_data = collector.get_top_tracks(time_range, limit)
-
-            progress.remove_task(task)
-
-            if top_tracks_data:
-                table = Table(
-                    title=f"🏆 Top {len(top_tracks_data)} Tracks - {time_labels[time_range]}"
-                )
-                table.add_column("Rank", style="cyan", width=4)
-                table.add_column("Track", style="magenta")
-                table.add_column("Artist(s)", style="green")
-                table.add_column("Popularity", style="yellow", width=10)
-
-                for track in top_tracks_data:
-                    table.add_row(
-                        str(
-                            track.name.split(".")[0]
-                            if "." in str(track.name)
-                            else len(table.rows) + 1
-                        ),
-                        track.name,
-                        (
-                            ", ".join(track.artist_names)
-                            if track.artist_names
-                            else "Unknown"
-                        ),
-                        f"{track.popularity}/100",
-                    )
-
-                console.print(table)
-            else:
-                console.print("🔇 No top tracks found", style="yellow")
-
-        except Exception as e:
-            progress.remove_task(task)
-            console.print(f"❌ Error getting top tracks: {e}", style="red")
+    _show_top_items("tracks", time_range, limit, use_cache=not no_cache)
 
 
 @cli.command()
 @click.option(
     "--time-range",
     "-t",
-    type=click.Choice(["short_term", "medium_term", "long_term"]),
+    type=click.Choice(TIME_RANGES),
     default="medium_term",
     help="Time range for top artists",
 )
 @click.option("--limit", "-l", default=10, help="Number of artists to show")
-def top_artists(time_range, limit):
+@click.option(
+    "--no-cache", is_flag=True, help="Fetch fresh data instead of a cached response"
+)
+@handle_auth_error
+def top_artists(time_range: str, limit: int, no_cache: bool) -> None:
     """Show your top artists for different time periods."""
-    time_labels = {
-        "short_term": "Last 4 Weeks",
-        "medium_term": "Last 6 Months",
-        "long_term": "All Time",
-    }
+    _show_top_items("artists", time_range, limit, use_cache=not no_cache)
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task(
-            f"Getting top artists ({time_labels[time_range]})...", total=None
-        )
-
-        try:
-            collector = LiveStatsCollector()
-            top_artists_data = collector.get_top_artists(time_range, limit)
 
-            progress.remove_task(task)
-
-            if top_artists_data:
-                table = Table(
-                    title=f"🌟 Top {len(top_artists_data)} Artists - {time_labels[time_range]}"
-                )
-                table.add_column("Rank", style="cyan", width=4)
-                table.add_column("Artist", style="magenta")
-                table.add_column("Genres", style="green")
-                table.add_column("Popularity", style="yellow", width=10)
-                table.add_column("Followers", style="blue", width=12)
+def _show_top_items(
+    kind: str, time_range: str, limit: int, use_cache: bool = True
+) -> None:
+    """Fetch and display the user's top tracks or artists.
 
-                for i, artist in enumerate(top_artists_data, 1):
-                    genres = ", ".join(artist.genres[:3]) if artist.genres else "N/A"
-                    followers = f"{artist.followers:,}" if artist.followers else "N/A"
-
-                    table.add_row(
-                        str(i),
+    Args:
+        kind: Either "tracks" or "artists".
+        time_range: Spotify time range to show.
+        limit: Number of items to show.
+        use_cache: Reuse a recently cached API response.
+    """
+    label = _TIME_LABELS[time_range]
+
+    with _spinner(
+        f"Getting top {kind} ({label})...", error_message=f"Error getting top {kind}"
+    ) as (progress, task):
+        collector = _get_collector(use_cache)
+        if kind == "tracks":
+            items = collector.get_top_tracks(time_range, limit)
+        else:
+            items = collector.get_top_artists(time_range, limit)
+
+        progress.remove_task(task)
+
+        if not items:
+            console.print(f"🔇 No top {kind} found", style="yellow")
+        elif kind == "tracks":
+            _print_table(
+                f"🏆 Top {len(items)} Tracks - {label}",
+                _TOP_TRACKS_COLUMNS,
+                [
+                    (
+                        str(rank),
+                        track.name,
+                        ", ".join(track.artist_names or ()) or "Unknown",
+                        f"{track.popularity}/100",
+                    )
+                    for rank, track in enumerate(items, 1)
+                ],
+            )
+        else:
+            _print_table(
+                f"🌟 Top {len(items)} Artists - {label}",
+                _TOP_ARTISTS_COLUMNS,
+                [
+                    (
+                        str(rank),
                         artist.name,
-                        genres,
+                        ", ".join(artist.genres[:3]) if artist.genres else "N/A",
                         f"{artist.popularity}/100",
-                        followers,
+                        f"{artist.followers:,}" if artist.followers else "N/A",
                     )
-
-                console.print(table)
-            else:
-                console.print("🔇 No top artists found", style="yellow")
-
-        except Exception as e:
-            progress.remove_task(task)
-            console.print(f"❌ Error getting top artists: {e}", style="red")
+                    for rank, artist in enumerate(items, 1)
+                ],
+            )
 
 
 @cli.command()
 @click.option("--limit", "-l", default=50, help="Number of playlists to show")
-def playlists(limit):
+@handle_auth_error
+def playlists(limit: int) -> None:
     """Show your Spotify playlists."""
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Getting your playlists...", total=None)
-
-        try:
-            collector = LiveStatsCollector()
-            playlists_data = collector.get_user_playlists(limit)
-
-            progress.remove_task(task)
-            console.print()  # Clean line break
-
-            if playlists_data:
-                table = Table(title=f"📚 Your Playlists ({len(playlists_data)} total)")
-                table.add_column("#", style="cyan", width=4)
-                table.add_column("Name", style="magenta")
-                table.add_column("Tracks", style="green", width=8)
-                table.add_column("Owner", style="blue")
-                table.add_column("Type", style="yellow", width=12)
-
-                for i, playlist in enumerate(playlists_data, 1):
-                    playlist_type = []
-                    if playlist.get("public"):
-                        playlist_type.append("Public")
-                    if playlist.get("collaborative"):
-                        playlist_type.append("Collab")
-                    if not playlist_type:
-                        playlist_type.append("Private")
-
-                    table.add_row(
-                        str(i),
-                        playlist["name"],
-                        str(playlist["tracks_total"]),
-                        playlist["owner"],
-                        ", ".join(playlist_type),
-                    )
+    with _spinner(
+        "Getting your playlists...", error_message="Error getting playlists"
+    ) as (progress, task):
+        collector = _get_collector()
+        playlists_data = collector.get_user_playlists(limit)
+
+        progress.remove_task(task)
+        console.print()  # Clean line break
+
+        if playlists_data:
+            table = _make_table(
+                f"📚 Your Playlists ({len(playlists_data)} total)",
+                _PLAYLISTS_COLUMNS,
+            )
 
-                console.print(table)
-                console.print(
-                    "\n💡 [dim]Tip: Use 'spoticron.py playlist-tracks <playlist_id>' to see tracks in a playlist[/dim]"
-                )
-                console.print(
-                    "💡 [dim]Tip: Use 'spoticron.py playlist-tracks' (no ID) to see your Liked Songs[/dim]"
+            for i, playlist in enumerate(playlists_data, 1):
+                playlist_type = []
+                if playlist.get("public"):
+                    playlist_type.append("Public")
+                if playlist.get("collaborative"):
+                    playlist_type.append("Collab")
+                if not playlist_type:
+                    playlist_type.append("Private")
+
+                table.add_row(
+                    str(i),
+                    playlist["name"],
+                    str(playlist["tracks_total"]),
+                    playlist["owner"],
+                    ", ".join(playlist_type),
                 )
-            else:
-                console.print("🔇 No playlists found", style="yellow")
 
-        except Exception as e:
-            progress.remove_task(task)
-            console.print(f"❌ Error getting playlists: {e}", style="red")
+            console.print(table)
+            console.print(
+                "\n💡 [dim]Tip: Use 'spoticron.py playlist-tracks <playlist_id>' to see tracks in a playlist[/dim]"
+            )
+            console.print(
+                "💡 [dim]Tip: Use 'spoticron.py playlist-tracks' (no ID) to see your Liked Songs[/dim]"
+            )
+        else:
+            console.print("🔇 No playlists found", style="yellow")
 
 
 @cli.command()
@@ -351,146 +550,135 @@ def playlists(limit):
     help="Export tracks to file (json or csv)",
 )
 @click.option("--detailed", "-d", is_flag=True, help="Show detailed track information")
-def playlist_tracks(playlist_id, limit, export, detailed):
+@handle_auth_error
+def playlist_tracks(
+    playlist_id: Optional[str],
+    limit: Optional[int],
+    export: Optional[str],
+    detailed: bool,
+) -> None:
     """Show all tracks from a playlist.
 
     If no PLAYLIST_ID is provided, shows your Liked Songs.
     To get a playlist ID, use the 'playlists' command or copy it from Spotify.
     """
-    playlist_name = "Liked Songs" if not playlist_id else f"Playlist {playlist_id}"
-
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task(f"Getting tracks from {playlist_name}...", total=None)
+    from rich.panel import Panel
 
-        try:
-            collector = LiveStatsCollector()
-            tracks = collector.get_playlist_tracks(playlist_id, limit)
-
-            progress.remove_task(task)
-            console.print()  # Clean line break
-
-            if tracks:
-                # Export if requested
-                if export:
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    export_dir = Path("data/exports")
-                    export_dir.mkdir(parents=True, exist_ok=True)
+    playlist_name = "Liked Songs" if not playlist_id else f"Playlist {playlist_id}"
 
-                    if export.lower() == "csv":
-                        # Export as CSV
-                        import csv
+    with _spinner(
+        f"Getting tracks from {playlist_name}...",
+        error_message="Error getting playlist tracks",
+    ) as (progress, task):
+        collector = _get_collector()
+        tracks = collector.get_playlist_tracks(playlist_id, limit)
 
-                        filename = f"playlist_tracks_{timestamp}.csv"
-                        export_path = export_dir / filename
+        progress.remove_task(task)
+        console.print()  # Clean line break
 
-                        with open(export_path, "w", newline="", encoding="utf-8") as f:
-                            writer = csv.writer(f)
-                            # Write header
+        if tracks:
+            # Export if requested
+            if export:
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                export_dir = Path("data/exports")
+                export_dir.mkdir(parents=True, exist_ok=True)
+
+                if export.lower() == "csv":
+                    # Export as CSV
+                    filename = f"playlist_tracks_{timestamp}.csv"
+                    export_path = export_dir / filename
+
+                    with open(export_path, "w", newline="", encoding="utf-8") as f:
+                        writer = csv.writer(f)
+                        # Write header
+                        writer.writerow(
+                            [
+                                "Track",
+                                "Artist(s)",
+                                "Album",
+                                "Duration (MM:SS)",
+                                "Popularity",
+                                "Explicit",
+                                "Added At",
+                                "Spotify URL",
+                            ]
+                        )
+                        # Write track data
+                        for track in tracks:
                             writer.writerow(
                                 [
-                                    "Track",
-                                    "Artist(s)",
-                                    "Album",
-                                    "Duration (MM:SS)",
-                                    "Popularity",
-                                    "Explicit",
-                                    "Added At",
-                                    "Spotify URL",
+                                    track["name"],
+                                    ", ".join(track["artists"]),
+                                    track["album"],
+                                    format_duration_simple(track["duration_ms"]),
+                                    track["popularity"],
+                                    "Yes" if track["explicit"] else "No",
+                                    track.get("added_at", "N/A"),
+                                    track.get("external_url", "N/A"),
                                 ]
                             )
-                            # Write track data
-                            for track in tracks:
-                                writer.writerow(
-                                    [
-                                        track["name"],
-                                        ", ".join(track["artists"]),
-                                        track["album"],
-                                        format_duration_simple(track["duration_ms"]),
-                                        track["popularity"],
-                                        "Yes" if track["explicit"] else "No",
-                                        track.get("added_at", "N/A"),
-                                        track.get("external_url", "N/A"),
-                                    ]
-                                )
-                    else:
-                        # Export as JSON
-                        filename = f"playlist_tracks_{timestamp}.json"
-                        export_path = export_dir / filename
-
-                        with open(export_path, "w") as f:
-                            json.dump(
-                                {
-                                    "playlist_id": playlist_id,
-                                    "playlist_name": playlist_name,
-                                    "total_tracks": len(tracks),
-                                    "exported_at": datetime.now().isoformat(),
-                                    "tracks": tracks,
-                                },
-                                f,
-                                indent=2,
-                            )
-
-                    console.print(
-                        f"✅ Exported {len(tracks)} tracks to {export_path}",
-                        style="green",
+                else:
+                    # Export as JSON
+                    filename = f"playlist_tracks_{timestamp}.json"
+                    export_path = export_dir / filename
+
+                    export_path.write_bytes(
+                        _backend("utils").to_json_bytes(
+                            {
+                                "playlist_id": playlist_id,
+                                "playlist_name": playlist_name,
+                                "total_tracks": len(tracks),
+                                "exported_at": datetime.now().isoformat(),
+                                "tracks": tracks,
+                            }
+                        )
                     )
 
-                # Display tracks
-                table_title = f"🎵 {playlist_name} ({len(tracks)} tracks)"
-                table = Table(title=table_title)
-                table.add_column("#", style="cyan", width=4)
-                table.add_column("Track", style="magenta")
-                table.add_column("Artist(s)", style="green")
+                console.print(
+                    f"✅ Exported {len(tracks)} tracks to {export_path}",
+                    style="green",
+                )
 
-                if detailed:
-                    table.add_column("Album", style="blue")
-                    table.add_column("Duration", style="yellow", width=8)
-                    table.add_column("Popularity", style="red", width=10)
+            # Display tracks
+            table_title = f"🎵 {playlist_name} ({len(tracks)} tracks)"
+            join = ", ".join
 
+            # Separate loops keep the detailed check out of the per-row path
+            if detailed:
+                table = _make_table(table_title, _PLAYLIST_TRACKS_DETAILED_COLUMNS)
+                add_row = table.add_row
                 for i, track in enumerate(tracks, 1):
-                    row = [
+                    add_row(
                         str(i),
                         track["name"],
-                        ", ".join(track["artists"]),
-                    ]
-
-                    if detailed:
-                        duration = format_duration_simple(track["duration_ms"])
-                        row.extend(
-                            [
-                                track["album"],
-                                duration,
-                                f"{track['popularity']}/100",
-                            ]
-                        )
-
-                    table.add_row(*row)
+                        join(track["artists"]),
+                        track["album"],
+                        format_duration_simple(track["duration_ms"]),
+                        f"{track['popularity']}/100",
+                    )
+            else:
+                table = _make_table(table_title, _PLAYLIST_TRACKS_COLUMNS)
+                add_row = table.add_row
+                for i, track in enumerate(tracks, 1):
+                    add_row(str(i), track["name"], join(track["artists"]))
 
-                console.print(table)
+            console.print(table)
 
-                # Show summary stats
-                total_duration_ms = sum(track["duration_ms"] for track in tracks)
-                total_duration_hours = total_duration_ms / (1000 * 60 * 60)
+            # Show summary stats
+            total_duration_ms = sum(track["duration_ms"] for track in tracks)
+            total_duration_hours = total_duration_ms / (1000 * 60 * 60)
 
-                summary = f"""
+            summary = f"""
 [bold]Summary:[/bold]
 • Total tracks: {len(tracks):,}
 • Total duration: {total_duration_hours:.1f} hours
 • Average popularity: {sum(t['popularity'] for t in tracks) / len(tracks):.1f}/100
 • Explicit tracks: {sum(1 for t in tracks if t['explicit'])}
 """
-                console.print(Panel(summary.strip(), border_style="green"))
-
-            else:
-                console.print(f"🔇 No tracks found in {playlist_name}", style="yellow")
+            console.print(Panel(summary.strip(), border_style="green"))
 
-        except Exception as e:
-            progress.remove_task(task)
-            console.print(f"❌ Error getting playlist tracks: {e}", style="red")
+        else:
+            console.print(f"🔇 No tracks found in {playlist_name}", style="yellow")
 
 
 def format_duration_simple(duration_ms: int) -> str:
@@ -502,94 +690,91 @@ def format_duration_simple(duration_ms: int) -> str:
 
 @cli.command()
 @click.option("--export", "-e", is_flag=True, help="Export analysis to JSON file")
-def analyze(export):
+@click.option(
+    "--no-cache", is_flag=True, help="Fetch fresh data instead of cached responses"
+)
+@handle_auth_error
+def analyze(export: bool, no_cache: bool) -> None:
     """Perform comprehensive historical analysis of your listening habits."""
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Performing historical analysis...", total=None)
-
-        try:
-            analyzer = HistoricalStatsAnalyzer()
-
-            # Get evolution analysis
-            evolution = analyzer.analyze_listening_evolution()
-
-            # Get diversity analysis
-            diversity = analyzer.analyze_listening_diversity()
-
-            # Get mood analysis
-            mood = analyzer.get_mood_analysis()
-
-            # Get discovery patterns
-            discovery = analyzer.get_discovery_patterns()
-
-            progress.remove_task(task)
+    from rich.panel import Panel
+
+    with _spinner(
+        "Performing historical analysis...", error_message="Error performing analysis"
+    ) as (progress, task):
+        historical_stats = _backend("historical_stats")
+        cache = None if no_cache else _backend("api_cache").ResponseCache()
+        analyzer = historical_stats.HistoricalStatsAnalyzer(
+            _get_authenticator().spotify, cache=cache
+        )
 
-            # Display evolution summary
-            console.print(
-                Panel(
-                    format_evolution_summary(evolution),
-                    title="Listening Evolution Analysis",
-                    border_style="blue",
-                )
+        # The analyses are independent; evolution, diversity and mood share
+        # the analyzer's cached top data, so run them side by side.
+        results = _backend("utils").run_concurrently(
+            {
+                "evolution": analyzer.analyze_listening_evolution,
+                "diversity": analyzer.analyze_listening_diversity,
+                "mood": analyzer.get_mood_analysis,
+                "discovery": analyzer.get_discovery_patterns,
+            },
+            max_workers=4,
+        )
+        for result in results.values():
+            if isinstance(result, Exception):
+                raise result
+
+        evolution = results["evolution"]
+        diversity = results["diversity"]
+        mood = results["mood"]
+        discovery = results["discovery"]
+
+        progress.remove_task(task)
+
+        # Display evolution summary
+        console.print(
+            Panel(
+                historical_stats.format_evolution_summary(evolution),
+                title="Listening Evolution Analysis",
+                border_style="blue",
             )
+        )
 
-            # Display diversity metrics
-            if diversity.get("time_ranges"):
-                console.print("\n📊 [bold]Listening Diversity Metrics[/bold]")
-                for time_range, metrics in diversity["time_ranges"].items():
-                    time_label = {
-                        "short_term": "Last Month",
-                        "medium_term": "Last 6 Months",
-                        "long_term": "All Time",
-                    }.get(time_range, time_range)
-
-                    console.print(f"\n[cyan]{time_label}:[/cyan]")
-                    console.print(
-                        f"  Unique Artists: {metrics.get('unique_artists', 0)}"
-                    )
-                    console.print(f"  Unique Genres: {metrics.get('unique_genres', 0)}")
-                    console.print(
-                        f"  Genre Diversity: {metrics.get('genre_entropy', 0):.2f}"
-                    )
-
-            # Display discovery patterns
-            if discovery:
-                discovery_rate = discovery.get("discovery_rate", 0)
-                new_discoveries = len(discovery.get("new_discoveries", []))
-
-                console.print("\n🔍 [bold]Discovery Patterns[/bold]")
-                console.print(f"  Discovery Rate: {discovery_rate:.1f}%")
-                console.print(f"  New Tracks Found: {new_discoveries}")
-
-            # Export if requested
-            if export:
-                analysis_data = {
-                    "evolution": evolution,
-                    "diversity": diversity,
-                    "mood": mood,
-                    "discovery": discovery,
-                    "timestamp": datetime.now().isoformat(),
-                }
-
-                output_file = (
-                    f"data/analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-                )
-                Path(output_file).parent.mkdir(parents=True, exist_ok=True)
-
-                with open(output_file, "w", encoding="utf-8") as f:
-                    json.dump(analysis_data, f, indent=2, ensure_ascii=False)
-
-                console.print(
-                    f"\n💾 Analysis exported to: {output_file}", style="green"
-                )
-
-        except Exception as e:
-            progress.remove_task(task)
-            console.print(f"❌ Error performing analysis: {e}", style="red")
+        # Display diversity metrics
+        # Every per-range entry and every non-empty discovery result carries
+        # all of its keys, so they're indexed directly
+        if diversity.get("time_ranges"):
+            console.print("\n📊 [bold]Listening Diversity Metrics[/bold]")
+            for time_range, metrics in diversity["time_ranges"].items():
+                time_label = _TIME_LABELS_SHORT.get(time_range, time_range)
+
+                console.print(f"\n[cyan]{time_label}:[/cyan]")
+                console.print(f"  Unique Artists: {metrics['unique_artists']}")
+                console.print(f"  Unique Genres: {metrics['unique_genres']}")
+                console.print(f"  Genre Diversity: {metrics['genre_entropy']:.2f}")
+
+        # Display discovery patterns
+        if discovery:
+            discovery_rate = discovery["discovery_rate"]
+            new_discoveries = len(discovery["new_discoveries"])
+
+            console.print("\n🔍 [bold]Discovery Patterns[/bold]")
+            console.print(f"  Discovery Rate: {discovery_rate:.1f}%")
+            console.print(f"  New Tracks Found: {new_discoveries}")
+
+        # Export if requested
+        if export:
+            now = datetime.now()
+            analysis_data = {
+                "evolution": evolution,
+                "diversity": diversity,
+                "mood": mood,
+                "discovery": discovery,
+                "timestamp": now.isoformat(),
+            }
+
+            output_file = DATA_DIR / f"analysis_{now:%Y%m%d_%H%M%S}.json"
+            output_file.write_bytes(_backend("utils").to_json_bytes(analysis_data))
+
+            console.print(f"\n💾 Analysis exported to: {output_file}", style="green")
 
 
 @cli.command()
@@ -617,12 +802,15 @@ def analyze(export):
     default=3,
     help="Number of upcoming tracks to show (default: 3)",
 )
-def monitor(duration, interval, previous_tracks, next_tracks):
+@handle_auth_error
+def monitor(
+    duration: int, interval: int, previous_tracks: int, next_tracks: int
+) -> None:
     """Enhanced monitoring mode with smart updates and queue display. Default: indefinite monitoring."""
     show_banner()
 
     try:
-        live_stats = LiveStatsCollector()
+        live_stats = _get_collector()
 
         console.print("🎵 Starting enhanced monitoring mode...", style="bold green")
         if duration == 0:
@@ -647,6 +835,192 @@ def monitor(duration, interval, previous_tracks, next_tracks):
         console.print(f"❌ Monitoring error: {e}", style="red")
 
 
+def _humanize_size(num_bytes: int) -> str:
+    """Format a byte count as bytes, KB or MB."""
+    if num_bytes > 1024 * 1024:
+        return f"{num_bytes / (1024 * 1024):.1f} MB"
+    if num_bytes > 1024:
+        return f"{num_bytes / 1024:.1f} KB"
+    return f"{num_bytes} bytes"
+
+
+def _report_export_result(export_path: Union[str, Path], message: str) -> None:
+    """Print the success message, location and size of an export file."""
+    console.print(message, style="green")
+    console.print(f"📁 File location: {export_path}")
+    console.print(f"📊 File size: {_humanize_size(Path(export_path).stat().st_size)}")
+
+
+def _collect_fresh_data(
+    collector: "LiveStatsCollector", user_info: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Collect a live snapshot of the user's data straight from the Spotify API.
+
+    The requests are independent, so they are issued concurrently; a failed
+    request leaves its section empty instead of aborting the export.
+    """
+    results = _backend("utils").run_concurrently(
+        {
+            "current_track": collector.get_current_track,
+            "recent_tracks": lambda: collector.get_recently_played(20),
+            "top_tracks": partial(collector.get_top_tracks_multi, TIME_RANGES, 20),
+            "top_artists": partial(collector.get_top_artists_multi, TIME_RANGES, 20),
+        }
+    )
+
+    def result_or(key, default):
+        value = results[key]
+        return default if isinstance(value, Exception) else value
+
+    fresh_data = {
+        "user_info": user_info,
+        "current_track": None,
+        "recent_tracks": [],
+        "top_tracks": {},
+        "top_artists": {},
+        "export_timestamp": datetime.now().isoformat(),
+        "data_source": "live_api_collection",
+    }
+
+    current = result_or("current_track", None)
+    if current:
+        fresh_data["current_track"] = {
+            "track_name": current.track_name,
+            "artist_names": current.artist_names,
+            "album_name": current.album_name,
+            "progress_ms": current.progress_ms,
+            "duration_ms": current.duration_ms,
+            "is_playing": current.is_playing,
+        }
+
+    fresh_data["recent_tracks"] = [
+        {
+            "track_name": track.track_name,
+            "artist_names": track.artist_names,
+            "album_name": track.album_name,
+            "played_at": track.played_at,
+        }
+        for track in result_or("recent_tracks", [])
+    ]
+
+    top_tracks = result_or("top_tracks", {})
+    top_artists = result_or("top_artists", {})
+    for time_range in TIME_RANGES:
+        fresh_data["top_tracks"][time_range] = [
+            {
+                "name": track.name,
+                "artist_names": track.artist_names,
+                "popularity": track.popularity,
+            }
+            for track in top_tracks.get(time_range, [])
+        ]
+        fresh_data["top_artists"][time_range] = [
+            {
+                "name": artist.name,
+                "genres": artist.genres,
+                "popularity": artist.popularity,
+                "followers": artist.followers,
+            }
+            for artist in top_artists.get(time_range, [])
+        ]
+
+    return fresh_data
+
+
+_LIVE_EXPORT_CSV_HEADER = (
+    "Section",
+    "Time Range",
+    "Rank",
+    "Name",
+    "Artist(s)",
+    "Album",
+    "Genres",
+    "Popularity",
+    "Followers",
+    "Played At",
+)
+
+
+def _write_csv_stream(path: Path, fresh_data: Dict[str, Any]) -> None:
+    """Write a live export as a single CSV, one row per track or artist.
+
+    Rows are produced by generators and written as they are built, so no
+    intermediate record list is materialized.
+    """
+    join = ", ".join
+    current = fresh_data.get("current_track")
+
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(_LIVE_EXPORT_CSV_HEADER)
+
+        if current:
+            writer.writerow(
+                (
+                    "current_track",
+                    "",
+                    "",
+                    current["track_name"],
+                    join(current["artist_names"]),
+                    current["album_name"],
+                    "",
+                    "",
+                    "",
+                    "",
+                )
+            )
+
+        writer.writerows(
+            (
+                "recent_tracks",
+                "",
+                rank,
+                track["track_name"],
+                join(track["artist_names"]),
+                track["album_name"],
+                "",
+                "",
+                "",
+                track["played_at"],
+            )
+            for rank, track in enumerate(fresh_data.get("recent_tracks", []), 1)
+        )
+
+        for time_range, tracks in fresh_data.get("top_tracks", {}).items():
+            writer.writerows(
+                (
+                    "top_tracks",
+                    time_range,
+                    rank,
+                    track["name"],
+                    join(track["artist_names"] or ()),
+                    "",
+                    "",
+                    track["popularity"],
+                    "",
+                    "",
+                )
+                for rank, track in enumerate(tracks, 1)
+            )
+
+        for time_range, artists in fresh_data.get("top_artists", {}).items():
+            writer.writerows(
+                (
+                    "top_artists",
+                    time_range,
+                    rank,
+                    artist["name"],
+                    "",
+                    "",
+                    join(artist["genres"] or ()),
+                    artist["popularity"],
+                    artist["followers"],
+                    "",
+                )
+                for rank, artist in enumerate(artists, 1)
+            )
+
+
 @cli.command()
 @click.option(
     "--format",
@@ -674,7 +1048,10 @@ def monitor(duration, interval, previous_tracks, next_tracks):
     type=int,
     help="Number of days of listening history to export (optional - exports all if not specified)",
 )
-def export(export_format, output, data_type, days):
+@handle_auth_error
+def export(
+    export_format: str, output: Optional[str], data_type: str, days: Optional[int]
+) -> None:
     """Export your Spotify data to a file.
 
     Examples:
@@ -685,286 +1062,154 @@ def export(export_format, output, data_type, days):
       spoticron export -d 30                     # Export last 30 days of data
       spoticron export -o my_data.json          # Export to specific file
     """
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Preparing data export...", total=None)
+    with _spinner(
+        "Preparing data export...",
+        error_message="Error exporting data",
+        error_hints=(
+            "💡 For detailed error information, check your Spotify API credentials",
+            "💡 Run 'spoticron auth' to verify your connection",
+        ),
+    ) as (progress, task):
+        # Get user info first
+        progress.update(task, description="Authenticating with Spotify...")
+        user_info = _get_authenticator().get_user_info()
+
+        if not user_info:
+            progress.remove_task(task)
+            console.print("❌ Could not get user information", style="red")
+            console.print("💡 Try running 'spoticron auth' to test your connection")
+            return
 
-        try:
-            # Get user info first
-            progress.update(task, description="Authenticating with Spotify...")
-            auth = SpotifyAuthenticator()
-            spotify = auth.authenticate()
-            user_info = spotify.current_user()
+        user_id = user_info["id"]
+        console.print(
+            f"👤 Exporting data for user: {user_info.get('display_name', user_id)}"
+        )
 
-            if not user_info:
-                progress.remove_task(task)
-                console.print("❌ Could not get user information", style="red")
-                console.print("💡 Try running 'spoticron auth' to test your connection")
-                return
+        # Initialize data manager and export
+        progress.update(task, description="Initializing data manager...")
+        data_manager = _backend("data_storage").SpotifyDataManager()
+
+        progress.update(task, description="Collecting data for export...")
 
-            user_id = user_info["id"]
+        # For now, we'll export all data regardless of data_type
+        # TODO: Implement selective data export in future versions
+        if data_type != "all":
             console.print(
-                f"👤 Exporting data for user: {user_info.get('display_name', user_id)}"
+                f"⚠️  Note: Selective export for '{data_type}' not yet implemented.",
+                style="yellow",
             )
+            console.print("📋 Exporting all available data instead.")
 
-            # Initialize data manager and export
-            progress.update(task, description="Initializing data manager...")
-            data_manager = SpotifyDataManager()
+        if days:
+            console.print(
+                f"⚠️  Note: Date filtering for last {days} days not yet implemented.",
+                style="yellow",
+            )
+            console.print("📋 Exporting all available data instead.")
 
-            progress.update(task, description="Collecting data for export...")
+        export_path = data_manager.export_user_data(user_id, export_format)
 
-            # For now, we'll export all data regardless of data_type
-            # TODO: Implement selective data export in future versions
-            if data_type != "all":
-                console.print(
-                    f"⚠️  Note: Selective export for '{data_type}' not yet implemented.",
-                    style="yellow",
-                )
-                console.print("📋 Exporting all available data instead.")
+        if export_path:
+            progress.remove_task(task)
 
-            if days:
-                console.print(
-                    f"⚠️  Note: Date filtering for last {days} days not yet implemented.",
-                    style="yellow",
-                )
-                console.print("📋 Exporting all available data instead.")
+            # Check if custom output path was specified
+            if output:
+                output_path = Path(output)
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                move(export_path, output_path)
+                export_path = str(output_path)
 
-            export_path = data_manager.export_user_data(user_id, export_format)
+            _report_export_result(export_path, "✅ Data exported successfully!")
+        else:
+            # If export failed, try to collect fresh data from Spotify API
+            console.print(
+                "⚠️  No stored data found. Collecting fresh data from Spotify...",
+                style="yellow",
+            )
+            progress.update(task, description="Collecting current Spotify data...")
 
-            progress.remove_task(task)
+            try:
+                collector = _get_collector()
+                fresh_data = _collect_fresh_data(collector, user_info)
 
-            if export_path:
-                # Check if custom output path was specified
+                progress.remove_task(task)
+
+                # Generate filename and save
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                filename = f"spotify_live_export_{user_id}_{timestamp}.{export_format}"
                 if output:
-                    from shutil import move
-
-                    output_path = Path(output)
-                    output_path.parent.mkdir(parents=True, exist_ok=True)
-                    move(export_path, output_path)
-                    export_path = str(output_path)
-
-                console.print("✅ Data exported successfully!", style="green")
-                console.print(f"📁 File location: {export_path}")
-
-                # Show file size
-                file_size = Path(export_path).stat().st_size
-                if file_size > 1024 * 1024:
-                    size_str = f"{file_size / (1024 * 1024):.1f} MB"
-                elif file_size > 1024:
-                    size_str = f"{file_size / 1024:.1f} KB"
+                    export_path = Path(output)
                 else:
-                    size_str = f"{file_size} bytes"
+                    export_path = Path("data/exports") / filename
 
-                console.print(f"📊 File size: {size_str}")
-            else:
-                # If export failed, try to collect fresh data from Spotify API
+                export_path.parent.mkdir(parents=True, exist_ok=True)
+
+                if export_format.lower() == "json":
+                    export_path.write_bytes(_backend("utils").to_json_bytes(fresh_data))
+                else:
+                    _write_csv_stream(export_path, fresh_data)
+
+                _report_export_result(
+                    export_path, "✅ Live data exported successfully!"
+                )
+                console.print("💡 This export contains current data from Spotify API")
                 console.print(
-                    "⚠️  No stored data found. Collecting fresh data from Spotify...",
-                    style="yellow",
+                    "💡 For historical data, run monitoring first: 'spoticron monitor -d 5'"
                 )
 
-                progress = Progress(
-                    SpinnerColumn(),
-                    TextColumn("[progress.description]{task.description}"),
-                    console=console,
+            except Exception as fresh_error:
+                if task in progress.task_ids:
+                    progress.remove_task(task)
+                console.print(
+                    "❌ Failed to collect fresh data from Spotify", style="red"
+                )
+                console.print(f"❌ Error: {fresh_error}", style="red")
+                console.print("💡 This might happen if:")
+                console.print("   • No active Spotify session")
+                console.print("   • API rate limits exceeded")
+                console.print("   • Network connectivity issues")
+                console.print(
+                    "💡 Try running 'spoticron current' to test your connection"
                 )
-
-                with progress:
-                    fresh_task = progress.add_task(
-                        "Collecting current Spotify data...", total=None
-                    )
-
-                    try:
-                        # Collect fresh data from Spotify API
-                        fresh_data = {
-                            "user_info": user_info,
-                            "current_track": None,
-                            "recent_tracks": [],
-                            "top_tracks": {},
-                            "top_artists": {},
-                            "export_timestamp": datetime.now().isoformat(),
-                            "data_source": "live_api_collection",
-                        }
-
-                        # Get current track
-                        try:
-                            from src.live_stats import LiveStatsCollector
-
-                            collector = LiveStatsCollector()
-                            current = collector.get_current_track()
-                            if current:
-                                fresh_data["current_track"] = {
-                                    "track_name": current.track_name,
-                                    "artist_names": current.artist_names,
-                                    "album_name": current.album_name,
-                                    "progress_ms": current.progress_ms,
-                                    "duration_ms": current.duration_ms,
-                                    "is_playing": current.is_playing,
-                                }
-                        except Exception:
-                            pass
-
-                        # Get recent tracks
-                        try:
-                            recent = collector.get_recently_played(20)
-                            fresh_data["recent_tracks"] = [
-                                {
-                                    "track_name": track.track_name,
-                                    "artist_names": track.artist_names,
-                                    "album_name": track.album_name,
-                                    "played_at": track.played_at,
-                                }
-                                for track in recent
-                            ]
-                        except Exception:
-                            pass
-
-                        # Get top tracks for different time ranges
-                        for time_range in ["short_term", "medium_term", "long_term"]:
-                            try:
-                                top_tracks = collector.get_top_tracks(time_range, 20)
-                                fresh_data["top_tracks"][time_range] = [
-                                    {
-                                        "name": track.name,
-                                        "artist_names": track.artist_names,
-                                        "popularity": track.popularity,
-                                    }
-                                    for track in top_tracks
-                                ]
-                            except Exception:
-                                fresh_data["top_tracks"][time_range] = []
-
-                        # Get top artists for different time ranges
-                        for time_range in ["short_term", "medium_term", "long_term"]:
-                            try:
-                                top_artists = collector.get_top_artists(time_range, 20)
-                                fresh_data["top_artists"][time_range] = [
-                                    {
-                                        "name": artist.name,
-                                        "genres": artist.genres,
-                                        "popularity": artist.popularity,
-                                        "followers": artist.followers,
-                                    }
-                                    for artist in top_artists
-                                ]
-                            except Exception:
-                                fresh_data["top_artists"][time_range] = []
-
-                        progress.remove_task(fresh_task)
-
-                        # Generate filename and save
-                        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                        filename = (
-                            f"spotify_live_export_{user_id}_{timestamp}.{export_format}"
-                        )
-                        if output:
-                            export_path = Path(output)
-                        else:
-                            export_path = Path("data/exports") / filename
-
-                        export_path.parent.mkdir(parents=True, exist_ok=True)
-
-                        if export_format.lower() == "json":
-                            with open(export_path, "w", encoding="utf-8") as f:
-                                json.dump(fresh_data, f, indent=2, ensure_ascii=False)
-                        else:
-                            console.print(
-                                "❌ CSV format not yet supported for live export",
-                                style="red",
-                            )
-                            return
-
-                        console.print(
-                            "✅ Live data exported successfully!", style="green"
-                        )
-                        console.print(f"📁 File location: {export_path}")
-                        console.print(
-                            "💡 This export contains current data from Spotify API"
-                        )
-                        console.print(
-                            "💡 For historical data, run monitoring first: 'spoticron monitor -d 5'"
-                        )
-
-                        # Show file size
-                        file_size = export_path.stat().st_size
-                        if file_size > 1024 * 1024:
-                            size_str = f"{file_size / (1024 * 1024):.1f} MB"
-                        elif file_size > 1024:
-                            size_str = f"{file_size / 1024:.1f} KB"
-                        else:
-                            size_str = f"{file_size} bytes"
-
-                        console.print(f"📊 File size: {size_str}")
-
-                    except Exception as fresh_error:
-                        try:
-                            progress.remove_task(fresh_task)
-                        except KeyError:
-                            pass  # Task might already be removed
-                        console.print(
-                            "❌ Failed to collect fresh data from Spotify", style="red"
-                        )
-                        console.print(f"❌ Error: {fresh_error}", style="red")
-                        console.print("💡 This might happen if:")
-                        console.print("   • No active Spotify session")
-                        console.print("   • API rate limits exceeded")
-                        console.print("   • Network connectivity issues")
-                        console.print(
-                            "💡 Try running 'spoticron current' to test your connection"
-                        )
-
-        except Exception as e:
-            progress.remove_task(task)
-            console.print(f"❌ Error exporting data: {e}", style="red")
-            console.print(
-                "💡 For detailed error information, check your Spotify API credentials"
-            )
-            console.print("💡 Run 'spoticron auth' to verify your connection")
 
 
 @cli.command()
-def auth():
+@handle_auth_error
+def auth() -> None:
     """Test Spotify authentication and display user info."""
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Authenticating with Spotify...", total=None)
+    from rich.panel import Panel
 
-        try:
-            authenticator = SpotifyAuthenticator()
-            authenticator.authenticate()
-            user_info = authenticator.get_user_info()
+    with _spinner(
+        "Authenticating with Spotify...", error_message="Authentication error"
+    ) as (progress, task):
+        user_info = _get_authenticator().get_user_info()
 
-            progress.remove_task(task)
+        progress.remove_task(task)
 
-            if user_info:
-                console.print(
-                    Panel(
-                        f"✅ [bold green]Authentication Successful![/bold green]\n\n"
-                        f"👤 User: {user_info.get('display_name', 'N/A')}\n"
-                        f"🆔 ID: {user_info.get('id', 'N/A')}\n"
-                        f"🌍 Country: {user_info.get('country', 'N/A')}\n"
-                        f"👥 Followers: {user_info.get('followers', {}).get('total', 0):,}",
-                        title="Spotify Account Info",
-                        border_style="green",
-                    )
+        if user_info:
+            console.print(
+                Panel(
+                    _ACCOUNT_INFO_TEMPLATE.format_map(
+                        {
+                            "display_name": user_info.get("display_name", "N/A"),
+                            "id": user_info.get("id", "N/A"),
+                            "country": user_info.get("country", "N/A"),
+                            "followers": user_info.get("followers", {}).get("total", 0),
+                        }
+                    ),
+                    title="Spotify Account Info",
+                    border_style="green",
                 )
-            else:
-                console.print("❌ Authentication failed", style="red")
-
-        except Exception as e:
-            progress.remove_task(task)
-            console.print(f"❌ Authentication error: {e}", style="red")
+            )
+        else:
+            console.print("❌ Authentication failed", style="red")
 
 
 @cli.command()
-def setup():
+def setup() -> None:
     """Guide for setting up Spotify API credentials."""
+    from rich.panel import Panel
+
     setup_guide = """
 [bold cyan]Spotify API Setup Guide[/bold cyan]
 
@@ -2,23 +2,42 @@
 Package initialization for Spoticron.
 """
 
+import importlib
+from typing import Any
+
 __version__ = "1.0.0"
 __author__ = "Spoticron Development Team"
 __description__ = "Spotify Analytics Tool for comprehensive listening analysis"
 
-from .auth import SpotifyAuthenticator, get_authenticated_spotify
-from .data_storage import SpotifyDataManager, get_data_manager
-from .historical_stats import HistoricalStatsAnalyzer
-from .live_stats import CurrentTrack, LiveStatsCollector, RecentTrack, TopItem
-
-__all__ = [
-    "SpotifyAuthenticator",
-    "get_authenticated_spotify",
-    "LiveStatsCollector",
-    "CurrentTrack",
-    "RecentTrack",
-    "TopItem",
-    "HistoricalStatsAnalyzer",
-    "SpotifyDataManager",
-    "get_data_manager",
-]
+# Public names and the submodules defining them. Submodules are imported on
+# first attribute access (PEP 562), so importing one backend module doesn't
+# load spotipy, SQLAlchemy and every analyzer along with it.
+_LAZY_EXPORTS = {
+    "SpotifyAuthenticator": ".auth",
+    "get_authenticated_spotify": ".auth",
+    "LiveStatsCollector": ".live_stats",
+    "CurrentTrack": ".live_stats",
+    "RecentTrack": ".live_stats",
+    "TopItem": ".live_stats",
+    "HistoricalStatsAnalyzer": ".historical_stats",
+    "SpotifyDataManager": ".data_storage",
+    "get_data_manager": ".data_storage",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import a re-exported name from its submodule on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    """List module attributes including the lazily imported names."""
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,112 @@
+"""
+Response cache for Spotify API calls.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Seconds a cached top tracks/artists response is reused. Spotify only
+# recomputes top items about once a day, so a few hours of staleness is fine.
+TOP_ITEMS_CACHE_TTL = 6 * 60 * 60
+
+
+class ResponseCache:
+    """Caches raw Spotify API responses on disk with a per-entry expiry."""
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Initialize the response cache.
+
+        Args:
+            cache_dir: Directory to store cached responses. If None, uses a
+                subdirectory of CACHE_DIR from env.
+        """
+        if cache_dir is None:
+            cache_dir = os.path.join(os.getenv("CACHE_DIR", "data/cache"), "api")
+
+        self.cache_dir = Path(cache_dir)
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a cached response.
+
+        Args:
+            key: Cache key identifying the request.
+
+        Returns:
+            The cached response, or None if it is missing or expired.
+        """
+        try:
+            entry = json.loads(self._path(key).read_bytes())
+        except (OSError, ValueError):
+            return None
+
+        if entry.get("expires_at", 0) <= time.time():
+            return None
+        return entry.get("value")
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """
+        Cache a response.
+
+        Args:
+            key: Cache key identifying the request.
+            value: JSON-serializable response to store.
+            ttl: Number of seconds the response stays valid.
+        """
+        path = self._path(key)
+        entry = {"expires_at": time.time() + ttl, "value": value}
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write to a private temp file first so readers never see a partial entry
+            tmp_path = path.with_name(
+                f"{path.stem}.{os.getpid()}.{threading.get_ident()}.tmp"
+            )
+            tmp_path.write_bytes(json.dumps(entry).encode("utf-8"))
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning("Error caching response for %s: %s", key, e)
+
+    def get_or_fetch(
+        self, key: str, ttl: float, fetch: Callable[..., Any], **kwargs: Any
+    ) -> Any:
+        """
+        Return a cached response, calling the API and caching it on a miss.
+
+        Args:
+            key: Cache key identifying the request.
+            ttl: Number of seconds a fetched response stays valid.
+            fetch: Spotify API method to call on a miss.
+            **kwargs: Arguments passed to fetch.
+
+        Returns:
+            The cached or freshly fetched response.
+        """
+        results = self.get(key)
+        if results is None:
+            results = fetch(**kwargs)
+            if results is not None:
+                self.set(key, results, ttl)
+        return results
+
+    def clear(self) -> None:
+        """Remove every cached response, e.g. when the signed-in user changes."""
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                path.unlink()
+            except OSError as e:
+                logger.warning("Error removing cached response %s: %s", path, e)
+
+    def _path(self, key: str) -> Path:
+        """Map a cache key to its file."""
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{digest}.json"
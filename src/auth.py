@@ -2,8 +2,10 @@
 Authentication module for Spotify API integration.
 """
 
+import json
 import os
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -11,6 +13,13 @@ import spotipy
 from dotenv import load_dotenv
 from spotipy.oauth2 import SpotifyOAuth
 
+try:
+    from .api_cache import ResponseCache
+    from .rate_limit import install_rate_limiter
+except ImportError:
+    from api_cache import ResponseCache
+    from rate_limit import install_rate_limiter
+
 
 class SpotifyAuthError(Exception):
     """Custom exception for Spotify authentication errors."""
@@ -23,6 +32,15 @@ class SpotifyTokenError(Exception):
 # Load environment variables
 load_dotenv()
 
+# Seconds before expiry at which a token is treated as expired
+TOKEN_EXPIRY_MARGIN = 60
+
+
+@lru_cache(maxsize=None)
+def _ensure_directory(path: Path) -> None:
+    """Create a directory once per process, however many authenticators use it."""
+    path.mkdir(parents=True, exist_ok=True)
+
 
 class SpotifyAuthenticator:
     """Handles Spotify authentication using OAuth2 flow."""
@@ -51,7 +69,7 @@ class SpotifyAuthenticator:
             )
 
         self.cache_path = Path(cache_path)
-        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        _ensure_directory(self.cache_path.parent)
 
         # Define required scopes for comprehensive access
         self.scope = [
@@ -66,35 +84,80 @@ class SpotifyAuthenticator:
 
         self.sp_oauth = None
         self.spotify = None
+        # Expiry of the client's token, minus TOKEN_EXPIRY_MARGIN
+        self._expires_at = 0.0
+        self._user_info: Optional[Dict[str, Any]] = None
 
     def authenticate(self) -> spotipy.Spotify:
         """
         Authenticate with Spotify and return a Spotify client instance.
 
+        The client is created once and reused by later calls until its
+        token expires.
+
         Returns:
             Authenticated Spotify client instance.
         """
-        # Initialize OAuth handler
-        self.sp_oauth = SpotifyOAuth(
-            client_id=self.client_id,
-            client_secret=self.client_secret,
-            redirect_uri=self.redirect_uri,
-            scope=" ".join(self.scope),
-            cache_path=str(self.cache_path),
-            show_dialog=True,
-        )
-
-        # Get token
-        token_info = self._get_token()
+        if self.is_authenticated():
+            return self.spotify
+
+        # A still-valid cached token doesn't need the OAuth handler at all
+        token_info = self._load_cached_token()
+
+        if token_info is None:
+            # Initialize OAuth handler
+            if self.sp_oauth is None:
+                self.sp_oauth = SpotifyOAuth(
+                    client_id=self.client_id,
+                    client_secret=self.client_secret,
+                    redirect_uri=self.redirect_uri,
+                    scope=" ".join(self.scope),
+                    cache_path=str(self.cache_path),
+                    show_dialog=True,
+                )
+
+            # Get token
+            token_info = self._get_token()
 
         if not token_info:
             raise SpotifyAuthError("Failed to authenticate with Spotify")
 
         # Create Spotify client
         self.spotify = spotipy.Spotify(auth=token_info["access_token"])
+        install_rate_limiter(self.spotify)
+        self._expires_at = token_info["expires_at"] - TOKEN_EXPIRY_MARGIN
+        self._user_info = None
 
         return self.spotify
 
+    def _load_cached_token(self) -> Optional[Dict[str, Any]]:
+        """
+        Read the token cache file directly.
+
+        Returns:
+            Cached token info if it is unexpired and covers the required scopes,
+            otherwise None.
+        """
+        try:
+            token_info = json.loads(self.cache_path.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+        if (
+            not isinstance(token_info, dict)
+            or "access_token" not in token_info
+            or "expires_at" not in token_info
+        ):
+            return None
+
+        if not set(self.scope).issubset(token_info.get("scope", "").split()):
+            return None
+
+        if self._is_token_expired(token_info):
+            return None
+
+        return token_info
+
     def _get_token(self) -> Optional[Dict[str, Any]]:
         """
         Get a valid token, refreshing if necessary.
@@ -145,40 +208,49 @@ class SpotifyAuthenticator:
         Returns:
             True if token is expired, False otherwise.
         """
-        now = int(time.time())
-        return token_info["expires_at"] - now < 60  # Refresh if expires within 1 minute
+        return token_info["expires_at"] - time.time() < TOKEN_EXPIRY_MARGIN
 
     def get_user_info(self) -> Optional[Dict[str, Any]]:
         """
         Get current user information.
 
+        The profile is fetched once per client and reused by later calls.
+
         Returns:
             User information dictionary or None if failed.
         """
         if not self.spotify:
             raise SpotifyAuthError("Not authenticated. Call authenticate() first.")
 
+        if self._user_info is not None:
+            return self._user_info
+
         try:
-            return self.spotify.current_user()
+            self._user_info = self.spotify.current_user()
         except (AttributeError, ValueError) as e:
             print(f"Error getting user info: {e}")
             return None
+        return self._user_info
 
     def is_authenticated(self) -> bool:
         """
-        Check if currently authenticated.
+        Check if currently authenticated with an unexpired token.
 
         Returns:
             True if authenticated, False otherwise.
         """
-        return self.spotify is not None
+        return self.spotify is not None and time.time() < self._expires_at
 
     def revoke_token(self):
         """Revoke the current token and clear cache."""
         if self.cache_path.exists():
             self.cache_path.unlink()
+        # Cached API responses belong to this account, not the next one to sign in
+        ResponseCache().clear()
         self.spotify = None
         self.sp_oauth = None
+        self._expires_at = 0.0
+        self._user_info = None
         print("Token revoked and cache cleared.")
 
 
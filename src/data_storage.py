@@ -2,12 +2,14 @@
 Data storage and analysis module for persistent Spotify data management.
 """
 
-import json
+import logging
 import os
+import sys
+from contextlib import contextmanager
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional
 
 from dotenv import load_dotenv
 from sqlalchemy import (
@@ -19,14 +21,74 @@ from sqlalchemy import (
     Index,
     Integer,
     String,
+    Table,
     Text,
+    and_,
+    bindparam,
     create_engine,
+    delete,
+    distinct,
+    event,
+    func,
+    insert,
+    literal,
+    make_url,
+    select,
+    update,
 )
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+try:
+    from .utils import DATACLASS_SLOTS, batch_process, to_compact_json_bytes
+except ImportError:
+    from utils import DATACLASS_SLOTS, batch_process, to_compact_json_bytes
 
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Maximum values bound into one IN (...) clause; stays well under SQLite's
+# historical limit of 999 bound parameters per statement
+SQL_IN_BATCH_SIZE = 500
+
+# Rows removed per DELETE statement when cleaning up old data
+CLEANUP_BATCH_SIZE = 10_000
+
+# Rows fetched per round-trip when streaming an export
+EXPORT_BATCH_SIZE = 1000
+
+# Pages copied per step of an SQLite online backup; the database is unlocked
+# for writers between steps
+BACKUP_PAGES_PER_STEP = 1000
+
+# Connection pool sizing for server databases (PostgreSQL, MySQL)
+DB_POOL_SIZE = 20
+DB_MAX_OVERFLOW = 10
+DB_POOL_RECYCLE_SECONDS = 1800
+EXECUTEMANY_PAGE_SIZE = 1000
+
+# Applied to every SQLite connection. WAL lets readers run alongside a writer,
+# and synchronous=NORMAL is durable under WAL while skipping most commit fsyncs.
+SQLITE_PRAGMAS = (
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "mmap_size=268435456",
+    "cache_size=-65536",
+)
+
+# Python 3.11+ parses the trailing "Z" of Spotify timestamps natively
+_FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+# Version of the tables and indexes defined below; bump it whenever they
+# change so existing SQLite databases are brought up to date on startup
+SCHEMA_VERSION = 1
+
+# Indexes from earlier schema versions, replaced by wider ones
+OBSOLETE_INDEXES = ("idx_user_played_at",)
+
 Base = declarative_base()
 
 
@@ -112,8 +174,10 @@ class ListeningHistory(Base):
 
     # Add indexes for common queries
     __table_args__ = (
-        Index("idx_user_played_at", "user_id", "played_at"),
+        # Covers the per-user period aggregates, so they never visit the table
+        Index("idx_user_played_track", "user_id", "played_at", "track_id"),
         Index("idx_track_played_at", "track_id", "played_at"),
+        Index("idx_lh_created_at", "created_at"),
     )
 
 
@@ -175,10 +239,145 @@ class AnalysisSnapshot(Base):
 
     __table_args__ = (
         Index("idx_user_analysis_type", "user_id", "analysis_type", "created_at"),
+        Index("idx_snapshot_created_at", "created_at"),
+    )
+
+
+# Statements issued on every store/export call, built once with bound
+# parameters instead of being reconstructed per call
+_EXPORT_USER = select(
+    User.id, User.display_name, User.email, User.country, User.followers
+).where(User.id == bindparam("user_id"))
+
+_STORED_PLAYS = select(ListeningHistory.track_id, ListeningHistory.played_at).where(
+    ListeningHistory.user_id == bindparam("user_id"),
+    ListeningHistory.played_at.in_(bindparam("played_ats", expanding=True)),
+)
+
+_STORED_AUDIO_FEATURES = select(AudioFeatures.track_id).where(
+    AudioFeatures.track_id.in_(bindparam("track_ids", expanding=True))
+)
+
+_EXPORT_HISTORY = (
+    select(
+        ListeningHistory.track_id,
+        ListeningHistory.played_at,
+        ListeningHistory.progress_ms,
+        ListeningHistory.source,
     )
+    .where(ListeningHistory.user_id == bindparam("user_id"))
+    .execution_options(yield_per=EXPORT_BATCH_SIZE)
+)
+
+_EXPORT_TOP_ITEMS = (
+    select(
+        TopItem.item_id,
+        TopItem.item_type,
+        TopItem.time_range,
+        TopItem.rank,
+        TopItem.recorded_at,
+    )
+    .where(TopItem.user_id == bindparam("user_id"))
+    .execution_options(yield_per=EXPORT_BATCH_SIZE)
+)
+
+
+def _parse_played_at(value: Any) -> datetime:
+    """
+    Normalize a played_at value to a naive UTC datetime.
+
+    Args:
+        value: ISO-8601 string, datetime, or None for "now".
+
+    Returns:
+        Naive datetime in UTC, matching how DateTime columns are stored.
+    """
+    if value is None:
+        return datetime.utcnow()
+
+    if isinstance(value, str):
+        # Spotify timestamps end in Z, which Python < 3.11 fromisoformat()
+        # doesn't accept
+        if not _FROMISOFORMAT_ACCEPTS_Z and value[-1:] == "Z":
+            value = value[:-1] + "+00:00"
+        value = datetime.fromisoformat(value)
+
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _engine_kwargs(database_url: str) -> Dict[str, Any]:
+    """
+    Build create_engine() options for a database URL.
+
+    Args:
+        database_url: SQLAlchemy database URL.
 
+    Returns:
+        Keyword arguments for create_engine().
+    """
+    # Larger compiled-statement cache than SQLAlchemy's default of 500, so the
+    # ORM queries and bulk inserts issued per store/get call stay compiled
+    kwargs: Dict[str, Any] = {"query_cache_size": 1200}
+
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite":
+        # pysqlite keeps prepared statements per connection (default 128)
+        kwargs["connect_args"] = {"cached_statements": 256}
+        if url.database in (None, "", ":memory:"):
+            # Each connection would get its own empty in-memory database, so
+            # share a single one across threads
+            kwargs["poolclass"] = StaticPool
+            kwargs["connect_args"]["check_same_thread"] = False
+    else:
+        # Room for concurrent collectors, with stale server-side connections
+        # detected and replaced instead of failing the next query
+        kwargs.update(
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_pre_ping=True,
+            pool_recycle=DB_POOL_RECYCLE_SECONDS,
+            # Rows per multi-row INSERT ... VALUES statement in bulk inserts
+            insertmanyvalues_page_size=EXECUTEMANY_PAGE_SIZE,
+        )
+        if url.get_driver_name() == "psycopg2":
+            # Batch bulk UPDATE/DELETE parameter sets with execute_batch too
+            kwargs["executemany_mode"] = "values_plus_batch"
+
+    return kwargs
+
+
+def _apply_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    """Apply SQLITE_PRAGMAS to a new SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(f"PRAGMA {pragma}")
+    finally:
+        cursor.close()
+
+
+def _write_json_array(file: BinaryIO, items: Iterable[Dict[str, Any]]) -> None:
+    """
+    Write items to a binary file as a JSON array, one object per line.
 
-@dataclass
+    Args:
+        file: File opened for binary writing.
+        items: JSON-serializable objects.
+    """
+    file.write(b"[")
+    separator = b"\n    "
+    for item in items:
+        file.write(separator)
+        file.write(to_compact_json_bytes(item))
+        separator = b",\n    "
+
+    # separator only changes once something has been written
+    file.write(b"]" if separator == b"\n    " else b"\n  ]")
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class DataStorageConfig:
     """Configuration for data storage."""
 
@@ -204,100 +403,239 @@ class SpotifyDataManager:
             config = DataStorageConfig(database_url=database_url)
 
         self.config = config
-        self.engine = create_engine(config.database_url)
-        self.session_factory = sessionmaker(bind=self.engine)
+        self.engine = create_engine(
+            config.database_url, **_engine_kwargs(config.database_url)
+        )
+        if self.engine.dialect.name == "sqlite":
+            event.listen(self.engine, "connect", _apply_sqlite_pragmas)
+        # Objects stay usable after commit without being reloaded
+        self.session_factory = sessionmaker(bind=self.engine, expire_on_commit=False)
 
         # Create directories
         Path(config.backup_dir).mkdir(parents=True, exist_ok=True)
         Path(config.export_dir).mkdir(parents=True, exist_ok=True)
 
-        # Create tables
+        self._ensure_schema()
+
+    def _ensure_schema(self) -> None:
+        """
+        Create missing tables and indexes and drop obsolete indexes.
+
+        SQLite databases record SCHEMA_VERSION in PRAGMA user_version once
+        this has run, so later startups skip the per-table schema queries.
+        """
+        is_sqlite = self.engine.dialect.name == "sqlite"
+        if is_sqlite:
+            with self.engine.connect() as connection:
+                version = connection.exec_driver_sql("PRAGMA user_version").scalar()
+            if version == SCHEMA_VERSION:
+                return
+
+        # Create tables, plus any indexes added since an existing database
+        # was created (create_all only creates indexes with new tables)
         Base.metadata.create_all(self.engine)
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(self.engine, checkfirst=True)
+
+        # Drop indexes superseded by the ones above
+        if self.engine.dialect.name in ("sqlite", "postgresql"):
+            with self.engine.begin() as connection:
+                for index_name in OBSOLETE_INDEXES:
+                    connection.exec_driver_sql(f"DROP INDEX IF EXISTS {index_name}")
+
+        if is_sqlite:
+            with self.engine.begin() as connection:
+                connection.exec_driver_sql(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    @contextmanager
+    def _session(self, session: Optional[Session] = None) -> Iterator[Session]:
+        """
+        Provide a session that commits on success and rolls back on error.
+
+        Args:
+            session: Session of an enclosing transaction(). If given, it is
+                yielded as-is and left for that transaction to commit.
+
+        Yields:
+            Database session, closed when the block exits.
+        """
+        if session is not None:
+            yield session
+            return
+
+        session = self.session_factory()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    @contextmanager
+    def transaction(self) -> Iterator[Session]:
+        """
+        Group several store_* calls into a single transaction.
+
+        Pass the yielded session as the ``session`` argument of each call;
+        everything commits together when the block exits. On SQLite the
+        write lock is taken up front with BEGIN IMMEDIATE, so the transaction
+        can't fail later on a lock upgrade.
 
-    def store_user_info(self, user_data: Dict[str, Any]) -> bool:
+        Yields:
+            Database session shared by the grouped calls.
+        """
+        with self._session() as session:
+            if self.engine.dialect.name == "sqlite":
+                session.connection().exec_driver_sql("BEGIN IMMEDIATE")
+            yield session
+
+    def _upsert(
+        self,
+        session: Session,
+        table: Table,
+        values: Dict[str, Any],
+        update_values: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Insert a row, or update it if its primary key already exists.
+
+        SQLite and PostgreSQL do this in a single INSERT ... ON CONFLICT
+        statement; other backends fall back to a primary-key lookup.
+
+        Args:
+            session: Active database session.
+            table: Table to write to.
+            values: Column values for a new row.
+            update_values: Column values (or SQL expressions) to apply when the
+                row already exists. If None, an existing row is left unchanged.
+        """
+        dialect = self.engine.dialect.name
+        if dialect in ("sqlite", "postgresql"):
+            if dialect == "sqlite":
+                from sqlalchemy.dialects.sqlite import insert as dialect_insert
+            else:
+                from sqlalchemy.dialects.postgresql import insert as dialect_insert
+
+            key_columns = [column.name for column in table.primary_key]
+            statement = dialect_insert(table).values(**values)
+            if update_values:
+                statement = statement.on_conflict_do_update(
+                    index_elements=key_columns, set_=update_values
+                )
+            else:
+                statement = statement.on_conflict_do_nothing(index_elements=key_columns)
+            session.execute(statement)
+            return
+
+        key_clause = and_(
+            *(column == values[column.name] for column in table.primary_key)
+        )
+        exists = session.execute(
+            select(literal(1)).select_from(table).where(key_clause)
+        ).first()
+
+        if exists is None:
+            session.execute(insert(table).values(**values))
+        elif update_values:
+            session.execute(update(table).where(key_clause).values(**update_values))
+
+    def store_user_info(
+        self, user_data: Dict[str, Any], session: Optional[Session] = None
+    ) -> bool:
         """
         Store or update user information.
 
         Args:
             user_data: User data from Spotify API.
+            session: Session from transaction() to write in. If None, the
+                write is committed on its own.
 
         Returns:
             True if successful, False otherwise.
         """
         try:
-            session = self.session_factory()
-
-            user = session.query(User).filter_by(id=user_data["id"]).first()
+            with self._session(session) as session:
+                followers = user_data.get("followers", {}).get("total", 0)
+                columns = User.__table__.c
 
-            if user:
-                # Update existing user (updated_at will be set automatically by onupdate)
-                user.display_name = user_data.get("display_name") or user.display_name
-                user.email = user_data.get("email") or user.email
-                user.country = user_data.get("country") or user.country
-                user.followers = user_data.get("followers", {}).get("total", 0)
-            else:
-                # Create new user
-                user = User(
-                    id=user_data["id"],
-                    display_name=user_data.get("display_name"),
-                    email=user_data.get("email"),
-                    country=user_data.get("country"),
-                    followers=user_data.get("followers", {}).get("total", 0),
+                self._upsert(
+                    session,
+                    User.__table__,
+                    {
+                        "id": user_data["id"],
+                        "display_name": user_data.get("display_name"),
+                        "email": user_data.get("email"),
+                        "country": user_data.get("country"),
+                        "followers": followers,
+                    },
+                    {
+                        # Keep the stored values for fields the API left empty
+                        "display_name": func.coalesce(
+                            user_data.get("display_name") or None, columns.display_name
+                        ),
+                        "email": func.coalesce(
+                            user_data.get("email") or None, columns.email
+                        ),
+                        "country": func.coalesce(
+                            user_data.get("country") or None, columns.country
+                        ),
+                        "followers": followers,
+                        # ON CONFLICT updates don't fire column onupdate hooks
+                        "updated_at": datetime.utcnow(),
+                    },
                 )
-                session.add(user)
 
-            session.commit()
-            session.close()
-            return True
+                return True
 
         except Exception as e:
-            print(f"Error storing user info: {e}")
-            if "session" in locals():
-                session.rollback()
-                session.close()
+            logger.error("Error storing user info: %s", e)
             return False
 
-    def store_track(self, track_data: Dict[str, Any]) -> bool:
+    def store_track(
+        self, track_data: Dict[str, Any], session: Optional[Session] = None
+    ) -> bool:
         """
         Store track information.
 
         Args:
             track_data: Track data from Spotify API.
+            session: Session from transaction() to write in. If None, the
+                write is committed on its own.
 
         Returns:
             True if successful, False otherwise.
         """
         try:
-            session = self.session_factory()
-
-            # Check if track already exists
-            existing_track = session.query(Track).filter_by(id=track_data["id"]).first()
-
-            if not existing_track:
-                track = Track(
-                    id=track_data["id"],
-                    name=track_data["name"],
-                    duration_ms=track_data.get("duration_ms"),
-                    popularity=track_data.get("popularity"),
-                    explicit=track_data.get("explicit", False),
-                    preview_url=track_data.get("preview_url"),
-                    external_url=track_data.get("external_urls", {}).get("spotify"),
+            with self._session(session) as session:
+                self._upsert(
+                    session,
+                    Track.__table__,
+                    {
+                        "id": track_data["id"],
+                        "name": track_data["name"],
+                        "duration_ms": track_data.get("duration_ms"),
+                        "popularity": track_data.get("popularity"),
+                        "explicit": track_data.get("explicit", False),
+                        "preview_url": track_data.get("preview_url"),
+                        "external_url": track_data.get("external_urls", {}).get(
+                            "spotify"
+                        ),
+                    },
                 )
-                session.add(track)
-                session.commit()
-
-            session.close()
-            return True
+                return True
 
         except Exception as e:
-            print(f"Error storing track: {e}")
-            if "session" in locals():
-                session.rollback()
-                session.close()
+            logger.error("Error storing track: %s", e)
             return False
 
     def store_listening_history(
-        self, user_id: str, listening_data: List[Dict[str, Any]]
+        self,
+        user_id: str,
+        listening_data: List[Dict[str, Any]],
+        session: Optional[Session] = None,
     ) -> bool:
         """
         Store listening history data.
@@ -305,160 +643,169 @@ class SpotifyDataManager:
         Args:
             user_id: Spotify user ID.
             listening_data: List of listening events.
+            session: Session from transaction() to write in. If None, the
+                write is committed on its own.
 
         Returns:
             True if successful, False otherwise.
         """
         try:
-            session = self.session_factory()
-
-            for item in listening_data:
-                # Parse played_at timestamp
-                if isinstance(item.get("played_at"), str):
-                    played_at = datetime.fromisoformat(
-                        item["played_at"].replace("Z", "+00:00")
-                    )
-                else:
-                    played_at = item.get("played_at", datetime.utcnow())
-
-                # Check if this exact listening event already exists
-                existing = (
-                    session.query(ListeningHistory)
-                    .filter_by(
-                        user_id=user_id,
-                        track_id=item.get("track_id"),
-                        played_at=played_at,
+            with self._session(session) as session:
+                entries = [
+                    {
+                        "user_id": user_id,
+                        "track_id": item.get("track_id"),
+                        "played_at": _parse_played_at(item.get("played_at")),
+                        "progress_ms": item.get("progress_ms"),
+                        "is_current": item.get("is_current", False),
+                        "source": item.get("source", "recent"),
+                    }
+                    for item in listening_data
+                ]
+
+                # Fetch the events already stored for these timestamps in one query
+                # per batch instead of one query per event
+                played_ats = sorted({entry["played_at"] for entry in entries})
+                existing = set()
+                for batch in batch_process(played_ats, SQL_IN_BATCH_SIZE):
+                    existing.update(
+                        (track_id, played_at)
+                        for track_id, played_at in session.execute(
+                            _STORED_PLAYS, {"user_id": user_id, "played_ats": batch}
+                        )
                     )
-                    .first()
-                )
 
-                if not existing:
-                    history_entry = ListeningHistory(
-                        user_id=user_id,
-                        track_id=item.get("track_id"),
-                        played_at=played_at,
-                        progress_ms=item.get("progress_ms"),
-                        is_current=item.get("is_current", False),
-                        source=item.get("source", "recent"),
-                    )
-                    session.add(history_entry)
+                new_entries = []
+                for entry in entries:
+                    key = (entry["track_id"], entry["played_at"])
+                    if key not in existing:
+                        existing.add(key)
+                        new_entries.append(entry)
 
-            session.commit()
-            session.close()
-            return True
+                if new_entries:
+                    session.execute(insert(ListeningHistory), new_entries)
+
+                return True
 
         except Exception as e:
-            print(f"Error storing listening history: {e}")
-            if "session" in locals():
-                session.rollback()
-                session.close()
+            logger.error("Error storing listening history: %s", e)
             return False
 
-    def store_top_items(self, user_id: str, top_data: Dict[str, Any]) -> bool:
+    def store_top_items(
+        self,
+        user_id: str,
+        top_data: Dict[str, Any],
+        session: Optional[Session] = None,
+    ) -> bool:
         """
         Store top tracks/artists data.
 
         Args:
             user_id: Spotify user ID.
             top_data: Top items data with time ranges.
+            session: Session from transaction() to write in. If None, the
+                write is committed on its own.
 
         Returns:
             True if successful, False otherwise.
         """
         try:
-            session = self.session_factory()
             recorded_at = datetime.utcnow()
+            rows = []
+            seen = set()
 
             for time_range, data in top_data.get("time_ranges", {}).items():
                 if not data:
                     continue
 
-                # Store top tracks
-                for track in data.get("tracks", []):
-                    top_item = TopItem(
-                        user_id=user_id,
-                        item_id=track["track_id"],
-                        item_type="track",
-                        time_range=time_range,
-                        rank=track["rank"],
-                        recorded_at=recorded_at,
-                    )
-                    session.add(top_item)
-
-                # Store top artists
-                for artist in data.get("artists", []):
-                    top_item = TopItem(
-                        user_id=user_id,
-                        item_id=artist["artist_id"],
-                        item_type="artist",
-                        time_range=time_range,
-                        rank=artist["rank"],
-                        recorded_at=recorded_at,
+                items = [
+                    ("track", track["track_id"], track["rank"])
+                    for track in data.get("tracks", [])
+                ]
+                items.extend(
+                    ("artist", artist["artist_id"], artist["rank"])
+                    for artist in data.get("artists", [])
+                )
+
+                for item_type, item_id, rank in items:
+                    # Keep only the first entry if an item is listed twice
+                    key = (time_range, item_type, item_id)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    rows.append(
+                        {
+                            "user_id": user_id,
+                            "item_id": item_id,
+                            "item_type": item_type,
+                            "time_range": time_range,
+                            "rank": rank,
+                            "recorded_at": recorded_at,
+                        }
                     )
-                    session.add(top_item)
 
-            session.commit()
-            session.close()
+            if rows:
+                with self._session(session) as session:
+                    session.execute(insert(TopItem), rows)
+
             return True
 
         except Exception as e:
-            print(f"Error storing top items: {e}")
-            if "session" in locals():
-                session.rollback()
-                session.close()
+            logger.error("Error storing top items: %s", e)
             return False
 
-    def store_audio_features(self, features_data: List[Dict[str, Any]]) -> bool:
+    def store_audio_features(
+        self,
+        features_data: List[Dict[str, Any]],
+        session: Optional[Session] = None,
+    ) -> bool:
         """
         Store audio features for tracks.
 
         Args:
             features_data: List of audio features from Spotify API.
+            session: Session from transaction() to write in. If None, the
+                write is committed on its own.
 
         Returns:
             True if successful, False otherwise.
         """
         try:
-            session = self.session_factory()
-
-            for features in features_data:
-                if not features or not features.get("id"):
-                    continue
-
-                # Check if features already exist
-                existing = (
-                    session.query(AudioFeatures)
-                    .filter_by(track_id=features["id"])
-                    .first()
-                )
-
-                if not existing:
-                    audio_features = AudioFeatures(
-                        track_id=features["id"],
-                        danceability=features.get("danceability"),
-                        energy=features.get("energy"),
-                        key=features.get("key"),
-                        loudness=features.get("loudness"),
-                        mode=features.get("mode"),
-                        speechiness=features.get("speechiness"),
-                        acousticness=features.get("acousticness"),
-                        instrumentalness=features.get("instrumentalness"),
-                        liveness=features.get("liveness"),
-                        valence=features.get("valence"),
-                        tempo=features.get("tempo"),
-                        time_signature=features.get("time_signature"),
-                    )
-                    session.add(audio_features)
-
-            session.commit()
-            session.close()
-            return True
+            with self._session(session) as session:
+                # Later duplicates of a track in the same batch are ignored, as before
+                rows = {}
+                for features in features_data:
+                    if features and features.get("id") and features["id"] not in rows:
+                        rows[features["id"]] = {
+                            "track_id": features["id"],
+                            "danceability": features.get("danceability"),
+                            "energy": features.get("energy"),
+                            "key": features.get("key"),
+                            "loudness": features.get("loudness"),
+                            "mode": features.get("mode"),
+                            "speechiness": features.get("speechiness"),
+                            "acousticness": features.get("acousticness"),
+                            "instrumentalness": features.get("instrumentalness"),
+                            "liveness": features.get("liveness"),
+                            "valence": features.get("valence"),
+                            "tempo": features.get("tempo"),
+                            "time_signature": features.get("time_signature"),
+                        }
+
+                # Find tracks that already have features with one query per batch
+                for batch in batch_process(list(rows), SQL_IN_BATCH_SIZE):
+                    for (track_id,) in session.execute(
+                        _STORED_AUDIO_FEATURES, {"track_ids": batch}
+                    ):
+                        del rows[track_id]
+
+                if rows:
+                    session.execute(insert(AudioFeatures), list(rows.values()))
+
+                return True
 
         except Exception as e:
-            print(f"Error storing audio features: {e}")
-            if "session" in locals():
-                session.rollback()
-                session.close()
+            logger.error("Error storing audio features: %s", e)
             return False
 
     def get_listening_stats(self, user_id: str, days: int = 30) -> Dict[str, Any]:
@@ -473,59 +820,45 @@ class SpotifyDataManager:
             Dictionary with listening statistics.
         """
         try:
-            session = self.session_factory()
-
-            # Calculate date range
-            end_date = datetime.utcnow()
-            start_date = end_date - timedelta(days=days)
-
-            # Get listening history
-            history = (
-                session.query(ListeningHistory)
-                .filter(
-                    ListeningHistory.user_id == user_id,
-                    ListeningHistory.played_at >= start_date,
-                    ListeningHistory.played_at <= end_date,
+            with self._session() as session:
+                # Calculate date range
+                end_date = datetime.utcnow()
+                start_date = end_date - timedelta(days=days)
+
+                # Aggregate in the database rather than loading every play and track
+                total_plays, unique_tracks, total_duration_ms = (
+                    session.query(
+                        func.count(ListeningHistory.id),
+                        func.count(distinct(ListeningHistory.track_id)),
+                        func.coalesce(func.sum(Track.duration_ms), 0),
+                    )
+                    .select_from(ListeningHistory)
+                    .outerjoin(Track, Track.id == ListeningHistory.track_id)
+                    .filter(
+                        ListeningHistory.user_id == user_id,
+                        ListeningHistory.played_at >= start_date,
+                        ListeningHistory.played_at <= end_date,
+                    )
+                    .one()
                 )
-                .all()
-            )
-
-            # Calculate statistics
-            total_plays = len(history)
-            unique_tracks = len(set(h.track_id for h in history))
-
-            # Get track information for played tracks
-            track_ids = [h.track_id for h in history]
-            tracks = session.query(Track).filter(Track.id.in_(track_ids)).all()
-            track_dict = {t.id: t for t in tracks}
-
-            # Calculate total listening time
-            total_duration_ms = sum(
-                track_dict[h.track_id].duration_ms
-                for h in history
-                if h.track_id in track_dict
-            )
 
-            listening_stats = {
-                "period_days": days,
-                "start_date": start_date.isoformat(),
-                "end_date": end_date.isoformat(),
-                "total_plays": total_plays,
-                "unique_tracks": unique_tracks,
-                "total_listening_time_hours": total_duration_ms / (1000 * 60 * 60),
-                "average_plays_per_day": total_plays / days if days > 0 else 0,
-                "average_listening_hours_per_day": (
-                    (total_duration_ms / (1000 * 60 * 60)) / days if days > 0 else 0
-                ),
-            }
-
-            session.close()
-            return listening_stats
+                listening_stats = {
+                    "period_days": days,
+                    "start_date": start_date.isoformat(),
+                    "end_date": end_date.isoformat(),
+                    "total_plays": total_plays,
+                    "unique_tracks": unique_tracks,
+                    "total_listening_time_hours": total_duration_ms / (1000 * 60 * 60),
+                    "average_plays_per_day": total_plays / days if days > 0 else 0,
+                    "average_listening_hours_per_day": (
+                        (total_duration_ms / (1000 * 60 * 60)) / days if days > 0 else 0
+                    ),
+                }
+
+                return listening_stats
 
         except Exception as e:
-            print(f"Error getting listening stats: {e}")
-            if "session" in locals():
-                session.close()
+            logger.error("Error getting listening stats: %s", e)
             return {}
 
     def export_user_data(
@@ -541,72 +874,87 @@ class SpotifyDataManager:
         Returns:
             Path to exported file or None if failed.
         """
-        try:
-            session = self.session_factory()
-
-            # Get all user data
-            user = session.query(User).filter_by(id=user_id).first()
-            if not user:
-                return None
-
-            # Get listening history
-            history = session.query(ListeningHistory).filter_by(user_id=user_id).all()
-
-            # Get top items
-            top_items = session.query(TopItem).filter_by(user_id=user_id).all()
-
-            # Prepare export data
-            export_data = {
-                "user_info": {
-                    "id": user.id,
-                    "display_name": user.display_name,
-                    "email": user.email,
-                    "country": user.country,
-                    "followers": user.followers,
-                },
-                "listening_history": [
-                    {
-                        "track_id": h.track_id,
-                        "played_at": h.played_at.isoformat(),
-                        "progress_ms": h.progress_ms,
-                        "source": h.source,
-                    }
-                    for h in history
-                ],
-                "top_items": [
-                    {
-                        "item_id": t.item_id,
-                        "item_type": t.item_type,
-                        "time_range": t.time_range,
-                        "rank": t.rank,
-                        "recorded_at": t.recorded_at.isoformat(),
-                    }
-                    for t in top_items
-                ],
-                "export_timestamp": datetime.utcnow().isoformat(),
-            }
-
-            # Generate filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"spotify_data_{user_id}_{timestamp}.{export_format}"
-            filepath = Path(self.config.export_dir) / filename
-
-            # Export data
-            if export_format.lower() == "json":
-                with open(filepath, "w", encoding="utf-8") as f:
-                    json.dump(export_data, f, indent=2, ensure_ascii=False)
-            else:
-                # For CSV, would need pandas implementation
-                print("CSV export not yet implemented")
-                return None
+        if export_format.lower() != "json":
+            # For CSV, would need pandas implementation
+            logger.warning("CSV export not yet implemented")
+            return None
 
-            session.close()
-            return str(filepath)
+        try:
+            with self._session() as session:
+                # Get all user data
+                user = session.execute(_EXPORT_USER, {"user_id": user_id}).first()
+                if not user:
+                    return None
+
+                # Generate filename
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                filename = f"spotify_data_{user_id}_{timestamp}.{export_format}"
+                filepath = Path(self.config.export_dir) / filename
+
+                # Stream plain rows straight to the file instead of building the
+                # whole document (and every ORM object) in memory first
+                params = {"user_id": user_id}
+
+                # Write to a temporary file so a failed export never leaves a
+                # truncated file under the final name
+                tmp_path = filepath.with_suffix(filepath.suffix + ".tmp")
+                try:
+                    with open(tmp_path, "wb") as f:
+                        f.write(b'{\n  "user_info": ')
+                        f.write(
+                            to_compact_json_bytes(
+                                {
+                                    "id": user.id,
+                                    "display_name": user.display_name,
+                                    "email": user.email,
+                                    "country": user.country,
+                                    "followers": user.followers,
+                                }
+                            )
+                        )
+                        f.write(b',\n  "listening_history": ')
+                        _write_json_array(
+                            f,
+                            (
+                                {
+                                    "track_id": track_id,
+                                    "played_at": played_at.isoformat(),
+                                    "progress_ms": progress_ms,
+                                    "source": source,
+                                }
+                                for track_id, played_at, progress_ms, source in (
+                                    session.execute(_EXPORT_HISTORY, params)
+                                )
+                            ),
+                        )
+                        f.write(b',\n  "top_items": ')
+                        _write_json_array(
+                            f,
+                            (
+                                {
+                                    "item_id": item_id,
+                                    "item_type": item_type,
+                                    "time_range": time_range,
+                                    "rank": rank,
+                                    "recorded_at": recorded_at.isoformat(),
+                                }
+                                for item_id, item_type, time_range, rank, recorded_at in (
+                                    session.execute(_EXPORT_TOP_ITEMS, params)
+                                )
+                            ),
+                        )
+                        f.write(b',\n  "export_timestamp": ')
+                        f.write(to_compact_json_bytes(datetime.utcnow().isoformat()))
+                        f.write(b"\n}\n")
+                    os.replace(tmp_path, filepath)
+                except BaseException:
+                    tmp_path.unlink(missing_ok=True)
+                    raise
+
+                return str(filepath)
 
         except Exception as e:
-            print(f"Error exporting user data: {e}")
-            if "session" in locals():
-                session.close()
+            logger.error("Error exporting user data: %s", e)
             return None
 
     def create_backup(self) -> Optional[str]:
@@ -621,21 +969,73 @@ class SpotifyDataManager:
             backup_filename = f"spoticron_backup_{timestamp}.db"
             backup_path = Path(self.config.backup_dir) / backup_filename
 
-            # For SQLite databases, we can just copy the file
+            # For SQLite databases, use the online backup API, which copies a
+            # consistent snapshot (WAL included) while other writers proceed
             if self.config.database_url.startswith("sqlite:"):
                 db_path = self.config.database_url.replace("sqlite:///", "")
                 if Path(db_path).exists():
-                    import shutil
-
-                    shutil.copy2(db_path, backup_path)
+                    import sqlite3
+
+                    source = sqlite3.connect(db_path)
+                    target = sqlite3.connect(str(backup_path))
+                    try:
+                        source.backup(target, pages=BACKUP_PAGES_PER_STEP, sleep=0.05)
+                    finally:
+                        target.close()
+                        source.close()
                     return str(backup_path)
 
             return None
 
         except Exception as e:
-            print(f"Error creating backup: {e}")
+            logger.error("Error creating backup: %s", e)
             return None
 
+    def _delete_older_than(
+        self, session: Session, model: Any, cutoff_date: datetime
+    ) -> int:
+        """
+        Delete rows created before a cutoff, in batches.
+
+        Each batch is committed on its own so a large cleanup doesn't build up
+        one huge transaction (and write-ahead log).
+
+        Args:
+            session: Active database session.
+            model: Mapped class with ``id`` and ``created_at`` columns.
+            cutoff_date: Rows created before this are deleted.
+
+        Returns:
+            Number of rows deleted.
+        """
+        deleted = 0
+        while True:
+            # Fetch the ids first: MySQL rejects a DELETE whose subquery reads
+            # the same table or uses LIMIT
+            batch_ids = (
+                session.execute(
+                    select(model.id)
+                    .where(model.created_at < cutoff_date)
+                    .limit(CLEANUP_BATCH_SIZE)
+                )
+                .scalars()
+                .all()
+            )
+            if not batch_ids:
+                return deleted
+
+            for id_batch in batch_process(batch_ids, SQL_IN_BATCH_SIZE):
+                session.execute(
+                    delete(model)
+                    .where(model.id.in_(id_batch))
+                    .execution_options(synchronize_session=False)
+                )
+            session.commit()
+
+            deleted += len(batch_ids)
+            if len(batch_ids) < CLEANUP_BATCH_SIZE:
+                return deleted
+
     def cleanup_old_data(self, days_to_keep: int = 365) -> bool:
         """
         Clean up old data beyond the specified retention period.
@@ -647,36 +1047,23 @@ class SpotifyDataManager:
             True if successful, False otherwise.
         """
         try:
-            session = self.session_factory()
-            cutoff_date = datetime.utcnow() - timedelta(days=days_to_keep)
-
-            # Delete old listening history
-            old_history = (
-                session.query(ListeningHistory)
-                .filter(ListeningHistory.created_at < cutoff_date)
-                .delete()
-            )
+            with self._session() as session:
+                cutoff_date = datetime.utcnow() - timedelta(days=days_to_keep)
 
-            # Delete old analysis snapshots
-            old_snapshots = (
-                session.query(AnalysisSnapshot)
-                .filter(AnalysisSnapshot.created_at < cutoff_date)
-                .delete()
-            )
-
-            session.commit()
-            session.close()
+                old_history = self._delete_older_than(
+                    session, ListeningHistory, cutoff_date
+                )
+                old_snapshots = self._delete_older_than(
+                    session, AnalysisSnapshot, cutoff_date
+                )
 
-            print(
-                f"Cleaned up {old_history} old listening records and {old_snapshots} old snapshots"
-            )
-            return True
+                print(
+                    f"Cleaned up {old_history} old listening records and {old_snapshots} old snapshots"
+                )
+                return True
 
         except Exception as e:
-            print(f"Error cleaning up old data: {e}")
-            if "session" in locals():
-                session.rollback()
-                session.close()
+            logger.error("Error cleaning up old data: %s", e)
             return False
 
 
@@ -2,21 +2,75 @@
 Historical stats module for analyzing Spotify listening patterns over time.
 """
 
-import json
-from collections import Counter
+import logging
+import threading
+import time
+from collections import Counter, defaultdict
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from functools import partial
+from itertools import chain
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import spotipy
 
 try:
+    from .api_cache import TOP_ITEMS_CACHE_TTL, ResponseCache
     from .auth import SpotifyAuthenticator
+    from .utils import (
+        DATACLASS_SLOTS,
+        calculate_entropy,
+        run_concurrently,
+        to_json_bytes,
+    )
 except ImportError:
+    from api_cache import TOP_ITEMS_CACHE_TTL, ResponseCache
     from auth import SpotifyAuthenticator
-
-
-@dataclass
+    from utils import (
+        DATACLASS_SLOTS,
+        calculate_entropy,
+        run_concurrently,
+        to_json_bytes,
+    )
+
+logger = logging.getLogger(__name__)
+
+# Concurrent API requests when fetching top data for several time ranges
+TOP_DATA_MAX_WORKERS = 8
+
+# How long fetched top data is reused by the analyses (in seconds)
+TOP_DATA_CACHE_TTL = 300
+
+# Most track IDs accepted by one audio-features request
+AUDIO_FEATURES_BATCH_SIZE = 100
+
+# Numeric audio features averaged into the per-range summaries
+AUDIO_FEATURE_KEYS = (
+    "danceability",
+    "energy",
+    "loudness",
+    "speechiness",
+    "acousticness",
+    "instrumentalness",
+    "liveness",
+    "valence",
+    "tempo",
+)
+
+# 0-1 scaled feature averages compared by the audio diversity score
+DIVERSITY_FEATURE_KEYS = (
+    "avg_danceability",
+    "avg_energy",
+    "avg_valence",
+    "avg_acousticness",
+)
+
+# Pulls all AUDIO_FEATURE_KEYS out of a features dict in one call
+_get_audio_feature_values = itemgetter(*AUDIO_FEATURE_KEYS)
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ListeningPeriod:
     """Data class for listening statistics over a period."""
 
@@ -33,7 +87,7 @@ class ListeningPeriod:
     listening_patterns: Dict[str, Any]
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class GenreAnalysis:
     """Data class for genre analysis."""
 
@@ -44,7 +98,7 @@ class GenreAnalysis:
     representative_artists: List[str]
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ArtistEvolution:
     """Data class for tracking artist popularity over time."""
 
@@ -56,18 +110,37 @@ class ArtistEvolution:
 class HistoricalStatsAnalyzer:
     """Analyzes historical Spotify data and listening patterns."""
 
-    def __init__(self, spotify_client: Optional[spotipy.Spotify] = None):
+    def __init__(
+        self,
+        spotify_client: Optional[spotipy.Spotify] = None,
+        cache: Optional[ResponseCache] = None,
+    ):
         """
         Initialize the historical stats analyzer.
 
         Args:
             spotify_client: Authenticated Spotify client.
+            cache: Response cache for top tracks/artists. If None, responses
+                are always fetched from the API.
         """
         if spotify_client is None:
             auth = SpotifyAuthenticator()
             spotify_client = auth.authenticate()
 
         self.spotify = spotify_client
+        self.cache = cache
+
+        # Top data shared by the analyses, keyed by the requested time ranges
+        self._top_data_cache: Dict[Tuple[str, ...], Tuple[float, Dict[str, Any]]] = {}
+        self._top_data_lock = threading.Lock()
+
+    def _cached_call(
+        self, key: str, ttl: float, fetch: Callable[..., Any], **kwargs: Any
+    ) -> Any:
+        """Call a Spotify API method, reusing a cached response when available."""
+        if self.cache is None:
+            return fetch(**kwargs)
+        return self.cache.get_or_fetch(key, ttl, fetch, **kwargs)
 
     def get_comprehensive_top_data(
         self, time_ranges: Optional[List[str]] = None
@@ -75,6 +148,10 @@ class HistoricalStatsAnalyzer:
         """
         Get comprehensive top tracks and artists data for multiple time ranges.
 
+        Results are cached on the analyzer for TOP_DATA_CACHE_TTL seconds, so
+        the analyses built on top of this data share a single sweep of API
+        requests while long-lived analyzers still pick up fresh data.
+
         Args:
             time_ranges: List of time ranges to analyze.
 
@@ -84,30 +161,73 @@ class HistoricalStatsAnalyzer:
         if time_ranges is None:
             time_ranges = ["short_term", "medium_term", "long_term"]
 
+        key = tuple(time_ranges)
+        with self._top_data_lock:
+            cached = self._top_data_cache.get(key)
+            now = time.monotonic()
+            if cached is None or now - cached[0] >= TOP_DATA_CACHE_TTL:
+                cached = (now, self._fetch_comprehensive_top_data(key))
+                self._top_data_cache[key] = cached
+            return cached[1]
+
+    def _fetch_comprehensive_top_data(
+        self, time_ranges: Tuple[str, ...]
+    ) -> Dict[str, Any]:
+        """Fetch and process top data for each time range from the API."""
         comprehensive_data = {
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "time_ranges": {},
         }
 
-        for time_range in time_ranges:
-            try:
-                # Get top tracks
-                top_tracks = self.spotify.current_user_top_tracks(
-                    time_range=time_range, limit=50
+        # The top tracks and artists requests for every range are independent,
+        # so issue them all at once
+        responses = run_concurrently(
+            {
+                # Same keys as LiveStatsCollector, so both share cached responses
+                f"{kind}:{time_range}": partial(
+                    self._cached_call,
+                    f"top_{kind}:{time_range}:50",
+                    TOP_ITEMS_CACHE_TTL,
+                    fetch,
+                    time_range=time_range,
+                    limit=50,
                 )
-
-                # Get top artists
-                top_artists = self.spotify.current_user_top_artists(
-                    time_range=time_range, limit=50
+                for time_range in time_ranges
+                for kind, fetch in (
+                    ("tracks", self.spotify.current_user_top_tracks),
+                    ("artists", self.spotify.current_user_top_artists),
                 )
+            },
+            max_workers=TOP_DATA_MAX_WORKERS,
+        )
+
+        # Audio features need the track IDs, so they follow as a second round
+        track_ids = {}
+        for time_range in time_ranges:
+            top_tracks = responses[f"tracks:{time_range}"]
+            if isinstance(top_tracks, dict) and "items" in top_tracks:
+                track_ids[time_range] = [track["id"] for track in top_tracks["items"]]
+        audio_features = run_concurrently(
+            {
+                time_range: partial(self._get_audio_features_summary, ids)
+                for time_range, ids in track_ids.items()
+            },
+            max_workers=TOP_DATA_MAX_WORKERS,
+        )
+
+        for time_range in time_ranges:
+            try:
+                top_tracks = responses[f"tracks:{time_range}"]
+                top_artists = responses[f"artists:{time_range}"]
+                for response in (top_tracks, top_artists):
+                    if isinstance(response, Exception):
+                        raise response
 
                 # Process and enrich data
                 if top_tracks and "items" in top_tracks:
                     tracks_data = self._process_top_tracks(top_tracks["items"])
-                    track_ids = [track["id"] for track in top_tracks["items"]]
                 else:
                     tracks_data = []
-                    track_ids = []
 
                 if top_artists and "items" in top_artists:
                     artists_data = self._process_top_artists(top_artists["items"])
@@ -116,15 +236,19 @@ class HistoricalStatsAnalyzer:
                     artists_data = []
                     genres = []
 
+                features_summary = audio_features.get(time_range, {})
+                if isinstance(features_summary, Exception):
+                    raise features_summary
+
                 comprehensive_data["time_ranges"][time_range] = {
                     "tracks": tracks_data,
                     "artists": artists_data,
                     "genres": genres,
-                    "audio_features": self._get_audio_features_summary(track_ids),
+                    "audio_features": features_summary,
                 }
 
             except Exception as e:
-                print(f"Error getting data for {time_range}: {e}")
+                logger.error("Error getting data for %s: %s", time_range, e)
                 comprehensive_data["time_ranges"][time_range] = None
 
         return comprehensive_data
@@ -170,19 +294,36 @@ class HistoricalStatsAnalyzer:
             Dictionary with discovery analysis.
         """
         try:
-            # Get recently played tracks for discovery analysis
-            recent_tracks = self.spotify.current_user_recently_played(limit=50)
-
-            # Get top tracks for comparison
-            top_tracks_short = self.spotify.current_user_top_tracks(
-                time_range="short_term", limit=50
+            # Get recently played tracks for discovery analysis, and top tracks
+            # for comparison; the two requests are independent
+            responses = run_concurrently(
+                {
+                    "recent": partial(
+                        self.spotify.current_user_recently_played, limit=50
+                    ),
+                    "top": partial(
+                        self._cached_call,
+                        "top_tracks:short_term:50",
+                        TOP_ITEMS_CACHE_TTL,
+                        self.spotify.current_user_top_tracks,
+                        time_range="short_term",
+                        limit=50,
+                    ),
+                }
             )
+            for response in responses.values():
+                if isinstance(response, Exception):
+                    raise response
+            recent_tracks = responses["recent"]
+            top_tracks_short = responses["top"]
 
             # Initialize with safe defaults
             if top_tracks_short and "items" in top_tracks_short:
-                top_track_ids = {track["id"] for track in top_tracks_short["items"]}
+                top_track_ids = frozenset(
+                    track["id"] for track in top_tracks_short["items"]
+                )
             else:
-                top_track_ids = set()
+                top_track_ids = frozenset()
 
             if recent_tracks and "items" in recent_tracks:
                 total_recent = len(recent_tracks["items"])
@@ -202,30 +343,20 @@ class HistoricalStatsAnalyzer:
             new_discoveries = []
             rediscovered = []
 
+            # Partition the recent plays in a single pass
             for item in recent_items:
                 track = item["track"]
-                if track["id"] not in top_track_ids:
-                    new_discoveries.append(
-                        {
-                            "track_name": track["name"],
-                            "artist_names": [
-                                artist["name"] for artist in track["artists"]
-                            ],
-                            "played_at": item["played_at"],
-                            "popularity": track.get("popularity", 0),
-                            "preview_url": track.get("preview_url"),
-                        }
-                    )
+                entry = {
+                    "track_name": track["name"],
+                    "artist_names": [artist["name"] for artist in track["artists"]],
+                    "played_at": item["played_at"],
+                }
+                if track["id"] in top_track_ids:
+                    rediscovered.append(entry)
                 else:
-                    rediscovered.append(
-                        {
-                            "track_name": track["name"],
-                            "artist_names": [
-                                artist["name"] for artist in track["artists"]
-                            ],
-                            "played_at": item["played_at"],
-                        }
-                    )
+                    entry["popularity"] = track.get("popularity", 0)
+                    entry["preview_url"] = track.get("preview_url")
+                    new_discoveries.append(entry)
 
             discovery_data["new_discoveries"] = new_discoveries
             discovery_data["rediscovered_tracks"] = rediscovered
@@ -236,7 +367,7 @@ class HistoricalStatsAnalyzer:
             return discovery_data
 
         except Exception as e:
-            print(f"Error analyzing discovery patterns: {e}")
+            logger.error("Error analyzing discovery patterns: %s", e)
             return {}
 
     def analyze_listening_diversity(self) -> Dict[str, Any]:
@@ -264,22 +395,26 @@ class HistoricalStatsAnalyzer:
                 # Calculate diversity metrics
                 unique_artists = len(
                     set(
-                        artist_id
-                        for track in tracks
-                        for artist_id in track.get("artist_ids", [])
+                        chain.from_iterable(
+                            track.get("artist_ids", ()) for track in tracks
+                        )
                     )
                 )
 
                 unique_genres = len(genres)
 
-                # Genre distribution entropy (measure of diversity)
-                genre_entropy = self._calculate_entropy([count for _, count in genres])
+                # Genre distribution entropy (measure of diversity); the counts
+                # and their total are shared with the dominance metric below
+                genre_counts = [count for _, count in genres]
+                genre_total = sum(genre_counts)
+                genre_entropy = self._calculate_entropy(genre_counts)
 
                 # Artist distribution (how concentrated listening is)
-                artist_play_distribution = Counter()
-                for track in tracks:
-                    for artist_name in track.get("artist_names", []):
-                        artist_play_distribution[artist_name] += 1
+                artist_play_distribution = Counter(
+                    chain.from_iterable(
+                        track.get("artist_names", ()) for track in tracks
+                    )
+                )
 
                 artist_entropy = self._calculate_entropy(
                     list(artist_play_distribution.values())
@@ -301,16 +436,14 @@ class HistoricalStatsAnalyzer:
                     "artist_entropy": artist_entropy,
                     "audio_feature_diversity": feature_diversity,
                     "top_genre_dominance": (
-                        genres[0][1] / sum(count for _, count in genres) * 100
-                        if genres
-                        else 0
+                        genre_counts[0] / genre_total * 100 if genre_total else 0
                     ),
                 }
 
             return diversity_metrics
 
         except Exception as e:
-            print(f"Error analyzing listening diversity: {e}")
+            logger.error("Error analyzing listening diversity: %s", e)
             return {}
 
     def get_mood_analysis(self) -> Dict[str, Any]:
@@ -358,12 +491,12 @@ class HistoricalStatsAnalyzer:
                 # Define mood categories based on audio features
                 mood_scores = self._calculate_mood_scores(audio_features)
 
-                # Get dominant mood safely
-                if mood_scores and any(score > 0 for score in mood_scores.values()):
-                    dominant_mood = max(
-                        mood_scores.keys(), key=lambda mood: mood_scores[mood]
-                    )
-                else:
+                # Get dominant mood safely; the top score also tells whether
+                # any mood registered at all
+                dominant_mood, top_score = max(
+                    mood_scores.items(), key=itemgetter(1), default=("unknown", 0)
+                )
+                if top_score <= 0:
                     dominant_mood = "unknown"
 
                 mood_analysis["time_ranges"][time_range] = {
@@ -377,29 +510,38 @@ class HistoricalStatsAnalyzer:
             return mood_analysis
 
         except Exception as e:
-            print(f"Error analyzing mood patterns: {e}")
+            logger.error("Error analyzing mood patterns: %s", e)
             return {"error": str(e), "audio_features_available": False}
 
     def _process_top_tracks(self, tracks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Process and enrich top tracks data."""
         processed_tracks = []
 
-        for i, track in enumerate(tracks):
+        for rank, track in enumerate(tracks, start=1):
+            album = track["album"]
+
+            # Collect artist names and IDs in a single pass
+            artist_names = []
+            artist_ids = []
+            for artist in track["artists"]:
+                artist_names.append(artist["name"])
+                artist_ids.append(artist["id"])
+
             processed_track = {
-                "rank": i + 1,
+                "rank": rank,
                 "track_name": track["name"],
                 "track_id": track["id"],
-                "artist_names": [artist["name"] for artist in track["artists"]],
-                "artist_ids": [artist["id"] for artist in track["artists"]],
-                "album_name": track["album"]["name"],
-                "album_id": track["album"]["id"],
+                "artist_names": artist_names,
+                "artist_ids": artist_ids,
+                "album_name": album["name"],
+                "album_id": album["id"],
                 "duration_ms": track["duration_ms"],
                 "popularity": track.get("popularity", 0),
                 "explicit": track.get("explicit", False),
                 "preview_url": track.get("preview_url"),
                 "external_urls": track.get("external_urls", {}),
-                "release_date": track["album"].get("release_date", ""),
-                "album_type": track["album"].get("album_type", ""),
+                "release_date": album.get("release_date", ""),
+                "album_type": album.get("album_type", ""),
             }
             processed_tracks.append(processed_track)
 
@@ -430,12 +572,9 @@ class HistoricalStatsAnalyzer:
         self, artists: List[Dict[str, Any]]
     ) -> List[Tuple[str, int]]:
         """Extract and count genres from artists."""
-        genre_counter = Counter()
-
-        for artist in artists:
-            for genre in artist.get("genres", []):
-                genre_counter[genre] += 1
-
+        genre_counter = Counter(
+            chain.from_iterable(artist.get("genres", ()) for artist in artists)
+        )
         return genre_counter.most_common()
 
     def _get_audio_features_summary(self, track_ids: List[str]) -> Dict[str, float]:
@@ -446,7 +585,10 @@ class HistoricalStatsAnalyzer:
 
             # Try to get audio features, but handle 403 errors gracefully
             try:
-                audio_features = self.spotify.audio_features(track_ids)
+                audio_features = []
+                for start in range(0, len(track_ids), AUDIO_FEATURES_BATCH_SIZE):
+                    batch = track_ids[start : start + AUDIO_FEATURES_BATCH_SIZE]
+                    audio_features.extend(self.spotify.audio_features(batch) or [])
             except Exception as api_error:
                 # Check if it's a 403 error (likely due to app restrictions)
                 if "403" in str(api_error):
@@ -460,37 +602,33 @@ class HistoricalStatsAnalyzer:
                     raise api_error
 
             # Filter out None values
-            if audio_features is not None:
-                valid_features = [f for f in audio_features if f is not None]
-            else:
-                valid_features = []
+            valid_features = [f for f in audio_features if f is not None]
 
             if not valid_features:
                 return {}
 
-            # Calculate averages for numeric features
-            feature_keys = [
-                "danceability",
-                "energy",
-                "loudness",
-                "speechiness",
-                "acousticness",
-                "instrumentalness",
-                "liveness",
-                "valence",
-                "tempo",
-            ]
-
-            summary = {}
-            for key in feature_keys:
-                values = [f[key] for f in valid_features if f.get(key) is not None]
-                if values:
-                    summary[f"avg_{key}"] = sum(values) / len(values)
-
-            return summary
+            # Average every numeric feature in a single pass over the tracks
+            totals = [0.0] * len(AUDIO_FEATURE_KEYS)
+            counts = [0] * len(AUDIO_FEATURE_KEYS)
+            for features in valid_features:
+                try:
+                    values = _get_audio_feature_values(features)
+                except KeyError:
+                    values = tuple(features.get(key) for key in AUDIO_FEATURE_KEYS)
+
+                for index, value in enumerate(values):
+                    if value is not None:
+                        totals[index] += value
+                        counts[index] += 1
+
+            return {
+                f"avg_{key}": total / count
+                for key, total, count in zip(AUDIO_FEATURE_KEYS, totals, counts)
+                if count
+            }
 
         except Exception as e:
-            print(f"Error getting audio features: {e}")
+            logger.error("Error getting audio features: %s", e)
             return {}
 
     def _analyze_artist_evolution(self, all_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -504,52 +642,64 @@ class HistoricalStatsAnalyzer:
 
         time_ranges = ["long_term", "medium_term", "short_term"]
 
-        # Get artist rankings for each time period
-        artist_rankings = {}
+        # Map each artist to its name and rank per time range in a single pass
+        artist_rankings: Dict[str, Dict[str, Any]] = defaultdict(dict)
         for time_range in time_ranges:
             data = all_data["time_ranges"].get(time_range)
             if data and data.get("artists"):
-                artist_rankings[time_range] = {
-                    artist["artist_id"]: {
-                        "rank": artist["rank"],
-                        "name": artist["artist_name"],
-                    }
-                    for artist in data["artists"]
-                }
+                for artist in data["artists"]:
+                    entry = artist_rankings[artist["artist_id"]]
+                    entry.setdefault("name", artist["artist_name"])
+                    entry[time_range] = artist["rank"]
 
-        # Analyze evolution patterns
-        long_term_artists = set(artist_rankings.get("long_term", {}).keys())
-        medium_term_artists = set(artist_rankings.get("medium_term", {}).keys())
-        short_term_artists = set(artist_rankings.get("short_term", {}).keys())
+        for artist_id, entry in artist_rankings.items():
+            long_rank = entry.get("long_term")
+            medium_rank = entry.get("medium_term")
+            short_rank = entry.get("short_term")
 
-        # Stable favorites (in all time ranges)
-        stable_artists = long_term_artists & medium_term_artists & short_term_artists
-        for artist_id in stable_artists:
-            artist_name = artist_rankings["long_term"][artist_id]["name"]
-            artist_evolution["stable_favorites"].append(
-                {
-                    "name": artist_name,
-                    "id": artist_id,
-                    "long_term_rank": artist_rankings["long_term"][artist_id]["rank"],
-                    "medium_term_rank": artist_rankings["medium_term"][artist_id][
-                        "rank"
-                    ],
-                    "short_term_rank": artist_rankings["short_term"][artist_id]["rank"],
-                }
-            )
+            if short_rank is None:
+                continue
 
-        # New discoveries (only in short term)
-        new_artists = short_term_artists - medium_term_artists - long_term_artists
-        for artist_id in new_artists:
-            if artist_id in artist_rankings.get("short_term", {}):
-                artist_name = artist_rankings["short_term"][artist_id]["name"]
+            if long_rank is None and medium_rank is None:
+                # New discoveries (only in short term)
                 artist_evolution["new_discoveries"].append(
                     {
-                        "name": artist_name,
+                        "name": entry["name"],
+                        "id": artist_id,
+                        "short_term_rank": short_rank,
+                    }
+                )
+                continue
+
+            if long_rank is not None and medium_rank is not None:
+                # Stable favorites (in all time ranges)
+                artist_evolution["stable_favorites"].append(
+                    {
+                        "name": entry["name"],
+                        "id": artist_id,
+                        "long_term_rank": long_rank,
+                        "medium_term_rank": medium_rank,
+                        "short_term_rank": short_rank,
+                    }
+                )
+                continue
+
+            # Rising/declining (in the short term and one longer range):
+            # recent rank compared with the longer-term one
+            previous_rank = long_rank if long_rank is not None else medium_rank
+            if short_rank != previous_rank:
+                key = (
+                    "rising_artists"
+                    if short_rank < previous_rank
+                    else "declining_artists"
+                )
+                artist_evolution[key].append(
+                    {
+                        "name": entry["name"],
                         "id": artist_id,
-                        "short_term_rank": artist_rankings["short_term"][artist_id][
-                            "rank"
-                        ],
+                        "previous_rank": previous_rank,
+                        "short_term_rank": short_rank,
+                        "rank_change": previous_rank - short_rank,
                     }
                 )
 
@@ -561,12 +711,14 @@ class HistoricalStatsAnalyzer:
 
         for time_range, data in all_data["time_ranges"].items():
             if data and data.get("genres"):
+                # Percentages are relative to all genres, not just the top 10
                 total_genre_count = sum(count for _, count in data["genres"])
+                scale = 100 / total_genre_count if total_genre_count else 0.0
                 genre_percentages = [
                     {
                         "genre": genre,
                         "count": count,
-                        "percentage": (count / total_genre_count) * 100,
+                        "percentage": count * scale,
                     }
                     for genre, count in data["genres"][:10]  # Top 10 genres
                 ]
@@ -587,23 +739,8 @@ class HistoricalStatsAnalyzer:
         return audio_evolution
 
     def _calculate_entropy(self, values: List[int]) -> float:
-        """Calculate entropy for diversity measurement."""
-        if not values:
-            return 0.0
-
-        total = sum(values)
-        if total == 0:
-            return 0.0
-
-        entropy = 0.0
-        for value in values:
-            if value > 0:
-                probability = value / total
-                import math
-
-                entropy -= probability * math.log2(probability)
-
-        return entropy
+        """Calculate entropy (in bits) for diversity measurement."""
+        return calculate_entropy(values)
 
     def _calculate_audio_feature_diversity(
         self, audio_features: Dict[str, float]
@@ -613,12 +750,11 @@ class HistoricalStatsAnalyzer:
             return 0.0
 
         # Normalize features to 0-1 range and calculate variance
-        features = ["avg_danceability", "avg_energy", "avg_valence", "avg_acousticness"]
-
-        feature_values = []
-        for feature in features:
-            if feature in audio_features:
-                feature_values.append(audio_features[feature])
+        feature_values = [
+            audio_features[feature]
+            for feature in DIVERSITY_FEATURE_KEYS
+            if feature in audio_features
+        ]
 
         if not feature_values:
             return 0.0
@@ -674,11 +810,11 @@ def export_historical_data(data: Dict[str, Any], filename: str):
         filename: Output filename.
     """
     try:
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(filename, "wb") as f:
+            f.write(to_json_bytes(data))
         print(f"Data exported to {filename}")
     except Exception as e:
-        print(f"Error exporting data: {e}")
+        logger.error("Error exporting data: %s", e)
 
 
 def format_evolution_summary(evolution_data: Dict[str, Any]) -> str:
@@ -724,24 +860,34 @@ def format_evolution_summary(evolution_data: Dict[str, Any]) -> str:
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
     # Test historical analysis
     try:
         analyzer = HistoricalStatsAnalyzer()
 
-        print("Analyzing listening evolution...")
-        evolution = analyzer.analyze_listening_evolution()
-        print(format_evolution_summary(evolution))
+        # The analyses are independent and share the analyzer's cached top
+        # data, so run them side by side
+        print("Analyzing evolution, discovery, diversity and mood patterns...")
+        results = run_concurrently(
+            {
+                "evolution": analyzer.analyze_listening_evolution,
+                "discovery": analyzer.get_discovery_patterns,
+                "diversity": analyzer.analyze_listening_diversity,
+                "mood": analyzer.get_mood_analysis,
+            }
+        )
+        for result in results.values():
+            if isinstance(result, Exception):
+                raise result
+        evolution = results["evolution"]
+        discovery = results["discovery"]
+        diversity = results["diversity"]
+        mood = results["mood"]
 
-        print("\nAnalyzing discovery patterns...")
-        discovery = analyzer.get_discovery_patterns()
+        print(format_evolution_summary(evolution))
         print(f"Discovery rate: {discovery.get('discovery_rate', 0):.1f}%")
 
-        print("\nAnalyzing listening diversity...")
-        diversity = analyzer.analyze_listening_diversity()
-
-        print("\nAnalyzing mood patterns...")
-        mood = analyzer.get_mood_analysis()
-
         # Export data
         all_analysis = {
             "evolution": evolution,
@@ -3,22 +3,80 @@ Live stats module for getting real-time Spotify data.
 """
 
 import time
-from dataclasses import asdict, dataclass
+from collections import Counter
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 
 import spotipy
-from rich.console import Console
+from rich.console import Console, Group
+from rich.live import Live
 from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
 
 try:
+    from .api_cache import TOP_ITEMS_CACHE_TTL, ResponseCache
     from .auth import SpotifyAuthenticator
+    from .utils import (
+        DATACLASS_SLOTS,
+        batch_process,
+        run_concurrently,
+        to_compact_json_bytes,
+    )
 except ImportError:
+    from api_cache import TOP_ITEMS_CACHE_TTL, ResponseCache
     from auth import SpotifyAuthenticator
+    from utils import (
+        DATACLASS_SLOTS,
+        batch_process,
+        run_concurrently,
+        to_compact_json_bytes,
+    )
+
+TIME_RANGES = ("short_term", "medium_term", "long_term")
+
+# Most track IDs Spotify accepts in one /tracks request
+TRACKS_BATCH_SIZE = 50
+
+# Seconds a recently played response is reused in memory. Responses are also
+# dropped whenever a new track starts, since that is when the history changes.
+RECENTLY_PLAYED_CACHE_TTL = 30
+
+# Longest time (in seconds) the monitor extrapolates playback progress from
+# its last poll before asking Spotify again, to pick up skips and pauses
+MONITOR_FULL_POLL_SECONDS = 20
+
+# Seconds to wait past a track's expected end before polling, so the next
+# track has started by the time it is fetched
+TRACK_BOUNDARY_GRACE_SECONDS = 0.5
 
+# Widest progress bar drawn by the monitor. Bars are sliced out of these
+# instead of being rebuilt from repeated characters on every redraw.
+MAX_PROGRESS_BAR_WIDTH = 60
+_BAR_FILLED = "█" * MAX_PROGRESS_BAR_WIDTH
+_BAR_EMPTY = "░" * MAX_PROGRESS_BAR_WIDTH
 
-@dataclass
+# Monitor header and footer, styled once instead of on every redraw
+_MONITOR_HEADER = Text(
+    "\n".join(
+        (
+            f"╭{'─' * 70}╮",
+            "│" + " " * 22 + "Enhanced Monitoring Mode" + " " * 22 + "│",
+            f"╰{'─' * 70}╯",
+        )
+    ),
+    style="bold blue",
+)
+_MONITOR_FOOTER = Text("💡 Press Ctrl+C to stop monitoring", style="dim italic")
+
+# Star ratings indexed by popularity // 20
+_POPULARITY_STARS = tuple("⭐" * n + "☆" * (5 - n) for n in range(6))
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class CurrentTrack:
     """Data class for current playing track information."""
 
@@ -37,8 +95,27 @@ class CurrentTrack:
     preview_url: Optional[str]
     timestamp: str
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dict, copying the list and dict fields."""
+        return {
+            "track_name": self.track_name,
+            "artist_names": list(self.artist_names),
+            "album_name": self.album_name,
+            "duration_ms": self.duration_ms,
+            "progress_ms": self.progress_ms,
+            "is_playing": self.is_playing,
+            "track_id": self.track_id,
+            "artist_ids": list(self.artist_ids),
+            "album_id": self.album_id,
+            "popularity": self.popularity,
+            "explicit": self.explicit,
+            "external_urls": dict(self.external_urls),
+            "preview_url": self.preview_url,
+            "timestamp": self.timestamp,
+        }
 
-@dataclass
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class RecentTrack:
     """Data class for recently played track information."""
 
@@ -55,8 +132,25 @@ class RecentTrack:
     external_urls: Dict[str, str]
     preview_url: Optional[str]
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dict, copying the list and dict fields."""
+        return {
+            "track_name": self.track_name,
+            "artist_names": list(self.artist_names),
+            "album_name": self.album_name,
+            "track_id": self.track_id,
+            "artist_ids": list(self.artist_ids),
+            "album_id": self.album_id,
+            "played_at": self.played_at,
+            "duration_ms": self.duration_ms,
+            "popularity": self.popularity,
+            "explicit": self.explicit,
+            "external_urls": dict(self.external_urls),
+            "preview_url": self.preview_url,
+        }
+
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class TopItem:
     """Data class for top tracks/artists information."""
 
@@ -75,21 +169,50 @@ class TopItem:
     images: Optional[List[Dict[str, Any]]] = None
 
 
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class MonitorTrack:
+    """Data class for a track listed in the monitoring display."""
+
+    name: str
+    artists: Tuple[str, ...]
+    played_at: Optional[str] = None
+
+
 class LiveStatsCollector:
     """Collects live statistics from Spotify API."""
 
-    def __init__(self, spotify_client: Optional[spotipy.Spotify] = None):
+    def __init__(
+        self,
+        spotify_client: Optional[spotipy.Spotify] = None,
+        cache: Optional[ResponseCache] = None,
+    ):
         """
         Initialize the live stats collector.
 
         Args:
             spotify_client: Authenticated Spotify client. If None, will authenticate.
+            cache: Response cache for top tracks/artists. If None, responses
+                are always fetched from the API.
         """
         if spotify_client is None:
             auth = SpotifyAuthenticator()
             spotify_client = auth.authenticate()
 
         self.spotify = spotify_client
+        self.cache = cache
+
+        # Recently played responses by limit, as (expires_at, track_id, response)
+        # where track_id is the track playing when the request was sent
+        self._recently_played: Dict[int, Tuple[float, Optional[str], Any]] = {}
+        self._last_track_id: Optional[str] = None
+
+    def _cached_call(
+        self, key: str, ttl: float, fetch: Callable[..., Any], **kwargs: Any
+    ) -> Any:
+        """Call a Spotify API method, reusing a cached response when available."""
+        if self.cache is None:
+            return fetch(**kwargs)
+        return self.cache.get_or_fetch(key, ttl, fetch, **kwargs)
 
     def get_current_track(self) -> Optional[CurrentTrack]:
         """
@@ -102,19 +225,22 @@ class LiveStatsCollector:
             current_playback = self.spotify.current_playback()
 
             if not current_playback or not current_playback.get("item"):
+                self._note_current_track(None)
                 return None
 
             track_data = current_playback["item"]
+            self._note_current_track(track_data["id"])
+            artist_names, artist_ids = _split_artists(track_data["artists"])
 
             return CurrentTrack(
                 track_name=track_data["name"],
-                artist_names=[artist["name"] for artist in track_data["artists"]],
+                artist_names=artist_names,
                 album_name=track_data["album"]["name"],
                 duration_ms=track_data["duration_ms"],
                 progress_ms=current_playback.get("progress_ms", 0),
                 is_playing=current_playback.get("is_playing", False),
                 track_id=track_data["id"],
-                artist_ids=[artist["id"] for artist in track_data["artists"]],
+                artist_ids=artist_ids,
                 album_id=track_data["album"]["id"],
                 popularity=track_data.get("popularity", 0),
                 explicit=track_data.get("explicit", False),
@@ -127,6 +253,38 @@ class LiveStatsCollector:
             print(f"Error getting current track: {e}")
             return None
 
+    def _note_current_track(self, track_id: Optional[str]) -> None:
+        """Drop cached recently played responses when the playing track changes."""
+        if track_id != self._last_track_id:
+            self._last_track_id = track_id
+            self._recently_played.clear()
+
+    def _fetch_recently_played(self, limit: int) -> Any:
+        """
+        Fetch recently played tracks, reusing a response from the last few seconds.
+
+        Args:
+            limit: Number of tracks to retrieve (max 50).
+
+        Returns:
+            Raw recently played response.
+        """
+        now = time.monotonic()
+        track_id = self._last_track_id
+        cached = self._recently_played.get(limit)
+        # A response fetched while an earlier track was playing is stale, even
+        # if it was stored after _note_current_track() cleared the cache
+        if cached is not None and cached[0] > now and cached[1] == track_id:
+            return cached[2]
+
+        results = self.spotify.current_user_recently_played(limit=limit)
+        self._recently_played[limit] = (
+            now + RECENTLY_PLAYED_CACHE_TTL,
+            track_id,
+            results,
+        )
+        return results
+
     def get_recently_played(self, limit: int = 50) -> List[RecentTrack]:
         """
         Get recently played tracks.
@@ -138,19 +296,20 @@ class LiveStatsCollector:
             List of RecentTrack objects.
         """
         try:
-            results = self.spotify.current_user_recently_played(limit=min(limit, 50))
+            results = self._fetch_recently_played(min(limit, 50))
             recent_tracks = []
 
             if results and "items" in results:
                 for item in results["items"]:
                     track = item["track"]
+                    artist_names, artist_ids = _split_artists(track["artists"])
 
                     recent_track = RecentTrack(
                         track_name=track["name"],
-                        artist_names=[artist["name"] for artist in track["artists"]],
+                        artist_names=artist_names,
                         album_name=track["album"]["name"],
                         track_id=track["id"],
-                        artist_ids=[artist["id"] for artist in track["artists"]],
+                        artist_ids=artist_ids,
                         album_id=track["album"]["id"],
                         played_at=item["played_at"],
                         duration_ms=track["duration_ms"],
@@ -181,22 +340,27 @@ class LiveStatsCollector:
             List of TopItem objects for tracks.
         """
         try:
-            results = self.spotify.current_user_top_tracks(
-                time_range=time_range, limit=min(limit, 50)
+            results = self._cached_call(
+                f"top_tracks:{time_range}:{min(limit, 50)}",
+                TOP_ITEMS_CACHE_TTL,
+                self.spotify.current_user_top_tracks,
+                time_range=time_range,
+                limit=min(limit, 50),
             )
 
             top_tracks = []
 
             if results and "items" in results:
                 for track in results["items"]:
+                    artist_names, artist_ids = _split_artists(track["artists"])
                     top_item = TopItem(
                         name=track["name"],
                         item_id=track["id"],
                         item_type="track",
                         popularity=track.get("popularity", 0),
                         external_urls=track.get("external_urls", {}),
-                        artist_names=[artist["name"] for artist in track["artists"]],
-                        artist_ids=[artist["id"] for artist in track["artists"]],
+                        artist_names=artist_names,
+                        artist_ids=artist_ids,
                         album_name=track["album"]["name"],
                         album_id=track["album"]["id"],
                         preview_url=track.get("preview_url"),
@@ -224,8 +388,12 @@ class LiveStatsCollector:
             List of TopItem objects for artists.
         """
         try:
-            results = self.spotify.current_user_top_artists(
-                time_range=time_range, limit=min(limit, 50)
+            results = self._cached_call(
+                f"top_artists:{time_range}:{min(limit, 50)}",
+                TOP_ITEMS_CACHE_TTL,
+                self.spotify.current_user_top_artists,
+                time_range=time_range,
+                limit=min(limit, 50),
             )
 
             top_artists = []
@@ -250,6 +418,111 @@ class LiveStatsCollector:
             print(f"Error getting top artists: {e}")
             return []
 
+    def get_top_tracks_and_artists(
+        self, time_range: str = "medium_term", limit: int = 20
+    ) -> Tuple[List[TopItem], List[TopItem]]:
+        """
+        Get user's top tracks and top artists for one time range at once.
+
+        Args:
+            time_range: 'short_term' (4 weeks), 'medium_term' (6 months), 'long_term' (years)
+            limit: Number of items to retrieve per list (max 50).
+
+        Returns:
+            Tuple of (top tracks, top artists).
+        """
+        results = run_concurrently(
+            {
+                "tracks": partial(self.get_top_tracks, time_range, limit),
+                "artists": partial(self.get_top_artists, time_range, limit),
+            }
+        )
+        # Both methods already swallow API errors, so this only guards the unexpected
+        return tuple(
+            [] if isinstance(results[key], Exception) else results[key]
+            for key in ("tracks", "artists")
+        )
+
+    def get_tracks_bulk(self, track_ids: Sequence[str]) -> List[Dict[str, Any]]:
+        """
+        Get full track objects for many track IDs.
+
+        IDs are sent in batches of TRACKS_BATCH_SIZE, and the batches are
+        fetched concurrently.
+
+        Args:
+            track_ids: Spotify track IDs.
+
+        Returns:
+            Track objects in the order of track_ids. Unknown IDs and batches
+            that failed to load are left out.
+        """
+        results = run_concurrently(
+            {
+                str(index): partial(self.spotify.tracks, batch)
+                for index, batch in enumerate(
+                    batch_process(track_ids, TRACKS_BATCH_SIZE)
+                )
+            }
+        )
+
+        # Results keep the insertion order of the batches
+        tracks = []
+        for result in results.values():
+            if isinstance(result, Exception):
+                print(f"Error getting tracks: {result}")
+                continue
+            tracks.extend(track for track in (result or {}).get("tracks", []) if track)
+        return tracks
+
+    def get_top_tracks_multi(
+        self, time_ranges: Sequence[str] = TIME_RANGES, limit: int = 20
+    ) -> Dict[str, List[TopItem]]:
+        """
+        Get user's top tracks for several time ranges at once.
+
+        Args:
+            time_ranges: Time ranges to fetch.
+            limit: Number of tracks to retrieve per time range (max 50).
+
+        Returns:
+            Dictionary mapping each time range to its list of TopItem objects.
+        """
+        return self._fetch_per_time_range(self.get_top_tracks, time_ranges, limit)
+
+    def get_top_artists_multi(
+        self, time_ranges: Sequence[str] = TIME_RANGES, limit: int = 20
+    ) -> Dict[str, List[TopItem]]:
+        """
+        Get user's top artists for several time ranges at once.
+
+        Args:
+            time_ranges: Time ranges to fetch.
+            limit: Number of artists to retrieve per time range (max 50).
+
+        Returns:
+            Dictionary mapping each time range to its list of TopItem objects.
+        """
+        return self._fetch_per_time_range(self.get_top_artists, time_ranges, limit)
+
+    def _fetch_per_time_range(
+        self,
+        fetch: Callable[[str, int], List[TopItem]],
+        time_ranges: Sequence[str],
+        limit: int,
+    ) -> Dict[str, List[TopItem]]:
+        """Run one top-items request per time range concurrently."""
+        results = run_concurrently(
+            {
+                time_range: partial(fetch, time_range, limit)
+                for time_range in time_ranges
+            }
+        )
+        return {
+            time_range: [] if isinstance(items, Exception) else items
+            for time_range, items in results.items()
+        }
+
     def get_playlist_tracks(
         self, playlist_id: Optional[str] = None, limit: Optional[int] = None
     ) -> List[Dict[str, Any]]:
@@ -281,11 +554,12 @@ class LiveStatsCollector:
 
                     for item in results["items"]:
                         track = item["track"]
+                        artist_names, artist_ids = _split_artists(track["artists"])
                         track_info = {
                             "name": track["name"],
                             "id": track["id"],
-                            "artists": [artist["name"] for artist in track["artists"]],
-                            "artist_ids": [artist["id"] for artist in track["artists"]],
+                            "artists": artist_names,
+                            "artist_ids": artist_ids,
                             "album": track["album"]["name"],
                             "album_id": track["album"]["id"],
                             "duration_ms": track["duration_ms"],
@@ -324,11 +598,12 @@ class LiveStatsCollector:
                             continue  # Skip empty entries
 
                         track = item["track"]
+                        artist_names, artist_ids = _split_artists(track["artists"])
                         track_info = {
                             "name": track["name"],
                             "id": track["id"],
-                            "artists": [artist["name"] for artist in track["artists"]],
-                            "artist_ids": [artist["id"] for artist in track["artists"]],
+                            "artists": artist_names,
+                            "artist_ids": artist_ids,
                             "album": track["album"]["name"],
                             "album_id": track["album"]["id"],
                             "duration_ms": track["duration_ms"],
@@ -429,40 +704,52 @@ class LiveStatsCollector:
         Returns:
             Dictionary with session summary information.
         """
-        current = self.get_current_track()
-        recent = self.get_recently_played(10)
+        # The two requests are independent, so overlap their round-trips
+        results = run_concurrently(
+            {
+                "current": self.get_current_track,
+                "recent": partial(self.get_recently_played, 10),
+            }
+        )
+        for result in results.values():
+            if isinstance(result, Exception):
+                raise result
+        current = results["current"]
+        recent = results["recent"]
+
+        # Tally the recent plays in a single pass
+        artist_counts: Counter = Counter()
+        unique_tracks = set()
+        total_duration = 0
+        for track in recent:
+            artist_counts.update(track.artist_names)
+            unique_tracks.add(track.track_id)
+            total_duration += track.duration_ms
 
         summary = {
             "timestamp": datetime.now(timezone.utc).isoformat(),
-            "current_track": asdict(current) if current else None,
+            "current_track": current.to_dict() if current else None,
             "is_active": current is not None and current.is_playing,
             "recent_tracks_count": len(recent),
-            "recent_artists": list(
-                set(artist for track in recent for artist in track.artist_names)
-            ),
-            "recent_unique_tracks": len(set(track.track_id for track in recent)),
+            "recent_artists": list(artist_counts),
+            "recent_unique_tracks": len(unique_tracks),
         }
 
         if recent:
             # Calculate session statistics
-            total_duration = sum(track.duration_ms for track in recent)
             summary["recent_total_duration_minutes"] = total_duration / (1000 * 60)
 
             # Most played artist in recent tracks
-            artist_counts = {}
-            for track in recent:
-                for artist in track.artist_names:
-                    artist_counts[artist] = artist_counts.get(artist, 0) + 1
-
             if artist_counts:
-                summary["most_recent_artist"] = max(
-                    artist_counts, key=lambda x: artist_counts[x]
-                )
+                summary["most_recent_artist"] = artist_counts.most_common(1)[0][0]
 
         return summary
 
     def monitor_listening(
-        self, duration_minutes: int = 10, interval_seconds: int = 30
+        self,
+        duration_minutes: int = 10,
+        interval_seconds: int = 30,
+        output_path: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
         Monitor listening activity for a specified duration.
@@ -470,27 +757,60 @@ class LiveStatsCollector:
         Args:
             duration_minutes: How long to monitor (in minutes).
             interval_seconds: How often to check (in seconds).
+            output_path: JSON Lines file to append snapshots to as they are
+                taken. If None, snapshots are collected in memory.
 
         Returns:
-            List of monitoring snapshots.
+            List of monitoring snapshots, or an empty list when they were
+            written to output_path.
         """
-        snapshots = []
-        start_time = time.time()
+        snapshots = self.iter_listening_snapshots(duration_minutes, interval_seconds)
+        if output_path is None:
+            return list(snapshots)
+
+        path = Path(output_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("ab") as f:
+            for snapshot in snapshots:
+                f.write(to_compact_json_bytes(snapshot) + b"\n")
+        return []
+
+    def iter_listening_snapshots(
+        self, duration_minutes: int = 10, interval_seconds: int = 30
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Take listening activity snapshots for a specified duration.
+
+        Args:
+            duration_minutes: How long to monitor (in minutes).
+            interval_seconds: How often to check (in seconds).
+
+        Yields:
+            Monitoring snapshots, one per interval.
+        """
+        start_time = time.monotonic()
         end_time = start_time + (duration_minutes * 60)
 
         print(f"Monitoring listening activity for {duration_minutes} minutes...")
 
-        while time.time() < end_time:
+        # Schedule snapshots against fixed deadlines so API latency doesn't
+        # stretch the interval
+        next_snapshot = start_time
+        while time.monotonic() < end_time:
+            next_snapshot += interval_seconds
             current = self.get_current_track()
 
+            # The track already carries the time it was fetched
             snapshot = {
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "current_track": asdict(current) if current else None,
+                "timestamp": (
+                    current.timestamp
+                    if current
+                    else datetime.now(timezone.utc).isoformat()
+                ),
+                "current_track": current.to_dict() if current else None,
                 "is_playing": current.is_playing if current else False,
             }
 
-            snapshots.append(snapshot)
-
             if current:
                 print(
                     f"Playing: {current.track_name} by {', '.join(current.artist_names)}"
@@ -498,9 +818,11 @@ class LiveStatsCollector:
             else:
                 print("No track currently playing")
 
-            time.sleep(interval_seconds)
+            yield snapshot
 
-        return snapshots
+            delay = next_snapshot - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
 
     def monitor_enhanced(
         self,
@@ -529,6 +851,10 @@ class LiveStatsCollector:
         last_track_id = None
         last_progress = 0
 
+        # Last track fetched from the API and when it was fetched
+        fetched: Optional[CurrentTrack] = None
+        fetched_at = 0.0
+
         console.print("🎵 Enhanced Monitoring Mode Started", style="bold green")
         if indefinite:
             console.print(
@@ -540,31 +866,42 @@ class LiveStatsCollector:
             )
         console.print("")
 
+        # Panels from the last redraw, keyed by section, with the data they show
+        panels: Dict[str, Tuple[Any, Panel]] = {}
+
         try:
-            while time.time() < end_time:
-                current = self.get_current_track()
-
-                # Check if we need to update the display
-                current_track_id = current.track_id if current else None
-                current_progress = current.progress_ms if current else 0
-
-                # Only update display if track changed or significant progress change
-                progress_change = (
-                    abs(current_progress - last_progress) > 10000
-                )  # 10 seconds
-                track_changed = current_track_id != last_track_id
-
-                if track_changed or progress_change or last_track_id is None:
-                    # Clear screen and update display
-                    console.clear()
-                    self._display_enhanced_monitoring_vertical(
-                        console, current, previous_tracks, next_tracks
-                    )
+            # Redraw in place rather than clearing the screen on every update
+            with Live(console=console, auto_refresh=False) as live:
+                while time.time() < end_time:
+                    now = time.monotonic()
+                    current = self._extrapolate_current_track(fetched, now - fetched_at)
+                    if current is None:
+                        current = self.get_current_track()
+                        fetched, fetched_at = current, now
+
+                    # Check if we need to update the display
+                    current_track_id = current.track_id if current else None
+                    current_progress = current.progress_ms if current else 0
+
+                    # Only update display if track changed or significant progress change
+                    progress_change = (
+                        abs(current_progress - last_progress) > 10000
+                    )  # 10 seconds
+                    track_changed = current_track_id != last_track_id
+
+                    if track_changed or progress_change or last_track_id is None:
+                        live.update(
+                            self._render_enhanced_monitoring_vertical(
+                                panels, current, previous_tracks, next_tracks
+                            ),
+                            refresh=True,
+                        )
 
-                    last_track_id = current_track_id
-                    last_progress = current_progress
+                        last_track_id = current_track_id
+                        last_progress = current_progress
 
-                time.sleep(interval_seconds)
+                    delay = self._next_poll_delay(current, interval_seconds)
+                    time.sleep(max(0.0, min(delay, end_time - time.time())))
 
         except KeyboardInterrupt:
             console.print("\n🛑 Monitoring stopped by user", style="bold red")
@@ -577,44 +914,108 @@ class LiveStatsCollector:
         else:
             console.print("\n✅ Monitoring session ended", style="bold green")
 
-    def _display_enhanced_monitoring_vertical(
+    @staticmethod
+    def _extrapolate_current_track(
+        track: Optional[CurrentTrack], elapsed_seconds: float
+    ) -> Optional[CurrentTrack]:
+        """
+        Estimate the playing track's progress without calling the API.
+
+        Args:
+            track: Track from the last API poll.
+            elapsed_seconds: Seconds since that poll.
+
+        Returns:
+            The track with its progress moved forward, or None if the API
+            should be polled: nothing was playing, playback was paused, the
+            poll is older than MONITOR_FULL_POLL_SECONDS or the track has
+            ended since.
+        """
+        if (
+            track is None
+            or not track.is_playing
+            or elapsed_seconds >= MONITOR_FULL_POLL_SECONDS
+        ):
+            return None
+
+        progress_ms = track.progress_ms + int(elapsed_seconds * 1000)
+        if progress_ms >= track.duration_ms:
+            return None
+        return replace(track, progress_ms=progress_ms)
+
+    @staticmethod
+    def _next_poll_delay(
+        current: Optional[CurrentTrack], interval_seconds: float
+    ) -> float:
+        """
+        Work out how long to sleep before the next monitoring poll.
+
+        Polls normally happen every interval_seconds, but when the playing
+        track ends sooner the poll is moved to just after its end, so track
+        changes show up without waiting for the rest of the interval.
+
+        Args:
+            current: Track from the last poll, or None if nothing is playing.
+            interval_seconds: Regular polling interval (in seconds).
+
+        Returns:
+            Number of seconds to sleep.
+        """
+        if current is None or not current.is_playing or not current.duration_ms:
+            return interval_seconds
+
+        remaining_seconds = max(current.duration_ms - current.progress_ms, 0) / 1000
+        return min(interval_seconds, remaining_seconds + TRACK_BOUNDARY_GRACE_SECONDS)
+
+    def _render_enhanced_monitoring_vertical(
         self,
-        console: Console,
+        panels: Dict[str, Tuple[Any, Panel]],
         current: Optional[CurrentTrack],
         previous_tracks: int,
         next_tracks: int,
-    ) -> None:
-        """Display the enhanced monitoring layout in vertical single column format."""
-        # Header with better spacing
-        console.print("")
-        header_line = "─" * 70
-        console.print(f"╭{header_line}╮", style="bold blue")
-        console.print(
-            "│" + " " * 22 + "Enhanced Monitoring Mode" + " " * 22 + "│",
-            style="bold blue",
-        )
-        console.print(f"╰{header_line}╯", style="bold blue")
-        console.print("")
-
-        # Get data for all sections
-        recent_tracks = self._get_recent_tracks_for_monitoring(previous_tracks)
-        upcoming_tracks = self._get_upcoming_tracks_for_monitoring(next_tracks)
+    ) -> Group:
+        """
+        Build the enhanced monitoring layout in vertical single column format.
 
-        # Create and display panels vertically
-        current_panel = self._create_current_track_panel_vertical(current)
-        console.print(current_panel)
-        console.print("")
+        Only panels whose data changed since the last call are rebuilt.
 
-        recent_panel = self._create_recent_tracks_panel_vertical(recent_tracks)
-        console.print(recent_panel)
-        console.print("")
+        Args:
+            panels: Panels from the previous render, updated in place.
+            current: Currently playing track, if any.
+            previous_tracks: Number of previous tracks to show.
+            next_tracks: Number of upcoming tracks to show.
 
-        upcoming_panel = self._create_upcoming_tracks_panel_vertical(upcoming_tracks)
-        console.print(upcoming_panel)
+        Returns:
+            Renderable for the whole monitoring display.
+        """
+        # Get data for all sections
+        recent_tracks, upcoming_tracks = self._get_monitoring_context(
+            previous_tracks, next_tracks
+        )
 
-        # Footer with controls
-        console.print("")
-        console.print("💡 Press Ctrl+C to stop monitoring", style="dim italic")
+        sections = (
+            ("current", current, self._create_current_track_panel_vertical),
+            ("recent", recent_tracks, self._create_recent_tracks_panel_vertical),
+            ("upcoming", upcoming_tracks, self._create_upcoming_tracks_panel_vertical),
+        )
+        for name, data, create_panel in sections:
+            cached = panels.get(name)
+            if cached is None or cached[0] != data:
+                panels[name] = (data, create_panel(data))
+
+        # Header, panels and footer stacked vertically with blank lines between
+        return Group(
+            "",
+            _MONITOR_HEADER,
+            "",
+            panels["current"][1],
+            "",
+            panels["recent"][1],
+            "",
+            panels["upcoming"][1],
+            "",
+            _MONITOR_FOOTER,
+        )
 
     def _display_enhanced_monitoring(
         self,
@@ -626,21 +1027,16 @@ class LiveStatsCollector:
         """Display the enhanced monitoring layout."""
         # Header with better spacing
         console.print("")
-        header_line = "─" * 70
-        console.print(f"╭{header_line}╮", style="bold blue")
-        console.print(
-            "│" + " " * 22 + "Enhanced Monitoring Mode" + " " * 22 + "│",
-            style="bold blue",
-        )
-        console.print(f"╰{header_line}╯", style="bold blue")
+        console.print(_MONITOR_HEADER)
         console.print("")
 
         # Three-column layout using Rich layout
         from rich.columns import Columns
 
         # Get data for all sections
-        recent_tracks = self._get_recent_tracks_for_monitoring(previous_tracks)
-        upcoming_tracks = self._get_upcoming_tracks_for_monitoring(next_tracks)
+        recent_tracks, upcoming_tracks = self._get_monitoring_context(
+            previous_tracks, next_tracks
+        )
 
         # Create panels for each section
         recent_panel = self._create_recent_tracks_panel(recent_tracks)
@@ -655,34 +1051,67 @@ class LiveStatsCollector:
 
         # Footer with controls
         console.print("")
-        console.print("💡 Press Ctrl+C to stop monitoring", style="dim italic")
+        console.print(_MONITOR_FOOTER)
 
-    def _get_recent_tracks_for_monitoring(self, limit: int) -> List[Dict[str, Any]]:
+    def _get_monitoring_context(
+        self, previous_tracks: int, next_tracks: int
+    ) -> Tuple[List[MonitorTrack], List[MonitorTrack]]:
+        """
+        Fetch recent and upcoming tracks for the monitoring display concurrently.
+
+        Args:
+            previous_tracks: Number of previous tracks to fetch.
+            next_tracks: Number of upcoming tracks to fetch.
+
+        Returns:
+            Tuple of (recent tracks, upcoming tracks).
+        """
+        results = run_concurrently(
+            {
+                "recent": partial(
+                    self._get_recent_tracks_for_monitoring, previous_tracks
+                ),
+                "upcoming": partial(
+                    self._get_upcoming_tracks_for_monitoring, next_tracks
+                ),
+            }
+        )
+        # Both helpers already swallow API errors, so this only guards the unexpected
+        return tuple(
+            [] if isinstance(results[key], Exception) else results[key]
+            for key in ("recent", "upcoming")
+        )
+
+    def _get_recent_tracks_for_monitoring(self, limit: int) -> List[MonitorTrack]:
         """Get recent tracks for monitoring display."""
         try:
             if not self.spotify:
                 return []
-            recent = self.spotify.current_user_recently_played(limit=limit)
+            recent = self._fetch_recently_played(limit)
             if not recent or "items" not in recent:
                 return []
             return [
-                {
-                    "name": item["track"]["name"],
-                    "artists": [artist["name"] for artist in item["track"]["artists"]],
-                    "played_at": item["played_at"],
-                }
+                MonitorTrack(
+                    name=item["track"]["name"],
+                    artists=tuple(
+                        artist["name"] for artist in item["track"]["artists"]
+                    ),
+                    played_at=item["played_at"],
+                )
                 for item in recent["items"]
             ]
         except Exception as e:
             print(f"Error getting recent tracks: {e}")
             return []
 
-    def _get_upcoming_tracks_for_monitoring(self, limit: int) -> List[Dict[str, Any]]:
+    def _get_upcoming_tracks_for_monitoring(self, limit: int) -> List[MonitorTrack]:
         """Get upcoming tracks in queue for monitoring display."""
         try:
             if not self.spotify:
                 return [
-                    {"name": "Queue unavailable", "artists": ["Not authenticated"]}
+                    MonitorTrack(
+                        name="Queue unavailable", artists=("Not authenticated",)
+                    )
                     for _ in range(limit)
                 ]
 
@@ -694,48 +1123,44 @@ class LiveStatsCollector:
                 for item in queue.get("queue", [])[:limit]:
                     if item and item.get("name"):
                         upcoming.append(
-                            {
-                                "name": item["name"],
-                                "artists": [
+                            MonitorTrack(
+                                name=item["name"],
+                                artists=tuple(
                                     artist["name"] for artist in item.get("artists", [])
-                                ],
-                            }
+                                ),
+                            )
                         )
 
             # If queue is empty or insufficient, show placeholder
             while len(upcoming) < limit:
                 upcoming.append(
-                    {
-                        "name": "No upcoming tracks",
-                        "artists": ["Queue is empty"],
-                    }
+                    MonitorTrack(
+                        name="No upcoming tracks",
+                        artists=("Queue is empty",),
+                    )
                 )
 
             return upcoming
         except Exception as e:
             print(f"Error getting queue: {e}")
             return [
-                {"name": "Queue unavailable", "artists": ["Error fetching queue"]}
+                MonitorTrack(
+                    name="Queue unavailable", artists=("Error fetching queue",)
+                )
                 for _ in range(limit)
             ]
 
-    def _create_recent_tracks_panel(self, recent_tracks: List[Dict[str, Any]]) -> Panel:
+    def _create_recent_tracks_panel(self, recent_tracks: List[MonitorTrack]) -> Panel:
         """Create panel for recent tracks."""
         if not recent_tracks:
             content = "\n[dim]No recent tracks available[/dim]\n"
         else:
             lines = [""]  # Start with empty line for consistent spacing
             for i, track in enumerate(recent_tracks, 1):
-                artist_str = ", ".join(track["artists"])
+                artist_str = ", ".join(track.artists)
                 # Truncate long names for better display
-                track_name = (
-                    track["name"][:28] + "..."
-                    if len(track["name"]) > 28
-                    else track["name"]
-                )
-                artist_name = (
-                    artist_str[:28] + "..." if len(artist_str) > 28 else artist_str
-                )
+                track_name = _truncate(track.name, 28)
+                artist_name = _truncate(artist_str, 28)
 
                 lines.append(f"{i}. [bold]{track_name}[/bold]")
                 lines.append(f"   [dim]{artist_name}[/dim]")
@@ -767,19 +1192,9 @@ class LiveStatsCollector:
             time_info = f"{format_duration(current.progress_ms)} / {format_duration(current.duration_ms)}"
 
             # Truncate long names for better display
-            track_name = (
-                current.track_name[:35] + "..."
-                if len(current.track_name) > 35
-                else current.track_name
-            )
-            artist_name = (
-                artist_str[:35] + "..." if len(artist_str) > 35 else artist_str
-            )
-            album_name = (
-                current.album_name[:35] + "..."
-                if len(current.album_name) > 35
-                else current.album_name
-            )
+            track_name = _truncate(current.track_name, 35)
+            artist_name = _truncate(artist_str, 35)
+            album_name = _truncate(current.album_name, 35)
 
             content = f"""
 🎵 [bold green]{track_name}[/bold green]
@@ -807,7 +1222,7 @@ class LiveStatsCollector:
         )
 
     def _create_upcoming_tracks_panel(
-        self, upcoming_tracks: List[Dict[str, Any]]
+        self, upcoming_tracks: List[MonitorTrack]
     ) -> Panel:
         """Create panel for upcoming tracks."""
         if not upcoming_tracks:
@@ -815,19 +1230,13 @@ class LiveStatsCollector:
         else:
             lines = [""]  # Start with empty line for consistent spacing
             for i, track in enumerate(upcoming_tracks, 1):
-                artist_str = ", ".join(track["artists"])
-                if track["name"] == "No upcoming tracks":
-                    lines.append(f"[dim]{track['name']}[/dim]")
+                artist_str = ", ".join(track.artists)
+                if track.name == "No upcoming tracks":
+                    lines.append(f"[dim]{track.name}[/dim]")
                 else:
                     # Truncate long names for better display
-                    track_name = (
-                        track["name"][:28] + "..."
-                        if len(track["name"]) > 28
-                        else track["name"]
-                    )
-                    artist_name = (
-                        artist_str[:28] + "..." if len(artist_str) > 28 else artist_str
-                    )
+                    track_name = _truncate(track.name, 28)
+                    artist_name = _truncate(artist_str, 28)
 
                     lines.append(f"{i}. [bold]{track_name}[/bold]")
                     lines.append(f"   [dim]{artist_name}[/dim]")
@@ -852,19 +1261,15 @@ class LiveStatsCollector:
         if duration_ms == 0:
             return "📊 ░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░ 0.0%"
 
-        percentage = (progress_ms / duration_ms) * 100
-        bar_width = 35  # Slightly shorter for better fit
-        filled_blocks = int((percentage / 100) * bar_width)
-        bar = "█" * filled_blocks + "░" * (bar_width - filled_blocks)
-
+        # Slightly shorter bar for better fit
+        bar, percentage = _progress_bar(progress_ms, duration_ms, 35)
         return f"📊 {bar} {percentage:.1f}%"
 
     def _format_popularity_stars(self, popularity: int) -> str:
         """Format popularity as star rating."""
-        stars = int(popularity / 20)  # Convert 0-100 to 0-5 stars
-        full_stars = "⭐" * stars
-        empty_stars = "☆" * (5 - stars)
-        return f"{full_stars}{empty_stars} ({popularity}/100)"
+        # Convert 0-100 to 0-5 stars
+        stars = _POPULARITY_STARS[min(max(popularity // 20, 0), 5)]
+        return f"{stars} ({popularity}/100)"
 
     def _create_current_track_panel_vertical(
         self, current: Optional[CurrentTrack]
@@ -905,7 +1310,7 @@ class LiveStatsCollector:
         )
 
     def _create_recent_tracks_panel_vertical(
-        self, recent_tracks: List[Dict[str, Any]]
+        self, recent_tracks: List[MonitorTrack]
     ) -> Panel:
         """Create vertical panel for recent tracks with more space."""
         if not recent_tracks:
@@ -913,9 +1318,9 @@ class LiveStatsCollector:
         else:
             lines = [""]
             for i, track in enumerate(recent_tracks, 1):
-                artist_str = ", ".join(track["artists"])
+                artist_str = ", ".join(track.artists)
                 lines.append(
-                    f"{i}. [bold]{track['name']}[/bold] - [dim]{artist_str}[/dim]"
+                    f"{i}. [bold]{track.name}[/bold] - [dim]{artist_str}[/dim]"
                 )
             lines.append("")
             content = "\n".join(lines)
@@ -929,7 +1334,7 @@ class LiveStatsCollector:
         )
 
     def _create_upcoming_tracks_panel_vertical(
-        self, upcoming_tracks: List[Dict[str, Any]]
+        self, upcoming_tracks: List[MonitorTrack]
     ) -> Panel:
         """Create vertical panel for upcoming tracks with more space."""
         if not upcoming_tracks:
@@ -937,12 +1342,12 @@ class LiveStatsCollector:
         else:
             lines = [""]
             for i, track in enumerate(upcoming_tracks, 1):
-                artist_str = ", ".join(track["artists"])
-                if track["name"] == "No upcoming tracks":
-                    lines.append(f"[dim]{track['name']}[/dim]")
+                artist_str = ", ".join(track.artists)
+                if track.name == "No upcoming tracks":
+                    lines.append(f"[dim]{track.name}[/dim]")
                 else:
                     lines.append(
-                        f"{i}. [bold]{track['name']}[/bold] - [dim]{artist_str}[/dim]"
+                        f"{i}. [bold]{track.name}[/bold] - [dim]{artist_str}[/dim]"
                     )
             lines.append("")
             content = "\n".join(lines)
@@ -960,14 +1365,65 @@ class LiveStatsCollector:
         if duration_ms == 0:
             return "📊 " + "░" * 60 + " 0.0%"
 
-        percentage = (progress_ms / duration_ms) * 100
-        bar_width = 60  # Wider bar for single column layout
-        filled_blocks = int((percentage / 100) * bar_width)
-        bar = "█" * filled_blocks + "░" * (bar_width - filled_blocks)
-
+        # Wider bar for single column layout
+        bar, percentage = _progress_bar(progress_ms, duration_ms, 60)
         return f"📊 {bar} {percentage:.1f}%"
 
 
+def _split_artists(artists: List[Dict[str, Any]]) -> Tuple[List[str], List[str]]:
+    """
+    Collect artist names and IDs from a track's artist list in one pass.
+
+    Args:
+        artists: Artist objects from a Spotify track.
+
+    Returns:
+        Tuple of (artist names, artist IDs).
+    """
+    names: List[str] = []
+    ids: List[str] = []
+    for artist in artists:
+        names.append(artist["name"])
+        ids.append(artist["id"])
+    return names, ids
+
+
+@lru_cache(maxsize=2048)
+def _truncate(text: str, max_length: int) -> str:
+    """
+    Shorten text for display, caching results across monitor redraws.
+
+    Args:
+        text: Text to shorten.
+        max_length: Number of characters kept before the ellipsis.
+
+    Returns:
+        The text, cut to max_length characters plus "..." if longer.
+    """
+    return text[:max_length] + "..." if len(text) > max_length else text
+
+
+def _progress_bar(
+    progress_ms: int, duration_ms: int, bar_width: int
+) -> Tuple[str, float]:
+    """
+    Build a text progress bar for a track.
+
+    Args:
+        progress_ms: Playback position in milliseconds.
+        duration_ms: Track length in milliseconds (must be non-zero).
+        bar_width: Number of characters in the bar, at most
+            MAX_PROGRESS_BAR_WIDTH.
+
+    Returns:
+        Tuple of (bar, percentage played).
+    """
+    percentage = (progress_ms / duration_ms) * 100
+    filled_blocks = min(max(int((percentage / 100) * bar_width), 0), bar_width)
+    bar = _BAR_FILLED[:filled_blocks] + _BAR_EMPTY[: bar_width - filled_blocks]
+    return bar, percentage
+
+
 def format_duration(duration_ms: int) -> str:
     """
     Format duration from milliseconds to readable format.
@@ -978,10 +1434,8 @@ def format_duration(duration_ms: int) -> str:
     Returns:
         Formatted duration string (e.g., "3:45").
     """
-    seconds = duration_ms // 1000
-    minutes = seconds // 60
-    remaining_seconds = seconds % 60
-    return f"{minutes}:{remaining_seconds:02d}"
+    minutes, seconds = divmod(duration_ms // 1000, 60)
+    return f"{minutes}:{seconds:02d}"
 
 
 def print_current_track(track: CurrentTrack):
@@ -1032,11 +1486,10 @@ def print_current_track(track: CurrentTrack):
     track_info.add_row("", "")  # Spacing
 
     # Progress bar with better visual
-    progress_blocks = int(progress_pct // 2)
-    remaining_blocks = 50 - progress_blocks
+    progress_blocks = min(max(int(progress_pct // 2), 0), 50)
     progress_bar = (
-        f"[bright_green]{'█' * progress_blocks}[/bright_green]"
-        + f"[dim]{'░' * remaining_blocks}[/dim]"
+        f"[bright_green]{_BAR_FILLED[:progress_blocks]}[/bright_green]"
+        + f"[dim]{_BAR_EMPTY[:50 - progress_blocks]}[/dim]"
     )
     track_info.add_row(
         "📊", f"{progress_bar} [bright_cyan]{progress_pct:.1f}%[/bright_cyan]"
@@ -1044,8 +1497,7 @@ def print_current_track(track: CurrentTrack):
     track_info.add_row("", "")  # Spacing
 
     # Popularity with stars
-    full_stars = track.popularity // 20
-    stars = "⭐" * full_stars + "☆" * (5 - full_stars)
+    stars = _POPULARITY_STARS[min(max(track.popularity // 20, 0), 5)]
     track_info.add_row("⭐", f"{stars} [dim]({track.popularity}/100)[/dim]")
 
     # Create main panel
@@ -1057,19 +1509,21 @@ def print_current_track(track: CurrentTrack):
         expand=False,
     )
 
-    console.print(panel)
-
     # Add extra info if available
     extras = []
     if track.preview_url:
         extras.append(f"🔗 [link={track.preview_url}]Preview Available[/link]")
-    if hasattr(track, "explicit") and track.explicit:
+    if track.explicit:
         extras.append("🚫 [red]Explicit[/red]")
 
+    # Print the panel, extras and trailing blank line in a single write
+    renderables: List[Any] = [panel]
     if extras:
-        console.print(" ".join(extras), style="dim", justify="center")
-
-    console.print()
+        renderables.append(
+            Text.from_markup(" ".join(extras), style="dim", justify="center")
+        )
+    renderables.append("")
+    console.print(Group(*renderables))
 
 
 if __name__ == "__main__":
@@ -1077,8 +1531,20 @@ if __name__ == "__main__":
     try:
         collector = LiveStatsCollector()
 
+        # The requests are independent, so send them side by side
+        results = run_concurrently(
+            {
+                "current": collector.get_current_track,
+                "recent": partial(collector.get_recently_played, 5),
+                "top": partial(collector.get_top_tracks_and_artists, "medium_term", 5),
+            }
+        )
+        for result in results.values():
+            if isinstance(result, Exception):
+                raise result
+
         # Test current track
-        current = collector.get_current_track()
+        current = results["current"]
         if current:
             print_current_track(current)
         else:
@@ -1088,7 +1554,7 @@ if __name__ == "__main__":
         print("\n" + "=" * 50)
         print("🕒 RECENTLY PLAYED (Last 5)")
         print("=" * 50)
-        recent = collector.get_recently_played(5)
+        recent = results["recent"]
         for i, track in enumerate(recent, 1):
             print(f"{i}. {track.track_name} by {', '.join(track.artist_names)}")
 
@@ -1096,7 +1562,7 @@ if __name__ == "__main__":
         print("\n" + "=" * 50)
         print("🏆 TOP TRACKS (Medium Term)")
         print("=" * 50)
-        top_tracks = collector.get_top_tracks("medium_term", 5)
+        top_tracks, top_artists = results["top"]
         for i, track in enumerate(top_tracks, 1):
             artists = ", ".join(track.artist_names) if track.artist_names else "Unknown"
             print(f"{i}. {track.name} by {artists}")
@@ -1105,7 +1571,6 @@ if __name__ == "__main__":
         print("\n" + "=" * 50)
         print("🌟 TOP ARTISTS (Medium Term)")
         print("=" * 50)
-        top_artists = collector.get_top_artists("medium_term", 5)
         for i, artist in enumerate(top_artists, 1):
             genres_str = ", ".join(artist.genres[:3]) if artist.genres else "N/A"
             print(f"{i}. {artist.name} (Genres: {genres_str})")
@@ -0,0 +1,229 @@
+"""
+Client-side rate limiting for Spotify API requests.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+import requests
+import spotipy
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Length of the sliding request window (in seconds)
+RATE_WINDOW_SECONDS = 60.0
+
+# Number of GET responses kept for ETag revalidation
+ETAG_CACHE_SIZE = 128
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """
+    HTTP adapter that throttles outgoing requests and backs off on HTTP 429.
+
+    Requests are held back once the sliding-window budget is spent, and the
+    number of requests in flight is adjusted AIMD-style: it shrinks
+    multiplicatively whenever Spotify answers 429 and grows additively on
+    every other response.
+
+    GET responses carrying an ETag are remembered, and repeat requests for
+    the same URL are sent with If-None-Match. When Spotify answers
+    304 Not Modified, the remembered body is returned as a 200 response, so
+    unchanged data isn't transferred again.
+    """
+
+    DECREASE_FACTOR = 0.5
+    INCREASE_STEP = 0.5
+
+    def __init__(
+        self,
+        requests_per_minute: int = 180,
+        max_concurrency: int = 8,
+        max_rate_limit_retries: int = 3,
+        max_retry_after: float = 60.0,
+        **kwargs: Any,
+    ):
+        """
+        Initialize the adapter.
+
+        Args:
+            requests_per_minute: Maximum requests started per sliding minute.
+            max_concurrency: Upper bound on requests in flight at once.
+            max_rate_limit_retries: How often a 429 response is retried.
+            max_retry_after: Longest Retry-After (in seconds) worth waiting
+                for; longer waits return the 429 response to the caller.
+            **kwargs: Passed through to HTTPAdapter.
+        """
+        super().__init__(**kwargs)
+        self.requests_per_minute = requests_per_minute
+        self.max_concurrency = max_concurrency
+        self.max_rate_limit_retries = max_rate_limit_retries
+        self.max_retry_after = max_retry_after
+
+        self._condition = threading.Condition()
+        self._request_times: Deque[float] = deque()
+        self._concurrency = float(max_concurrency)
+        self._in_flight = 0
+
+        # ETag and body of recent GET responses, keyed by URL
+        self._etag_lock = threading.Lock()
+        self._etags: Dict[str, Tuple[str, bytes]] = {}
+
+    @property
+    def concurrency(self) -> float:
+        """Current concurrency limit."""
+        return self._concurrency
+
+    def wait_if_throttled(self) -> None:
+        """Block until the request window and concurrency limit allow a request."""
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                while (
+                    self._request_times
+                    and now - self._request_times[0] >= RATE_WINDOW_SECONDS
+                ):
+                    self._request_times.popleft()
+
+                window_full = len(self._request_times) >= self.requests_per_minute
+                if not window_full and self._in_flight < int(self._concurrency):
+                    self._request_times.append(now)
+                    self._in_flight += 1
+                    return
+
+                # Wake up when the oldest request leaves the window, or when
+                # an in-flight request finishes
+                timeout = (
+                    RATE_WINDOW_SECONDS - (now - self._request_times[0])
+                    if window_full
+                    else None
+                )
+                self._condition.wait(timeout)
+
+    def send(
+        self, request: requests.PreparedRequest, **kwargs: Any
+    ) -> requests.Response:
+        """Send a request, revalidating cached GET responses by ETag."""
+        cached = self._add_etag_validator(request)
+        response = self._send_throttled(request, **kwargs)
+        return self._apply_etag(request, response, cached)
+
+    def _send_throttled(
+        self, request: requests.PreparedRequest, **kwargs: Any
+    ) -> requests.Response:
+        """Send a request, waiting out rate limits and retrying on HTTP 429."""
+        attempt = 0
+        while True:
+            self.wait_if_throttled()
+            throttled = False
+            try:
+                response = super().send(request, **kwargs)
+                throttled = response.status_code == 429
+            finally:
+                self._release(throttled)
+
+            if not throttled or attempt >= self.max_rate_limit_retries:
+                return response
+
+            retry_after = self._parse_retry_after(response)
+            if retry_after > self.max_retry_after:
+                return response
+
+            response.close()
+            time.sleep(retry_after)
+            attempt += 1
+
+    def _add_etag_validator(
+        self, request: requests.PreparedRequest
+    ) -> Optional[Tuple[str, bytes]]:
+        """Add If-None-Match to a GET request whose URL has a cached ETag."""
+        if request.method != "GET" or not request.url:
+            return None
+
+        with self._etag_lock:
+            cached = self._etags.get(request.url)
+        if cached is not None:
+            request.headers["If-None-Match"] = cached[0]
+        return cached
+
+    def _apply_etag(
+        self,
+        request: requests.PreparedRequest,
+        response: requests.Response,
+        cached: Optional[Tuple[str, bytes]],
+    ) -> requests.Response:
+        """Serve a 304 from the cached body, or remember a new ETag."""
+        if cached is not None and response.status_code == 304:
+            response.status_code = 200
+            response.reason = "OK"
+            response._content = cached[1]
+            return response
+
+        etag = response.headers.get("ETag")
+        if request.method == "GET" and response.status_code == 200 and etag:
+            with self._etag_lock:
+                self._etags.pop(request.url, None)
+                if len(self._etags) >= ETAG_CACHE_SIZE:
+                    # Dicts keep insertion order, so this drops the oldest entry
+                    del self._etags[next(iter(self._etags))]
+                self._etags[request.url] = (etag, response.content)
+        return response
+
+    def _release(self, throttled: bool) -> None:
+        """Free an in-flight slot and adjust the concurrency limit."""
+        with self._condition:
+            self._in_flight -= 1
+            if throttled:
+                self._concurrency = max(1.0, self._concurrency * self.DECREASE_FACTOR)
+            else:
+                self._concurrency = min(
+                    float(self.max_concurrency),
+                    self._concurrency + self.INCREASE_STEP,
+                )
+            self._condition.notify_all()
+
+    @staticmethod
+    def _parse_retry_after(response: requests.Response) -> float:
+        """Read the Retry-After header (in seconds), defaulting to one second."""
+        try:
+            return max(float(response.headers.get("Retry-After", 1)), 0.0)
+        except (TypeError, ValueError):
+            return 1.0
+
+
+def install_rate_limiter(
+    spotify: spotipy.Spotify, **kwargs: Any
+) -> Optional[RateLimitedAdapter]:
+    """
+    Mount a RateLimitedAdapter on a Spotify client's requests session.
+
+    The client's own retry policy is kept for connection errors and server
+    errors; 429 responses are left to the adapter.
+
+    Args:
+        spotify: Spotify client to throttle.
+        **kwargs: Passed through to RateLimitedAdapter.
+
+    Returns:
+        The mounted adapter, or None if the client has no requests session.
+    """
+    session = getattr(spotify, "_session", None)
+    if not isinstance(session, requests.Session):
+        return None
+
+    retry = Retry(
+        total=spotify.retries,
+        connect=None,
+        read=False,
+        allowed_methods=frozenset(["GET", "POST", "PUT", "DELETE"]),
+        status=spotify.status_retries,
+        backoff_factor=spotify.backoff_factor,
+        status_forcelist=[code for code in spotify.status_forcelist if code != 429],
+    )
+
+    adapter = RateLimitedAdapter(max_retries=retry, **kwargs)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return adapter
@@ -4,10 +4,21 @@ Utility functions for Spoticron application.
 
 import json
 import math
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+# Keyword arguments giving a dataclass __slots__ where supported (Python 3.10+)
+DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 def format_duration(milliseconds: int) -> str:
@@ -23,16 +34,12 @@ def format_duration(milliseconds: int) -> str:
     if milliseconds is None:
         return "0:00"
 
-    seconds = milliseconds // 1000
-    minutes = seconds // 60
-    hours = minutes // 60
-
-    remaining_seconds = seconds % 60
-    remaining_minutes = minutes % 60
+    minutes, seconds = divmod(milliseconds // 1000, 60)
+    hours, minutes = divmod(minutes, 60)
 
     if hours > 0:
-        return f"{hours}:{remaining_minutes:02d}:{remaining_seconds:02d}"
-    return f"{remaining_minutes}:{remaining_seconds:02d}"
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes}:{seconds:02d}"
 
 
 def format_number(number: int) -> str:
@@ -143,6 +150,40 @@ def ensure_directory_exists(path: str) -> Path:
     return dir_path
 
 
+def to_json_bytes(data: Any) -> bytes:
+    """
+    Serialize data to indented UTF-8 JSON.
+
+    Uses orjson when it is installed and falls back to the standard library.
+
+    Args:
+        data: JSON-serializable data.
+
+    Returns:
+        Encoded JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def to_compact_json_bytes(data: Any) -> bytes:
+    """
+    Serialize data to single-line UTF-8 JSON.
+
+    Uses orjson when it is installed and falls back to the standard library.
+
+    Args:
+        data: JSON-serializable data.
+
+    Returns:
+        Encoded JSON document without indentation.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
 def load_json_file(filepath: str) -> Optional[Dict[str, Any]]:
     """
     Load JSON data from file.
@@ -154,8 +195,10 @@ def load_json_file(filepath: str) -> Optional[Dict[str, Any]]:
         Loaded JSON data or None if failed.
     """
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            return json.load(f)
+        content = Path(filepath).read_bytes()
+        if orjson is not None:
+            return orjson.loads(content)
+        return json.loads(content)
     except (FileNotFoundError, json.JSONDecodeError, Exception) as e:
         print(f"Error loading JSON file {filepath}: {e}")
         return None
@@ -176,8 +219,7 @@ def save_json_file(data: Dict[str, Any], filepath: str) -> bool:
         # Ensure directory exists
         Path(filepath).parent.mkdir(parents=True, exist_ok=True)
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        Path(filepath).write_bytes(to_json_bytes(data))
         return True
     except Exception as e:
         print(f"Error saving JSON file {filepath}: {e}")
@@ -189,25 +231,21 @@ def calculate_entropy(values: List[float]) -> float:
     Calculate Shannon entropy for a list of values.
 
     Args:
-        values: List of numeric values.
+        values: List of numeric values (counts or weights; non-positive
+            values are ignored).
 
     Returns:
-        Entropy value.
+        Entropy in bits (base-2 logarithm).
     """
-    if not values:
-        return 0.0
-
-    total = sum(values)
+    positive = [value for value in values if value > 0]
+    total = sum(positive)
     if total == 0:
         return 0.0
 
-    entropy = 0.0
-    for value in values:
-        if value > 0:
-            probability = value / total
-            entropy -= probability * math.log2(probability)
-
-    return entropy
+    # -sum(p * log2(p)) with p = v / total, rearranged so the loop needs no
+    # per-value division: log2(total) - sum(v * log2(v)) / total
+    log2 = math.log2
+    return max(log2(total) - sum(v * log2(v) for v in positive) / total, 0.0)
 
 
 def get_mood_from_features(audio_features: Dict[str, float]) -> str:
@@ -261,21 +299,55 @@ def generate_timestamp_filename(prefix: str, extension: str = "json") -> str:
     return f"{prefix}_{timestamp}.{extension}"
 
 
-def batch_process(items: List[Any], batch_size: int = 50) -> List[List[Any]]:
+def batch_process(items: Iterable[Any], batch_size: int = 50) -> Iterator[List[Any]]:
     """
     Split items into batches for processing.
 
+    Batches are produced lazily, so only one is held in memory at a time.
+
     Args:
-        items: List of items to batch.
+        items: Items to batch.
         batch_size: Size of each batch.
 
+    Yields:
+        Lists of up to batch_size items.
+    """
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def run_concurrently(
+    calls: Dict[str, Callable[[], Any]], max_workers: int = 5
+) -> Dict[str, Any]:
+    """
+    Run independent callables concurrently on a thread pool.
+
+    Spotify API calls are I/O bound, so running them on threads overlaps their
+    network round-trips. An exception raised by one callable is returned in
+    place of its result instead of aborting the rest of the batch.
+
+    Args:
+        calls: Mapping of result keys to zero-argument callables.
+        max_workers: Maximum number of calls in flight at once.
+
     Returns:
-        List of batches.
+        Dictionary mapping each key to its callable's result or exception.
     """
-    batches = []
-    for i in range(0, len(items), batch_size):
-        batches.append(items[i : i + batch_size])
-    return batches
+    if not calls:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as executor:
+        futures = {key: executor.submit(call) for key, call in calls.items()}
+
+    results = {}
+    for key, future in futures.items():
+        error = future.exception()
+        results[key] = error if error is not None else future.result()
+    return results
 
 
 def retry_on_error(func, max_retries: int = 3, delay: float = 1.0):
@@ -321,8 +393,25 @@ def validate_spotify_id(spotify_id: str) -> bool:
     if not spotify_id or not isinstance(spotify_id, str):
         return False
 
-    # Spotify IDs are typically 22 characters long, base62 encoded
-    return len(spotify_id) == 22 and spotify_id.isalnum()
+    # Spotify IDs are typically 22 characters long, base62 encoded. isalnum()
+    # alone also accepts non-ASCII letters and digits, so check ASCII first.
+    return len(spotify_id) == 22 and spotify_id.isascii() and spotify_id.isalnum()
+
+
+# Characters that are unsafe in file names, mapped to replacements (None drops them)
+_CLEAN_TEXT_TABLE = str.maketrans(
+    {
+        "/": "_",
+        "\\": "_",
+        ":": "_",
+        "|": "_",
+        "<": None,
+        ">": None,
+        "?": None,
+        "*": None,
+        '"': "'",
+    }
+)
 
 
 def clean_text(text: str) -> str:
@@ -339,11 +428,7 @@ def clean_text(text: str) -> str:
         return ""
 
     # Remove or replace problematic characters
-    cleaned = text.replace("/", "_").replace("\\", "_").replace(":", "_")
-    cleaned = cleaned.replace("<", "").replace(">", "").replace("|", "_")
-    cleaned = cleaned.replace("?", "").replace("*", "").replace('"', "'")
-
-    return cleaned.strip()
+    return text.translate(_CLEAN_TEXT_TABLE).strip()
 
 
 def percentage_change(old_value: float, new_value: float) -> float:
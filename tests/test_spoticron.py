@@ -2,18 +2,39 @@
 Basic tests for Spoticron modules.
 """
 
+import json
 import os
 import sys
+import tempfile
 import unittest
+from datetime import datetime, timedelta
 from unittest.mock import Mock, patch
 
+import requests
+
 # Add src directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+# Add the repository root so the CLI module can be imported
+sys.path.insert(1, os.path.join(os.path.dirname(__file__), ".."))
 
+from api_cache import ResponseCache  # noqa: E402
 from auth import SpotifyAuthenticator  # noqa: E402
-from data_storage import SpotifyDataManager  # noqa: E402
+from data_storage import (  # noqa: E402
+    DataStorageConfig,
+    ListeningHistory,
+    SpotifyDataManager,
+    User,
+)
+from historical_stats import HistoricalStatsAnalyzer  # noqa: E402
 from live_stats import CurrentTrack, LiveStatsCollector  # noqa: E402
-from utils import format_duration, format_number, get_mood_from_features  # noqa: E402
+from rate_limit import RateLimitedAdapter  # noqa: E402
+from utils import (  # noqa: E402
+    calculate_entropy,
+    format_duration,
+    format_number,
+    get_mood_from_features,
+    validate_spotify_id,
+)
 
 
 class TestUtils(unittest.TestCase):
@@ -21,30 +42,52 @@ class TestUtils(unittest.TestCase):
 
     def test_format_duration(self):
         """Test duration formatting."""
-        self.assertEqual(format_duration(245000), "4:05")
-        self.assertEqual(format_duration(3661000), "1:01:01")
-        self.assertEqual(format_duration(None), "0:00")
-        self.assertEqual(format_duration(0), "0:00")
+        cases = [(245000, "4:05"), (3661000, "1:01:01"), (None, "0:00"), (0, "0:00")]
+        for milliseconds, expected in cases:
+            with self.subTest(milliseconds=milliseconds):
+                self.assertEqual(format_duration(milliseconds), expected)
 
     def test_format_number(self):
         """Test number formatting."""
-        self.assertEqual(format_number(1500), "1.5K")
-        self.assertEqual(format_number(1500000), "1.5M")
-        self.assertEqual(format_number(500), "500")
-        self.assertEqual(format_number(None), "0")
+        cases = [(1500, "1.5K"), (1500000, "1.5M"), (500, "500"), (None, "0")]
+        for number, expected in cases:
+            with self.subTest(number=number):
+                self.assertEqual(format_number(number), expected)
+
+    def test_calculate_entropy(self):
+        """Test Shannon entropy calculation."""
+        self.assertEqual(calculate_entropy([]), 0.0)
+        self.assertEqual(calculate_entropy([0, 0]), 0.0)
+        self.assertEqual(calculate_entropy([7]), 0.0)
+        self.assertAlmostEqual(calculate_entropy([1, 1]), 1.0)
+        self.assertAlmostEqual(calculate_entropy([2, 1, 1, 0]), 1.5)
 
     def test_get_mood_from_features(self):
         """Test mood detection from audio features."""
-        # High energy, high valence
-        features = {"energy": 0.8, "valence": 0.8, "danceability": 0.5}
-        self.assertEqual(get_mood_from_features(features), "Energetic & Happy")
-
-        # Low energy, low valence
-        features = {"energy": 0.2, "valence": 0.2, "danceability": 0.5}
-        self.assertEqual(get_mood_from_features(features), "Calm & Melancholic")
-
-        # Empty features
-        self.assertEqual(get_mood_from_features({}), "Unknown")
+        cases = [
+            # High energy, high valence
+            (
+                {"energy": 0.8, "valence": 0.8, "danceability": 0.5},
+                "Energetic & Happy",
+            ),
+            # Low energy, low valence
+            (
+                {"energy": 0.2, "valence": 0.2, "danceability": 0.5},
+                "Calm & Melancholic",
+            ),
+            # Empty features
+            ({}, "Unknown"),
+        ]
+        for features, expected in cases:
+            with self.subTest(features=features):
+                self.assertEqual(get_mood_from_features(features), expected)
+
+    def test_validate_spotify_id(self):
+        """Test Spotify ID validation."""
+        self.assertTrue(validate_spotify_id("4uLU6hMCjMI75M1A2tKUQC"))
+        self.assertFalse(validate_spotify_id("4uLU6hMCjMI75M1A2tKUQé"))
+        self.assertFalse(validate_spotify_id("4uLU6hMCjMI75M1A2tKUQ"))
+        self.assertFalse(validate_spotify_id(None))
 
 
 class TestCurrentTrack(unittest.TestCase):
@@ -52,27 +95,26 @@ class TestCurrentTrack(unittest.TestCase):
 
     def test_current_track_creation(self):
         """Test creating a CurrentTrack instance."""
-        track = CurrentTrack(
-            track_name="Test Song",
-            artist_names=["Test Artist"],
-            album_name="Test Album",
-            duration_ms=180000,
-            progress_ms=90000,
-            is_playing=True,
-            track_id="test123",
-            artist_ids=["artist123"],
-            album_id="album123",
-            popularity=75,
-            explicit=False,
-            external_urls={"spotify": "https://open.spotify.com/track/test123"},
-            preview_url="https://preview.url",
-            timestamp="2023-01-01T00:00:00Z",
-        )
-
-        self.assertEqual(track.track_name, "Test Song")
-        self.assertEqual(track.artist_names, ["Test Artist"])
-        self.assertTrue(track.is_playing)
-        self.assertEqual(track.popularity, 75)
+        expected = {
+            "track_name": "Test Song",
+            "artist_names": ["Test Artist"],
+            "album_name": "Test Album",
+            "duration_ms": 180000,
+            "progress_ms": 90000,
+            "is_playing": True,
+            "track_id": "test123",
+            "artist_ids": ["artist123"],
+            "album_id": "album123",
+            "popularity": 75,
+            "explicit": False,
+            "external_urls": {"spotify": "https://open.spotify.com/track/test123"},
+            "preview_url": "https://preview.url",
+            "timestamp": "2023-01-01T00:00:00Z",
+        }
+
+        track = CurrentTrack(**expected)
+
+        self.assertEqual(track.to_dict(), expected)
 
 
 class TestSpotifyAuthenticator(unittest.TestCase):
@@ -96,28 +138,175 @@ class TestSpotifyAuthenticator(unittest.TestCase):
             with self.assertRaises(ValueError):
                 SpotifyAuthenticator()
 
+    def test_revoke_token_clears_response_cache(self):
+        """Test that revoking the token drops the previous account's API responses."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with patch.dict(
+                os.environ,
+                {
+                    "SPOTIFY_CLIENT_ID": "test_id",
+                    "SPOTIFY_CLIENT_SECRET": "test_secret",
+                    "CACHE_DIR": cache_dir,
+                },
+            ):
+                cache = ResponseCache()
+                cache.set("top_tracks:short_term:10", {"items": []}, ttl=60)
+
+                auth = SpotifyAuthenticator(os.path.join(cache_dir, ".token"))
+                auth.revoke_token()
+
+                self.assertIsNone(cache.get("top_tracks:short_term:10"))
 
-class TestLiveStatsCollector(unittest.TestCase):
+
+class MockSpotifyMixin:
+    """Give each test a collector around a mocked Spotify client."""
+
+    def setUp(self):
+        """Create the mocked Spotify client and its collector."""
+        super().setUp()
+        self.mock_spotify = Mock()
+        self.collector = LiveStatsCollector(self.mock_spotify)
+
+
+class TestLiveStatsCollector(MockSpotifyMixin, unittest.TestCase):
     """Test live stats collection."""
 
-    @patch("live_stats.SpotifyAuthenticator")
-    def test_collector_initialization(self, mock_auth):
+    def test_collector_initialization(self):
         """Test collector initialization."""
-        mock_spotify = Mock()
-        collector = LiveStatsCollector(mock_spotify)
-        self.assertEqual(collector.spotify, mock_spotify)
+        self.assertEqual(self.collector.spotify, self.mock_spotify)
 
-    @patch("live_stats.SpotifyAuthenticator")
-    def test_get_current_track_no_playback(self, mock_auth):
+    def test_get_current_track_no_playback(self):
         """Test getting current track when nothing is playing."""
-        mock_spotify = Mock()
-        mock_spotify.current_playback.return_value = None
+        self.mock_spotify.current_playback.return_value = None
 
-        collector = LiveStatsCollector(mock_spotify)
-        result = collector.get_current_track()
+        result = self.collector.get_current_track()
 
         self.assertIsNone(result)
 
+    def test_top_tracks_reuses_cached_response(self):
+        """Test that top tracks are served from the response cache."""
+        self.mock_spotify.current_user_top_tracks.return_value = {"items": []}
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            collector = LiveStatsCollector(
+                self.mock_spotify, cache=ResponseCache(cache_dir)
+            )
+            collector.get_top_tracks("short_term", 10)
+            collector.get_top_tracks("short_term", 10)
+
+        self.mock_spotify.current_user_top_tracks.assert_called_once()
+
+    def test_get_tracks_bulk_batches_ids(self):
+        """Test that track lookups are sent in batches of 50 IDs."""
+        self.mock_spotify.tracks.side_effect = lambda ids: {
+            "tracks": [{"id": track_id} for track_id in ids]
+        }
+        track_ids = [f"track{i}" for i in range(120)]
+
+        tracks = self.collector.get_tracks_bulk(track_ids)
+
+        self.assertEqual(self.mock_spotify.tracks.call_count, 3)
+        self.assertEqual([track["id"] for track in tracks], track_ids)
+
+    def test_recently_played_reused_until_track_changes(self):
+        """Test that recently played responses are cached until a new track starts."""
+        recently_played = self.mock_spotify.current_user_recently_played
+        recently_played.return_value = {"items": []}
+
+        self.collector.get_recently_played(10)
+        self.collector.get_recently_played(10)
+        self.assertEqual(recently_played.call_count, 1)
+
+        self.collector._note_current_track("new_track")
+        self.collector.get_recently_played(10)
+        self.assertEqual(recently_played.call_count, 2)
+
+    def test_recently_played_fetched_during_track_change_is_not_reused(self):
+        """Test that a response in flight when the track changes isn't cached."""
+        recently_played = self.mock_spotify.current_user_recently_played
+
+        def fetch_while_track_changes(limit):
+            self.collector._note_current_track("next_track")
+            return {"items": []}
+
+        recently_played.side_effect = fetch_while_track_changes
+        self.collector.get_recently_played(10)
+
+        recently_played.side_effect = None
+        recently_played.return_value = {"items": []}
+        self.collector.get_recently_played(10)
+        self.collector.get_recently_played(10)
+
+        self.assertEqual(recently_played.call_count, 2)
+
+    def test_next_poll_delay_wakes_at_track_end(self):
+        """Test that monitoring extrapolates progress and polls at track end."""
+        track = CurrentTrack(
+            track_name="Test Song",
+            artist_names=["Test Artist"],
+            album_name="Test Album",
+            duration_ms=180000,
+            progress_ms=178000,
+            is_playing=True,
+            track_id="test123",
+            artist_ids=["artist123"],
+            album_id="album123",
+            popularity=75,
+            explicit=False,
+            external_urls={},
+            preview_url=None,
+            timestamp="2023-01-01T00:00:00Z",
+        )
+
+        self.assertEqual(LiveStatsCollector._next_poll_delay(track, 5), 2.5)
+        self.assertEqual(LiveStatsCollector._next_poll_delay(None, 5), 5)
+
+        estimate = LiveStatsCollector._extrapolate_current_track(track, 1.5)
+        self.assertEqual(estimate.progress_ms, 179500)
+        self.assertIsNone(LiveStatsCollector._extrapolate_current_track(track, 3))
+
+
+class TestRateLimitedAdapter(unittest.TestCase):
+    """Test client-side rate limiting."""
+
+    @patch("rate_limit.time.sleep")
+    @patch("rate_limit.HTTPAdapter.send")
+    def test_retries_after_429(self, mock_send, mock_sleep):
+        """Test that a 429 response is retried after Retry-After."""
+        throttled = Mock(status_code=429, headers={"Retry-After": "2"})
+        ok = Mock(status_code=200, headers={})
+        mock_send.side_effect = [throttled, ok]
+
+        adapter = RateLimitedAdapter(max_concurrency=4)
+        response = adapter.send(Mock())
+
+        self.assertIs(response, ok)
+        mock_sleep.assert_called_once_with(2.0)
+        throttled.close.assert_called_once()
+        # Halved on the 429, then increased again on success
+        self.assertEqual(adapter.concurrency, 2.5)
+
+    @patch("rate_limit.HTTPAdapter.send")
+    def test_revalidates_with_etag(self, mock_send):
+        """Test that a 304 response is answered from the cached body."""
+        fresh = requests.Response()
+        fresh.status_code = 200
+        fresh.headers["ETag"] = '"v1"'
+        fresh._content = b'{"items": []}'
+        not_modified = requests.Response()
+        not_modified.status_code = 304
+        mock_send.side_effect = [fresh, not_modified]
+
+        adapter = RateLimitedAdapter()
+        url = "https://api.spotify.com/v1/me/top/tracks"
+        adapter.send(requests.Request("GET", url).prepare())
+        request = requests.Request("GET", url).prepare()
+        response = adapter.send(request)
+
+        self.assertEqual(request.headers["If-None-Match"], '"v1"')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"items": []})
+
 
 class TestSpotifyDataManager(unittest.TestCase):
     """Test data storage manager."""
@@ -132,7 +321,157 @@ class TestSpotifyDataManager(unittest.TestCase):
             mock_create_engine.assert_called_once()
 
 
-class TestIntegration(unittest.TestCase):
+class TestSpotifyDataManagerStorage(unittest.TestCase):
+    """Test data storage against an in-memory SQLite database."""
+
+    def setUp(self):
+        """Create a data manager with its files in a temporary directory."""
+        data_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(data_dir.cleanup)
+        self.manager = SpotifyDataManager(
+            DataStorageConfig(
+                database_url="sqlite:///:memory:",
+                backup_dir=data_dir.name,
+                export_dir=data_dir.name,
+            )
+        )
+        self.manager.store_user_info({"id": "user1", "display_name": "Test User"})
+
+    def count_plays(self):
+        """Return the number of stored listening events."""
+        with self.manager._session() as session:
+            return session.query(ListeningHistory).count()
+
+    def test_store_listening_history_skips_duplicate_plays(self):
+        """Test that plays are deduplicated within a batch and against stored rows."""
+        first = {"track_id": "track1", "played_at": "2024-01-01T10:00:00.000Z"}
+        second = {"track_id": "track2", "played_at": "2024-01-01T10:05:00.000Z"}
+
+        self.assertTrue(
+            self.manager.store_listening_history("user1", [first, first, second])
+        )
+        self.assertEqual(self.count_plays(), 2)
+
+        self.manager.store_listening_history("user1", [second])
+        self.assertEqual(self.count_plays(), 2)
+
+    def test_store_user_info_keeps_fields_missing_from_update(self):
+        """Test that null fields from the API don't overwrite stored ones."""
+        self.manager.store_user_info(
+            {"id": "user1", "display_name": None, "followers": {"total": 5}}
+        )
+
+        with self.manager._session() as session:
+            user = session.get(User, "user1")
+
+        self.assertEqual(user.display_name, "Test User")
+        self.assertEqual(user.followers, 5)
+
+    def test_cleanup_old_data_deletes_in_batches(self):
+        """Test that cleanup removes every expired row across several batches."""
+        self.manager.store_listening_history(
+            "user1",
+            [
+                {"track_id": f"track{i}", "played_at": f"2024-01-01T10:0{i}:00Z"}
+                for i in range(5)
+            ],
+        )
+        with self.manager._session() as session:
+            session.query(ListeningHistory).filter(
+                ListeningHistory.track_id != "track4"
+            ).update({"created_at": datetime.utcnow() - timedelta(days=400)})
+
+        with patch("data_storage.CLEANUP_BATCH_SIZE", 2), patch("builtins.print"):
+            self.assertTrue(self.manager.cleanup_old_data(days_to_keep=365))
+
+        self.assertEqual(self.count_plays(), 1)
+
+    def test_transaction_rolls_back_on_error(self):
+        """Test that a failing transaction stores none of its writes."""
+        with self.assertRaises(RuntimeError):
+            with self.manager.transaction() as session:
+                self.manager.store_listening_history(
+                    "user1",
+                    [{"track_id": "track1", "played_at": "2024-01-01T10:00:00Z"}],
+                    session=session,
+                )
+                raise RuntimeError("abort")
+
+        self.assertEqual(self.count_plays(), 0)
+
+    def test_export_user_data_writes_valid_json(self):
+        """Test that the streamed export is a complete JSON document."""
+        self.manager.store_listening_history(
+            "user1",
+            [
+                {"track_id": "track1", "played_at": "2024-01-01T10:00:00Z"},
+                {"track_id": "track2", "played_at": "2024-01-01T10:05:00Z"},
+            ],
+        )
+
+        export_path = self.manager.export_user_data("user1")
+
+        with open(export_path, encoding="utf-8") as f:
+            exported = json.load(f)
+        self.assertEqual(exported["user_info"]["display_name"], "Test User")
+        self.assertEqual(len(exported["listening_history"]), 2)
+        self.assertEqual(exported["top_items"], [])
+
+
+class TestHistoricalStatsAnalyzer(unittest.TestCase):
+    """Test historical listening analysis."""
+
+    def test_artist_evolution_categories(self):
+        """Test that each artist lands in at most one evolution category."""
+
+        def ranks(*artist_ids):
+            artists = [
+                {"artist_id": artist_id, "artist_name": artist_id.title(), "rank": rank}
+                for rank, artist_id in enumerate(artist_ids, 1)
+            ]
+            return {"artists": artists}
+
+        all_data = {
+            "time_ranges": {
+                "long_term": ranks("stable", "faded", "fading"),
+                "medium_term": ranks("stable", "climber"),
+                "short_term": ranks("climber", "new", "stable", "fading"),
+            }
+        }
+        analyzer = HistoricalStatsAnalyzer(Mock())
+
+        evolution = analyzer._analyze_artist_evolution(all_data)
+
+        def ids(category):
+            return [artist["id"] for artist in evolution[category]]
+
+        self.assertEqual(ids("stable_favorites"), ["stable"])
+        self.assertEqual(ids("new_discoveries"), ["new"])
+        self.assertEqual(ids("rising_artists"), ["climber"])
+        self.assertEqual(ids("declining_artists"), ["fading"])
+        self.assertEqual(evolution["rising_artists"][0]["rank_change"], 1)
+        self.assertEqual(evolution["declining_artists"][0]["rank_change"], -1)
+
+
+class TestCommandLine(unittest.TestCase):
+    """Test the click command line interface."""
+
+    def test_auth_error_inside_spinner_exits_non_zero(self):
+        """Test that authentication errors reach handle_auth_error."""
+        from click.testing import CliRunner
+
+        import spoticron
+
+        auth_error = spoticron._backend("auth").SpotifyAuthError("Failed")
+        with patch.object(spoticron, "_get_collector", side_effect=auth_error):
+            result = CliRunner().invoke(spoticron.cli, ["recent"])
+
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn("Authentication failed", result.output)
+        self.assertNotIn("Error getting recent tracks", result.output)
+
+
+class TestIntegration(MockSpotifyMixin, unittest.TestCase):
     """Integration tests."""
 
     def test_modules_import(self):
@@ -150,34 +489,9 @@ class TestIntegration(unittest.TestCase):
         """Test basic data flow between modules."""
         # This would be a more comprehensive test in a real scenario
         # For now, just test that classes can be instantiated
-        with patch.dict(
-            os.environ,
-            {"SPOTIFY_CLIENT_ID": "test_id", "SPOTIFY_CLIENT_SECRET": "test_secret"},
-        ):
-            try:
-                # Test that we can create instances without errors
-                mock_spotify = Mock()
-                collector = LiveStatsCollector(mock_spotify)
-                self.assertIsNotNone(collector)
-            except Exception as e:
-                self.fail(f"Data flow test failed: {e}")
+        self.assertIsNotNone(self.collector)
+        self.assertIs(self.collector.spotify, self.mock_spotify)
 
 
 if __name__ == "__main__":
-    # Create test suite
-    test_suite = unittest.TestSuite()
-
-    # Add test cases
-    test_suite.addTest(unittest.makeSuite(TestUtils))
-    test_suite.addTest(unittest.makeSuite(TestCurrentTrack))
-    test_suite.addTest(unittest.makeSuite(TestSpotifyAuthenticator))
-    test_suite.addTest(unittest.makeSuite(TestLiveStatsCollector))
-    test_suite.addTest(unittest.makeSuite(TestSpotifyDataManager))
-    test_suite.addTest(unittest.makeSuite(TestIntegration))
-
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(test_suite)
-
-    # Exit with error code if tests failed
-    sys.exit(0 if result.wasSuccessful() else 1)
+    unittest.main(verbosity=2)